@@ -8,51 +8,188 @@ An accession is complete if it contains a preservation log (preservation_log.txt
 Accessions may be incomplete because they were created prior to current procedures
 or because file path lengths or other errors prevent current procedures from being done.
 
-Parameter:
+The optional deep checks also test if the preservation files agree with each other, using only file listings
+and reading the manifests and risk csv one part at a time, without calculating checksums:
+ the initial manifest has the same number of files as the bag, the risk csv has every file in the bag,
+ and the bag tag files (bagit.txt, bag-info.txt, and manifests) are present and can be read.
+
+Parameters:
     input_directory (required): the directory with the folders to be summarized,
                                 which should be the parent folder of the status (backlogged and/or closed) folders
+    deep (optional): include the word deep to also do the deep checks
 
 Returns:
     accession_completeness_report_YYYY-MM-DD.csv, saved in input_directory
+    accession_deep_check_report_YYYY-MM-DD.csv, saved in input_directory, if deep is included and there are errors
+    If there is a catalog (see hub_catalog.py), the result for every accession is added to it
 """
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import date
+import numpy as np
 import os
+import pandas as pd
+import re
 import sys
+from hub_catalog import catalog_time, save_catalog_rows
+from hub_inventory import load_inventory, read_bag_info, read_log_ends
+from risk_update import most_recent_risk_csv, read_risk_columns
+
+# Number of rows of a manifest or risk csv read at a time by the deep checks,
+# so the memory used does not depend on the size of the accession.
+DEEP_CHUNK_ROWS = 100000
 
+# Number of accessions to check at the same time.
+# Checking an accession is mostly waiting on the network share, so this can be more than the number of CPUs.
+WORKERS = 8
 
-def accession_paths(coll_path):
-    """Find the paths for the accession folder(s) in a collection folder
 
-    The collection folder also contains other folders and files.
+def accession_folder(folder_name):
+    """Determine if a folder in a collection folder has accession content, based on the folder name
+
+    Non-accession folders that may be sibling folders of accessions are skipped.
 
     @:parameter
-    coll_path (string): path to the collection folder
+    folder_name (string): the name of a folder within a collection folder
 
     @:returns
-    acc_paths (list): a list of paths to the folders with the accession content
+    Boolean: True if it has accession content and False if not
     """
+    skip = ['access copies', 'final appraisal (deduped)', 'first rnd appraisal (not deduped)', 'to ingest']
+    skip_prefix = ('aip', 'appraisal', 'appraised', 'arranged', 'inventories', 'risk')
+    name = folder_name.lower()
+    if name in skip or name.startswith(skip_prefix) or name.endswith(('_fits', '_metadata')):
+        return False
+    return True
+
+
+def bag_manifest(bag_path):
+    """Read the payload manifest of a bag one row at a time, keeping a hash of each file path instead of the path
+
+    The paths are lowercase and relative to the bag data folder, the same as the paths from risk_csv_hashes().
+
+    @:parameter
+    bag_path (string): the path to the bag folder
 
-    # Variable for the function output.
-    acc_paths = []
+    @:returns
+    manifest_name (string, None): the name of the manifest, or None if the bag does not have a payload manifest
+    path_hashes (numpy array): a hash of the path of every file in the manifest, without duplicates
+    row_count (integer): the number of files in the manifest
+    error_count (integer): the number of rows that are not formatted "checksum  data/path"
+    """
+    # Uses the MD5 manifest, which is what bags on Hub have, or the first manifest with another algorithm.
+    manifest_names = sorted(name for name in os.listdir(bag_path)
+                            if name.startswith('manifest-') and name.endswith('.txt'))
+    if len(manifest_names) == 0:
+        return None, np.array([], dtype=np.uint64), 0, 0
+    manifest_name = 'manifest-md5.txt' if 'manifest-md5.txt' in manifest_names else manifest_names[0]
+
+    # Reads each row, skipping blank rows, and hashes the paths DEEP_CHUNK_ROWS at a time.
+    hash_list = [np.array([], dtype=np.uint64)]
+    paths = []
+    row_count = 0
+    error_count = 0
+    with open(os.path.join(bag_path, manifest_name), encoding='utf-8', errors='replace') as manifest:
+        for line in manifest:
+            if not line.strip():
+                continue
+            row = line.rstrip('\r\n').split(None, 1)
+            if len(row) != 2 or not row[1].startswith('data/'):
+                error_count += 1
+                continue
+            row_count += 1
+            paths.append(row[1][len('data/'):].lower())
+            if len(paths) == DEEP_CHUNK_ROWS:
+                hash_list.append(pd.util.hash_array(np.array(paths, dtype=object), categorize=False))
+                paths = []
+    hash_list.append(pd.util.hash_array(np.array(paths, dtype=object), categorize=False))
+    path_hashes = np.unique(np.concatenate(hash_list))
+    return manifest_name, path_hashes, row_count, error_count
+
+
+def check_accessions(inventory_df, workers=1, deep=False):
+    """Check the completeness of every folder with accession content in the inventory, in a consistent order
+
+    With more than one worker, that many accessions are checked at the same time by threads,
+    and the results are still returned in the same order as with one worker, so the report is the same.
 
-    # Navigates the collection folder looking for the folders with the accession content.
-    for acc in os.listdir(coll_path):
+    @:parameter
+    inventory_df (Pandas dataframe): the Hub inventory, from load_inventory()
+    workers (integer): the number of accessions to check at the same time
+    deep (Boolean): if True, also does the deep checks
 
-        # Skips anything that is a file instead of a folder.
-        if os.path.isfile(os.path.join(coll_path, acc)):
-            continue
+    @:returns
+    Generator with the inventory row (named tuple), the dictionary from check_completeness(),
+    and the dictionary from check_deep() or None if deep is False, for each accession
+    """
+    # Skips folders without accession content.
+    folders = [folder for folder in inventory_df.itertuples() if accession_folder(folder.Accession)]
 
-        # Skips non-accession folders that may be sibling folders of accessions.
-        skip = ['access copies', 'final appraisal (deduped)', 'first rnd appraisal (not deduped)', 'to ingest']
-        skip_prefix = ('aip', 'appraisal', 'appraised', 'arranged', 'inventories', 'risk')
-        if acc.lower() in skip or acc.lower().startswith(skip_prefix) or acc.lower().endswith(('_fits', '_metadata')):
-            continue
+    def check_folder(folder):
+        return check_completeness(folder.Path), check_deep(folder.Path) if deep else None
 
-        # Accession folder is directly inside the collection folder.
-        acc_paths.append(os.path.join(coll_path, acc))
+    # map() returns the results in the order of the folders list, as soon as each one and every one before it is done.
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for folder, (result, deep_result) in zip(folders, executor.map(check_folder, folders)):
+                yield folder, result, deep_result
+    else:
+        for folder in folders:
+            yield (folder,) + check_folder(folder)
 
-    return acc_paths
+
+def check_bag_tags(bag_path, bag_info, manifest):
+    """Check the bag tag files are present and can be read, and the payload manifest has every file in the bag
+
+    Tag manifests are optional, but if there is one, every file it lists must be in the bag.
+
+    @:parameter
+    bag_path (string): the path to the bag folder
+    bag_info (dictionary): the fields in bag-info.txt, from read_bag_info()
+    manifest (tuple): the manifest name, path hashes, row count, and error count, from bag_manifest()
+
+    @:returns
+    error_msg (string, None): error message or None if no error
+    """
+    error_list = []
+
+    # bagit.txt must have the BagIt version and the encoding of the tag files.
+    if not os.path.exists(os.path.join(bag_path, 'bagit.txt')):
+        error_list.append('No bagit.txt')
+    elif not {'BagIt-Version', 'Tag-File-Character-Encoding'} <= read_bag_info(bag_path, 'bagit.txt').keys():
+        error_list.append('Nonstandard bagit.txt')
+
+    # bag-info.txt must have the Payload-Oxum, which is used for the size of the accession.
+    file_count = payload_file_count(bag_info)
+    if not os.path.exists(os.path.join(bag_path, 'bag-info.txt')):
+        error_list.append('No bag-info.txt')
+    elif file_count is None:
+        error_list.append('No Payload-Oxum')
+
+    # The payload manifest must have a checksum and path on every row and the number of files in the Payload-Oxum.
+    manifest_name, path_hashes, row_count, error_count = manifest
+    if manifest_name is None:
+        error_list.append('No payload manifest')
+    else:
+        if error_count > 0:
+            error_list.append(f'{manifest_name} has {error_count} rows that cannot be read')
+        if file_count is not None and row_count != file_count:
+            error_list.append(f'{manifest_name} has {row_count} files and Payload-Oxum has {file_count}')
+
+    # Every row of a tag manifest must have a checksum and the name of a tag file that is in the bag.
+    for tag_manifest in sorted(name for name in os.listdir(bag_path) if name.startswith('tagmanifest-')):
+        with open(os.path.join(bag_path, tag_manifest), encoding='utf-8', errors='replace') as open_tags:
+            rows = [line.split(None, 1) for line in open_tags if line.strip()]
+        missing = [row for row in rows if len(row) != 2 or not os.path.exists(os.path.join(bag_path, row[1].strip()))]
+        if len(missing) > 0:
+            error_list.append(f'{tag_manifest} has {len(missing)} files not in the bag')
+
+    # Format the errors into a string, or return None if there are no errors.
+    if len(error_list) == 0:
+        return None
+    else:
+        error_msg = ', '.join(error_list)
+        return error_msg
 
 
 def check_completeness(acc_path):
@@ -99,6 +236,74 @@ def check_completeness(acc_path):
     return result
 
 
+def check_deep(acc_path):
+    """Test if the initial manifest, risk csv, and bag of an accession agree with each other
+
+    Uses only the accession folder listing and the bag tag files, and reads the bag manifest, initial manifest,
+    and risk csv one part at a time, so it is fast and the memory used does not depend on the size of the accession.
+    Nothing is checked for an accession without a bag, and a check is skipped if the file it needs is missing,
+    since those are already in the completeness report.
+    The risk csv is not compared to a zipped bag, since the files in the risk csv are in the zip.
+
+    @:parameter
+    acc_path (string): the full path to the accession folder
+
+    @:returns
+    result (dictionary): keys are 'manifest_count', 'risk_coverage', and 'bag_tags'
+                         and values are an error message or None if there is no error or it was not checked
+    """
+    result = {'manifest_count': None, 'risk_coverage': None, 'bag_tags': None}
+
+    # Finds the bag, which is required for every check.
+    acc = os.path.basename(acc_path)
+    items = os.listdir(acc_path)
+    bag_name = next((name for name in (f'{acc}_bag', f'{acc}_zipped_bag') if name in items), None)
+    if bag_name is None:
+        return result
+
+    # Reads the bag information and manifest once, which are used by every check.
+    bag_path = os.path.join(acc_path, bag_name)
+    bag_info = read_bag_info(bag_path)
+    manifest = bag_manifest(bag_path)
+    result['bag_tags'] = check_bag_tags(bag_path, bag_info, manifest)
+
+    # Initial manifest includes the date between initialmanifest_ and the file extension. Uses the most recent one.
+    manifest_names = sorted(item for item in items if item.startswith('initialmanifest_') and item.endswith('.csv'))
+    file_count = payload_file_count(bag_info)
+    if len(manifest_names) > 0 and file_count is not None:
+        result['manifest_count'] = check_manifest_count(os.path.join(acc_path, manifest_names[-1]), file_count)
+
+    # Risk csv may have a date between full_risk_data and the file extension. Uses the most recent one.
+    risk_csv = most_recent_risk_csv(items)
+    if risk_csv and bag_name == f'{acc}_bag':
+        result['risk_coverage'] = check_risk_coverage(os.path.join(acc_path, risk_csv), acc, manifest[1])
+
+    return result
+
+
+def check_manifest_count(manifest_path, file_count):
+    """Check the initial manifest has the same number of files as the bag
+
+    The initial manifest is read one row at a time, so the memory used is the same for any size manifest.
+
+    @:parameter
+    manifest_path (string): path to the initial manifest
+    file_count (integer): the number of files in the bag, from the Payload-Oxum
+
+    @:returns
+    error_msg (string, None): error message or None if no error
+    """
+    # Counts the rows with a file path, skipping the header row.
+    with open(manifest_path, newline='', encoding='utf-8', errors='replace') as manifest:
+        manifest_reader = csv.reader(manifest)
+        next(manifest_reader, None)
+        manifest_count = sum(1 for row in manifest_reader if row and row[0].strip())
+
+    if manifest_count != file_count:
+        return f'Initial manifest has {manifest_count} files and bag has {file_count}'
+    return None
+
+
 def check_preservation_log(log_path):
     """Check the columns and for blank rows that cause errors when automatically adding to a preservation log
 
@@ -109,16 +314,16 @@ def check_preservation_log(log_path):
     error_msg (string, None): error message or None if no error
     """
     # Find the errors.
+    # Only the first and last row are read, so this is fast even for very long logs.
     error_list = []
     try:
-        with open(log_path, 'r') as open_log:
-            log_lines = open_log.readlines()
-            # First row should match the standard header.
-            if not log_lines[0] == 'Collection\tAccession\tDate\tMedia Identifier\tAction\tStaff\n':
-                error_list.append('Nonstandard columns')
-            # Last row should have values and not just be blank.
-            if log_lines[-1] == '\n':
-                error_list.append('Extra blank row(s) at end')
+        first_row, last_row = read_log_ends(log_path)
+        # First row should match the standard header.
+        if not first_row == 'Collection\tAccession\tDate\tMedia Identifier\tAction\tStaff\n':
+            error_list.append('Nonstandard columns')
+        # Last row should have values and not just be blank.
+        if last_row == '\n':
+            error_list.append('Extra blank row(s) at end')
     except UnicodeDecodeError:
         error_list.append('Script cannot read log')
 
@@ -130,6 +335,106 @@ def check_preservation_log(log_path):
         return error_msg
 
 
+def check_risk_coverage(risk_csv_path, acc, path_hashes):
+    """Check the risk csv has every file in the bag
+
+    @:parameter
+    risk_csv_path (string): path to the most recent risk csv in the accession folder
+    acc (string): the accession number, which is the name of the accession folder
+    path_hashes (numpy array): a hash of the path of every file in the bag, from bag_manifest()
+
+    @:returns
+    error_msg (string, None): error message or None if no error
+    """
+    # Reads the risk csv paths. A risk csv without the FITS_File_Path column (KeyError)
+    # or that is empty or cannot be decoded (ValueError) cannot be compared to the bag.
+    try:
+        risk_hashes = risk_csv_hashes(risk_csv_path, acc)
+    except (KeyError, ValueError):
+        return 'Cannot read risk csv'
+
+    # Finds the hashes of bag files that are not hashes of any path in the risk csv.
+    missing = np.setdiff1d(path_hashes, risk_hashes, assume_unique=True).size
+    if missing > 0:
+        return f'{missing} of {path_hashes.size} bag files not in risk csv'
+    return None
+
+
+def payload_file_count(bag_info):
+    """Get the number of files in a bag from the Payload-Oxum, which is formatted 'bytes.file_count'
+
+    @:parameter
+    bag_info (dictionary): the fields in bag-info.txt, from read_bag_info()
+
+    @:returns
+    file_count (integer, None): the number of files, or None if there is no Payload-Oxum or it is formatted wrong
+    """
+    payload_oxum = bag_info.get('Payload-Oxum', '')
+    if not re.fullmatch(r'[0-9]+\.[0-9]+', payload_oxum):
+        return None
+    file_count = int(payload_oxum.split('.')[1])
+    return file_count
+
+
+def risk_csv_hashes(risk_csv_path, acc):
+    """Read the file paths in a risk csv DEEP_CHUNK_ROWS at a time, keeping a hash of each path instead of the path
+
+    The paths are lowercase and relative to the bag data folder, the same as the paths from bag_manifest().
+    Risk csvs made before the accession was bagged have paths in the accession folder,
+    which are made relative to it instead.
+    Paths that are in neither folder cannot match any file in the bag and are not included.
+
+    @:parameter
+    risk_csv_path (string): path to the most recent risk csv in the accession folder
+    acc (string): the accession number, which is the name of the accession folder
+
+    @:returns
+    path_hashes (numpy array): a hash of every relative path in the risk csv, without duplicates
+    """
+    hash_list = [np.array([], dtype=np.uint64)]
+    for chunk in read_risk_columns(risk_csv_path, ['FITS_File_Path'], chunksize=DEEP_CHUNK_ROWS):
+        # Makes the paths the same format as the bag manifest, which uses / and is compared without case.
+        paths = chunk['FITS_File_Path'].str.replace('\\', '/', regex=False).str.lower()
+        # Gets the part of the path after the last _bag/data/, or if not bagged, after the first accession folder.
+        relative = paths.str.extract(r'.*_bag/data/(.*)', expand=False)
+        relative = relative.where(relative.notna(), paths.str.extract(f'/{re.escape(acc.lower())}/(.*)', expand=False))
+        hash_list.append(pd.util.hash_array(relative.dropna().to_numpy(dtype=object), categorize=False))
+    path_hashes = np.unique(np.concatenate(hash_list))
+    return path_hashes
+
+
+def update_deep_report(report_dir, acc_status, coll, acc_path, result):
+    """Make the deep check report, if it doesn't already exist, and add an accession to the report
+
+    The report is saved in the input_directory.
+
+    @:parameter
+    report_dir (string): path to where to save the report (input_directory)
+    acc_status (string): parent folder of collection folder, either "backlogged" or "closed"
+    coll (string): the name of the collection folder
+    acc_path (string): the full path to the accession folder
+    result (dictionary): output of check_deep()
+
+    @:returns
+    None
+    A row is added to the deep check report
+    """
+
+    # If the report does not already exist, makes a report with a header row.
+    report_path = os.path.join(report_dir, f"accession_deep_check_report_{date.today().strftime('%Y-%m-%d')}.csv")
+    if not os.path.exists(report_path):
+        with open(report_path, 'w', newline='') as report:
+            writer = csv.writer(report)
+            writer.writerow(['Status', 'Collection', 'Accession', 'Initial_Manifest_Count', 'Risk_Coverage',
+                             'Bag_Tags'])
+
+    # Saves the information to the report.
+    with open(report_path, 'a', newline='') as report:
+        writer = csv.writer(report)
+        writer.writerow([acc_status, coll, os.path.basename(acc_path), result['manifest_count'],
+                         result['risk_coverage'], result['bag_tags']])
+
+
 def update_report(report_dir, acc_status, coll, acc_path, result):
     """Make the completeness report, if it doesn't already exist, and add an accession to the report
 
@@ -167,22 +472,31 @@ def update_report(report_dir, acc_status, coll, acc_path, result):
 
 if __name__ == '__main__':
     # Script argument is the parent directory of the status folders.
+    # The optional second argument "deep" also does the deep checks.
     input_directory = sys.argv[1]
+    deep_check = len(sys.argv) > 2 and sys.argv[2].lower() == 'deep'
 
     # First level within the input_directory is folders named with the status (backlogged and/or closed),
     # as well as additional folders and files that are not part of this analysis.
-    for status in os.listdir(input_directory):
-        if status == 'backlogged' or status == 'closed':
-            # All folders within the status folders should be collections.
-            # Gets a list of the path to every folder with accession content and tests their completeness.
-            for collection in os.listdir(os.path.join(input_directory, status)):
-                accession_list = accession_paths(os.path.join(input_directory, status, collection))
-                for accession_path in accession_list:
-                    print('Starting on accession', accession_path)
-                    completeness_dict = check_completeness(accession_path)
-                    # If any of the criteria are missing, saves the information to the report.
-                    if False in completeness_dict.values():
-                        update_report(input_directory, status, collection, accession_path, completeness_dict)
+    # All folders within the status folders should be collections.
+    # Gets the path to every folder with accession content from the Hub inventory (see hub_inventory.py),
+    # which is made again if there is not a recent one saved in the input_directory, and tests their completeness.
+    # Folders are listed and accessions are checked WORKERS at a time,
+    # and the rows are kept in the same order every time.
+    # The result for every accession is also saved to the catalog, if there is one (see hub_catalog.py).
+    inventory_df = load_inventory(input_directory, workers=WORKERS)
+    checked = catalog_time()
+    catalog_rows = []
+    for folder, completeness_dict, deep_dict in check_accessions(inventory_df, WORKERS, deep_check):
+        print('Starting on accession', folder.Path)
+        catalog_rows.append([folder.Path, checked] + list(completeness_dict.values()))
+        # If any of the criteria are missing, saves the information to the report.
+        if False in completeness_dict.values():
+            update_report(input_directory, folder.Status, folder.Collection, folder.Path, completeness_dict)
+        # If any of the deep checks have an error, saves the information to the deep check report.
+        if deep_dict and any(deep_dict.values()):
+            update_deep_report(input_directory, folder.Status, folder.Collection, folder.Path, deep_dict)
+    save_catalog_rows('completeness', catalog_rows)
 
     # Prints if there were any incomplete accessions (the report was made or not).
     date_today = date.today().strftime('%Y-%m-%d')
@@ -191,3 +505,11 @@ if __name__ == '__main__':
         print(f'\nIncomplete accessions found. See {completeness_report}.')
     else:
         print(f'\nAll accessions are complete.')
+
+    # If the deep checks were done, prints if there were any errors (the report was made or not).
+    if deep_check:
+        deep_report = os.path.join(input_directory, f"accession_deep_check_report_{date_today}.csv")
+        if os.path.exists(deep_report):
+            print(f'Deep check errors found. See {deep_report}.')
+        else:
+            print('No deep check errors found.')
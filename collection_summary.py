@@ -21,17 +21,101 @@ Parameter:
 Returns:
     hub-accession-summary_DATE.csv
     hub-collection-summary_DATE.csv
+    If pyarrow is installed, a Parquet copy of each csv with the same name
+    Cache of the data for each accession, saved in the .hub-monitoring folder of the user's home directory
+    If there is a catalog (see hub_catalog.py), the risk counts for every accession are added to it
 """
 import bagit
-import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 import numpy as np
 import os
 import pandas as pd
 import re
+import sqlite3
 import sys
+from hub_catalog import catalog_time, save_catalog_rows
+from hub_inventory import load_inventory
+from risk_update import read_risk_columns, save_parquet
 from validate_fixity import check_argument
 
+# Columns in the accession report and their data types, in the order of the list from get_accession_data().
+ACCESSION_COLUMNS = {'Accession': object, 'Collection': object, 'Status': object, 'Date': 'int64', 'GB': 'float64',
+                     'Files': 'int64', 'No_Match_Risk': 'int64', 'High_Risk': 'int64', 'Moderate_Risk': 'int64',
+                     'Low_Risk': 'int64', 'Notes': object, 'Size_Error': object}
+
+# Local database with the data for each accession, so accessions that have not changed are not summarized again.
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.hub-monitoring', 'collection_summary_cache.sqlite')
+
+# NARA risk levels counted for each accession, in the order of the risk columns in the accession report.
+RISK_LEVELS = ['No Match', 'High Risk', 'Moderate Risk', 'Low Risk']
+
+# Number of accessions to summarize at the same time.
+# Summarizing an accession is mostly waiting on the network share, so this can be more than the number of CPUs.
+WORKERS = 8
+
+
+def accession_key(acc_path):
+    """Get the information used to tell if an accession has changed since its data was cached
+
+    This is the name, modification time, and size of the most recent risk csv
+    and the modification time of the bag-info.txt file, which has the size of the bag.
+
+    @:parameter
+    acc_path (string): the path to the accession folder
+
+    @:returns
+    key (tuple): risk csv name, risk csv modification time (ns), risk csv size, and bag-info.txt modification time (ns).
+                 The name is an empty string and the times and size are -1 for files that are not present.
+    """
+
+    # Information about the most recent risk csv.
+    accession_file_list = [item for item in os.listdir(acc_path) if os.path.isfile(os.path.join(acc_path, item))]
+    risk_csv_name = most_recent_risk_csv(accession_file_list)
+    if risk_csv_name:
+        risk_stat = os.stat(os.path.join(acc_path, risk_csv_name))
+        risk_key = (risk_csv_name, risk_stat.st_mtime_ns, risk_stat.st_size)
+    else:
+        risk_key = ('', -1, -1)
+
+    # Information about the bag-info.txt file.
+    bag_info_path = os.path.join(acc_path, f'{os.path.basename(acc_path)}_bag', 'bag-info.txt')
+    if os.path.exists(bag_info_path):
+        bag_key = (os.stat(bag_info_path).st_mtime_ns,)
+    else:
+        bag_key = (-1,)
+
+    key = risk_key + bag_key
+    return key
+
+
+def accession_table(rows):
+    """Make a dataframe with the data for every accession, with the data type for each column in ACCESSION_COLUMNS
+
+    The data is gathered into one list per column and then made into a dataframe once,
+    instead of adding rows to the accession report one at a time and reading the report again.
+
+    @:parameter
+    rows (iterable): a list from get_accession_data() for each accession
+
+    @:returns
+    acc_df (Pandas dataframe): the data for every accession, with blank notes and size errors as empty strings
+    """
+
+    # Adds each value in each row to the list for its column.
+    columns = {column: [] for column in ACCESSION_COLUMNS}
+    for row in rows:
+        for column, value in zip(columns, row):
+            columns[column].append(value)
+
+    # Makes the dataframe, with every column the expected data type, even if there are no accessions.
+    # Notes and Size_Error are None if there is nothing to report, which are replaced with empty strings
+    # so the notes for a collection can be combined.
+    acc_df = pd.DataFrame(columns).astype(ACCESSION_COLUMNS)
+    acc_df[['Notes', 'Size_Error']] = acc_df[['Notes', 'Size_Error']].fillna('')
+
+    return acc_df
+
 
 def accession_test(acc_id, acc_path):
     """Determine if a folder is an accession based on the folder name
@@ -67,13 +151,36 @@ def accession_test(acc_id, acc_path):
         return False
 
 
-def combine_collection_data(acc_df):
+def collection_dates_table(dates):
+    """Make the date or date range for every collection from the earliest and latest dates kept while scanning
+
+    @:parameter
+    dates (dictionary): keys are collections and values are a list with the earliest and latest date,
+                        from update_collection_dates()
+
+    @:returns
+    date_df (Pandas dataframe): the date or date range for every collection, columns Collection and Date
+    """
+
+    # Makes a dataframe with the earliest and latest date for each collection, sorted by collection
+    # to match the order from combine_collection_dates().
+    range_df = pd.DataFrame([[coll, earliest, latest] for coll, (earliest, latest) in sorted(dates.items())],
+                            columns=['Collection', 'min', 'max'])
+
+    # Makes the date range (earliest-latest), or a single date if they are the same.
+    date_df = date_range(range_df)
+    return date_df
+
+
+def combine_collection_data(acc_df, date_df=None):
     """Combine data for collections with multiple accessions
 
     If a collection has one accession, the accession data is assigned to the collection as is.
 
     @:parameter
     acc_df (Pandas dataframe): the data for every accession
+    date_df (Pandas dataframe, optional): the date or date range for every collection, if already made
+                                          while the accessions were scanned
 
     @:returns
     coll_df (Pandas dataframe): the data for every collection
@@ -86,7 +193,7 @@ def combine_collection_data(acc_df):
     coll_df = acc_df.groupby(['Collection', 'Status'], as_index=False).sum()
 
     # Rounds the GB to 2 decimal places, or more places if needed to not be 0.
-    coll_df['GB'] = coll_df['GB'].map(round_non_zero)
+    coll_df['GB'] = round_non_zero(coll_df['GB'])
 
     # Resets GB and Files to 0 if there were any accessions with a size error
     # to make it clearer that the size for the collection needs to be calculated manually.
@@ -97,10 +204,11 @@ def combine_collection_data(acc_df):
     except AttributeError:
         pass
 
-    # Combines the dates into a date range and adds to the dataframe.
+    # Combines the dates into a date range and adds to the dataframe, unless date_df was already made.
     # Removes the existing "Date" column, so it doesn't conflict with the new "Date" column made by the function.
     coll_df.drop(['Date'], axis=1, inplace=True)
-    date_df = combine_collection_dates(acc_df)
+    if date_df is None:
+        date_df = combine_collection_dates(acc_df)
     coll_df = pd.merge(date_df, coll_df, on='Collection', how='outer')
 
     return coll_df
@@ -116,29 +224,33 @@ def combine_collection_dates(acc_df):
     date_df (Pandas dataframe): the date or date range for every collection, columns Collection and Date
     """
 
-    # Makes the column "Date", which is a string with the year,
-    # into numbers so the minimum and maximum can be calculated.
-    acc_df['Date'] = pd.to_numeric(acc_df['Date'])
-
-    # Makes a dataframe with the earliest date for each collection.
-    min_df = acc_df.groupby('Collection')['Date'].min().reset_index()
-    min_df = min_df.rename(columns={'Date': 'Earliest_Date'})
-
-    # Makes a dataframe with the latest date for each collection.
-    max_df = acc_df.groupby('Collection')['Date'].max().reset_index()
-    max_df = max_df.rename(columns={'Date': 'Latest_Date'})
-
-    # Combines the two dataframes into one,
-    # making a column "Date" with the date range (earliest-latest), or a single date if they are the same,
-    # and removing the columns no longer needed after "Date" is made.
-    date_df = pd.merge(min_df, max_df, on='Collection', how='outer')
-    conditions = [date_df['Earliest_Date'] != date_df['Latest_Date'],
-                  date_df['Earliest_Date'] == date_df['Latest_Date']]
-    values = [date_df['Earliest_Date'].map(str) + '-' + date_df['Latest_Date'].map(str),
-              date_df['Earliest_Date'].map(str)]
-    date_df['Date'] = np.select(conditions, values)
-    date_df.drop(columns=['Earliest_Date', 'Latest_Date'], axis=1, inplace=True)
+    # Calculates the earliest and latest date for each collection in one pass.
+    # The column "Date" may be a string with the year, so it is made into numbers first.
+    dates = pd.to_numeric(acc_df['Date'])
+    range_df = dates.groupby(acc_df['Collection']).agg(['min', 'max']).reset_index()
 
+    # Makes the date range (earliest-latest), or a single date if they are the same.
+    date_df = date_range(range_df)
+    return date_df
+
+
+def date_range(range_df):
+    """Make the date or date range for each collection from its earliest and latest dates
+
+    @:parameter
+    range_df (Pandas dataframe): columns Collection, min (earliest date) and max (latest date)
+
+    @:returns
+    date_df (Pandas dataframe): the date or date range for every collection, columns Collection and Date
+    """
+
+    # Makes the dates into strings for the whole column at once,
+    # and combines them with a dash only if the earliest and latest date are different.
+    earliest = range_df['min'].astype(int).astype(str)
+    latest = range_df['max'].astype(int).astype(str)
+    date = earliest.where(earliest == latest, earliest + '-' + latest)
+
+    date_df = pd.DataFrame({'Collection': range_df['Collection'], 'Date': date})
     return date_df
 
 
@@ -205,7 +317,8 @@ def get_risk(acc_path):
 
     @:returns
     risk_list (list): a list of 4 integers, with the number of files each risk level, ordered highest-lowest risk
-                      and a note, either None or that the accession has no risk csv
+                      and a note, either None, that the accession has no risk csv,
+                      or the number of files with unexpected risk levels
     """
 
     # Uses a function from risk_update.py (also in this repo) to get the name of the most recent risk csv.
@@ -217,33 +330,43 @@ def get_risk(acc_path):
             accession_file_list.append(item)
     risk_csv_name = most_recent_risk_csv(accession_file_list)
 
-    # If the risk csv is present, reads it into a dataframe to summarize.
+    # If the risk csv is present, reads the two columns needed to summarize it into a dataframe.
+    # The risk level is read as a category since there are only a few possible values.
+    # Older risk csvs have the column NARA_Risk Level, which is renamed to the current NARA_Risk_Level.
     # If not, prints the error and returns a list with 0 for the number of files at every risk level.
     # If an accession has a path length error, it may not have a risk data csv yet.
     if risk_csv_name:
-        risk_df = pd.read_csv(os.path.join(acc_path, risk_csv_name), low_memory=False)
+        risk_df = read_risk_columns(os.path.join(acc_path, risk_csv_name), ['FITS_File_Path', 'NARA_Risk_Level'],
+                                    {'NARA_Risk_Level': 'category'})
     else:
         return [0, 0, 0, 0, f'Accession {os.path.basename(acc_path)} has no risk csv. ']
 
-    # Renames the NARA_Risk Level column, which is in older risk csvs, to the current NARA_Risk_Level.
-    # If it is already NARA_Risk_Level, this will have no effect.
-    risk_df = risk_df.rename(columns={'NARA_Risk Level': 'NARA_Risk_Level'})
-
-    # Makes a new dataframe with the FITS_File_Path and NARA_Risk Level to remove duplicates.
+    # Removes duplicates of FITS_File_Path and NARA_Risk_Level, using one hash of both columns per row
+    # so the paths are not compared as strings.
     # Duplicates may be from multiple FITS format identifications or multiple NARA matches.
-    # Each file is in the new dataframe once per NARA risk level, if it has more than one possible risk level.
-    risk_dedup_df = risk_df[['FITS_File_Path', 'NARA_Risk_Level']]
-    risk_dedup_df = risk_dedup_df.drop_duplicates()
-
-    # Counts the number of files (dataframe rows) with each possible NARA risk level and saves to a list.
-    # Uses sum() to aggregate because the equality has a Boolean result, and True=1, False=0.
-    risk_list = []
-    for risk in ('No Match', 'High Risk', 'Moderate Risk', 'Low Risk'):
-        risk_list.append((risk_dedup_df['NARA_Risk_Level'] == risk).sum())
-
-    # Adds None to the end of the list, which is for the Notes column.
-    # There is no information for Notes if there is a risk csv.
-    risk_list.append(None)
+    # Each file is in the dataframe once per NARA risk level, if it has more than one possible risk level.
+    row_keys = pd.util.hash_pandas_object(risk_df, index=False)
+    risk = risk_df.loc[~row_keys.duplicated().to_numpy(), 'NARA_Risk_Level'].astype('category')
+
+    # Counts the number of files with each risk level in the csv in one pass, using the category code of each row.
+    # Codes are shifted by 1 so blank risk levels (code -1) are counted first.
+    # Blank is the legacy practice for No Match (see df_cleanup() in format_list.py), so it is counted as No Match.
+    counts = np.bincount(risk.cat.codes.to_numpy() + 1, minlength=len(risk.cat.categories) + 1)
+    label_counts = dict(zip(risk.cat.categories.tolist(), counts[1:].tolist()))
+    label_counts['No Match'] = label_counts.get('No Match', 0) + int(counts[0])
+
+    # Makes a list with the number of files at each of the expected risk levels.
+    risk_list = [label_counts.pop(risk_level, 0) for risk_level in RISK_LEVELS]
+
+    # Adds a note to the end of the list, which is for the Notes column, with the number of files
+    # for any risk level that is not expected, which would otherwise not be included in the accession report.
+    # There is no information for Notes if there is a risk csv and all risk levels are expected.
+    unexpected = [f'{label} ({count})' for label, count in label_counts.items() if count > 0]
+    if unexpected:
+        acc_id = os.path.basename(acc_path)
+        risk_list.append(f'Accession {acc_id} has unexpected risk levels: {", ".join(unexpected)}. ')
+    else:
+        risk_list.append(None)
 
     return risk_list
 
@@ -299,8 +422,8 @@ def most_recent_risk_csv(file_list):
     # Tests each file in the file list looking for the most recent one, based on the date in the file name.
     for file_name in file_list:
 
-        # Skips files that are not risk spreadsheets, like the preservation log.
-        if not ('full_risk_data' in file_name):
+        # Skips files that are not risk spreadsheets, like the preservation log or the Parquet copy of a risk csv.
+        if not ('full_risk_data' in file_name and file_name.endswith('.csv')):
             continue
 
         # Extracts the date from the risk spreadsheet file name, if it has one. If it doesn't, assigns 1900-01-01
@@ -321,57 +444,248 @@ def most_recent_risk_csv(file_list):
     return most_recent_file
 
 
+def read_summary_cache(connection, acc_path, key):
+    """Get the data for an accession from the cache, if the accession has not changed since it was cached
+
+    @:parameter
+    connection (sqlite3.Connection): connection to the cache database
+    acc_path (string): the path to the accession folder
+    key (tuple): information about the accession files, from accession_key()
+
+    @:returns
+    data (list, None): date, size (GB), files, the number of files at each of the 4 risk levels, the note for
+    if the accession has no risk csv, and the note for if the size and files could not be calculated,
+    or None if it is not in the cache or has changed since it was cached
+    """
+    row = connection.execute('SELECT risk_csv, risk_mtime, risk_size, bag_mtime, date, gb, files, no_match, high, '
+                             'moderate, low, notes, size_error FROM accession WHERE path = ?',
+                             (os.path.abspath(acc_path),)).fetchone()
+    if row is None or row[:4] != key:
+        return None
+    data = list(row[4:])
+    return data
+
+
 def round_non_zero(number):
-    """Round a number to the fewest decimal places that don't make the number 0, but at least 2 decimal places
+    """Round numbers to the fewest decimal places that don't make the number 0, but at least 2 decimal places
 
-    This is used in calculating percentage of files at each risk level in combine_collection_data()
-    and size (converted to GB) in get_size()
+    This is used for the size (converted to GB) in get_size() and combine_collection_data().
+    It works on a whole array or column at once: the number of decimal places needed is calculated from
+    the position of the first non-zero digit, floor(log10(abs(number))), instead of trying one place at a time.
+    The result is the same as Python's round() with that number of places.
 
     @:parameter
-    number (float): a number to be rounded
+    number (float, array, pandas Series): a number or numbers to be rounded
 
     @:returns
-    round_number (float): the number rounded to the fewest decimal places that don't make it 0
+    round_number (float, numpy array): the number(s) rounded to the fewest decimal places that don't make it 0
     """
 
-    # If the number is 0, returns it immediately, or else would get stuck in the while loop.
-    # There are collections with no files of a risk category, resulting in 0%.
-    if number == 0:
-        return 0.00
+    numbers = np.atleast_1d(np.asarray(number, dtype=float))
+    round_numbers = np.zeros(numbers.shape)
 
-    # Starts with 2 decimal places, the minimum that we use.
-    places = 2
-    round_number = round(number, 2)
+    # Numbers that are 0 stay 0. There are collections with no files of a risk category, resulting in 0%.
+    # Other numbers need at least one more decimal place than the position of the first non-zero digit,
+    # unless rounding at that digit rounds up (e.g., 0.0007 is 0.001), and at least 2 decimal places.
+    nonzero = numbers != 0
+    values = numbers[nonzero]
+    exponents = np.floor(np.log10(np.abs(values)))
+    places = np.maximum(2, -exponents - 1).astype(int)
 
-    # As long as the rounded number is 0, keep adding one to the number of decimal places.
-    while round_number == 0:
-        places += 1
-        round_number = round(number, places)
+    # Rounds each number, and adds one decimal place to any that rounded to 0 until none are 0.
+    rounded = round_places(values, places)
+    while (rounded == 0).any():
+        zero = rounded == 0
+        places[zero] += 1
+        rounded[zero] = round_places(values[zero], places[zero])
+    round_numbers[nonzero] = rounded
 
-    return round_number
+    # Returns a single number if the input was a single number.
+    if np.ndim(number) == 0:
+        return float(round_numbers[0])
+    return round_numbers
 
 
-def save_accession_report(input_dir, row):
-    """Save a row of data to a CSV in the input_directory provided as the script argument
+def round_places(values, places):
+    """Round each number to its number of decimal places, with the same result as Python's round()
+
+    Multiplying and dividing by powers of 10 is much faster than round() on each number, but can round differently
+    when the number is almost exactly half way between two rounded values or has more than 22 decimal places,
+    so round() is still used for those numbers.
+
+    @:parameter
+    values (numpy array): the numbers to round
+    places (numpy array): the number of decimal places for each number
+
+    @:returns
+    rounded (numpy array): the rounded numbers
+    """
+    # Powers of 10 are only exact up to 10 ** 22, so numbers with more places are always rounded with round().
+    fast = places <= 22
+    scale = 10.0 ** places[fast]
+    scaled = values[fast] * scale
+    rounded = np.empty(values.shape)
+    rounded[fast] = np.round(scaled) / scale
+
+    # Uses round() for the numbers where the faster calculation may not be the same.
+    # The values are converted to Python floats, since round() on a NumPy float uses the faster calculation.
+    check = ~fast
+    check[fast] = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    rounded[check] = [round(float(value), int(place)) for value, place in zip(values[check], places[check])]
+
+    return rounded
+
+
+def save_accession_report(input_dir, acc_df):
+    """Save the data for every accession to a CSV in the input_directory provided as the script argument
 
     @:parameter
     input_dir (string): the path to the folder with data to be summarized (script argument)
-    row (list or string): list with data for a row in the CSV or "header"
+    acc_df (Pandas dataframe): the data for every accession, from accession_table()
+
+    @:returns
+    report_path (string): the path to the accession report
     """
 
     # Path to the accession report.
     report_path = os.path.join(input_dir, f"hub-accession-summary_{datetime.today().strftime('%Y-%m-%d')}.csv")
 
-    # Makes the report with a header row if row is "header". Otherwise, adds the row to the report.
-    if row == 'header':
-        with open(report_path, 'w', newline='') as report:
-            report_writer = csv.writer(report)
-            report_writer.writerow(['Accession', 'Collection', 'Status', 'Date', 'GB', 'Files', 'No_Match_Risk',
-                                    'High_Risk', 'Moderate_Risk', 'Low_Risk', 'Notes', 'Size_Error'])
+    # Saves the report, with a header row.
+    acc_df.to_csv(report_path, index=False)
+
+    return report_path
+
+
+def save_summary_cache(connection, acc_path, key, accession_data):
+    """Save the data for an accession to the cache, replacing any earlier data for that accession
+
+    The changes are committed by summarize_accessions() after every accession is summarized.
+
+    @:parameter
+    connection (sqlite3.Connection): connection to the cache database
+    acc_path (string): the path to the accession folder
+    key (tuple): information about the accession files, from accession_key()
+    accession_data (list): the list from get_accession_data() for the accession
+
+    @:returns
+    None
+    """
+    date, gb, files, no_match, high, moderate, low, notes, size_error = accession_data[3:]
+    connection.execute('INSERT OR REPLACE INTO accession VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                       (os.path.abspath(acc_path),) + tuple(key) +
+                       (date, float(gb), int(files), int(no_match), int(high), int(moderate), int(low), notes,
+                        size_error))
+
+
+def summarize_accessions(input_dir, workers=1, cache_path=None):
+    """Find every accession in the input directory and calculate the data for each, in a consistent order
+
+    With more than one worker, that many accessions are summarized at the same time by threads,
+    and the data is still returned in the same order as with one worker, so the report is the same.
+    With a cache, the data for accessions with the same risk csv and bag-info.txt as the last run is read
+    from the cache instead of being calculated again, and the data for other accessions is saved to the cache.
+
+    @:parameter
+    input_dir (string): the path to the folder with data to be summarized (script argument)
+    workers (integer): the number of accessions to summarize at the same time
+    cache_path (string, None): path to the cache database, or None to not use a cache
+
+    @:returns
+    Generator with the accession path and the list from get_accession_data() for each accession
+    """
+
+    # Makes a list of every accession folder, in the order they are listed, from the Hub inventory
+    # (see hub_inventory.py), which is made again if there is not a recent one saved in the input_dir.
+    # Folders used for other purposes at each level are skipped.
+    inventory_df = load_inventory(input_dir)
+    accession_df = inventory_df.loc[inventory_df['Is_Accession'], ['Status', 'Collection', 'Accession']]
+    accessions = list(accession_df.itertuples(index=False, name=None))
+
+    # Gets the data for every accession that is in the cache and has not changed since it was cached.
+    connection = summary_cache(cache_path) if cache_path else None
+    keys = {}
+    cached = {}
+    if connection:
+        for status, collection, accession in accessions:
+            acc_path = os.path.join(input_dir, status, collection, accession)
+            keys[acc_path] = accession_key(acc_path)
+            data = read_summary_cache(connection, acc_path, keys[acc_path])
+            if data is not None:
+                cached[acc_path] = [accession, collection, status] + data
+    uncached = [acc for acc in accessions if os.path.join(input_dir, *acc) not in cached]
+
+    # Summarizes every other accession, one at a time or at the same time.
+    # map() returns the results in the order of the uncached list, as soon as each one and every one before it is done.
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    if executor:
+        results = executor.map(lambda acc: get_accession_data(input_dir, *acc), uncached)
     else:
-        with open(report_path, 'a', newline='') as report:
-            report_writer = csv.writer(report)
-            report_writer.writerow(row)
+        results = (get_accession_data(input_dir, *acc) for acc in uncached)
+
+    # Returns the data for every accession in the order of the accessions list, and saves new data to the cache.
+    # The cache is saved even if there is an error, so the work already done is not lost.
+    try:
+        for status, collection, accession in accessions:
+            acc_path = os.path.join(input_dir, status, collection, accession)
+            if acc_path in cached:
+                accession_data = cached[acc_path]
+            else:
+                accession_data = next(results)
+                if connection:
+                    save_summary_cache(connection, acc_path, keys[acc_path], accession_data)
+            yield acc_path, accession_data
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        if connection:
+            connection.commit()
+            connection.close()
+
+
+def summary_cache(cache_path):
+    """Connect to the cache database of accession data, making it if it does not exist
+
+    The table accession has the information from accession_key() and the data from get_accession_data()
+    for every accession in the cache, except the accession, collection, and status, which are part of the path.
+
+    @:parameter
+    cache_path (string): path to the cache database
+
+    @:returns
+    connection (sqlite3.Connection): connection to the cache database
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    connection = sqlite3.connect(cache_path)
+    connection.execute('CREATE TABLE IF NOT EXISTS accession (path TEXT PRIMARY KEY, risk_csv TEXT, '
+                       'risk_mtime INTEGER, risk_size INTEGER, bag_mtime INTEGER, date TEXT, gb REAL, files INTEGER, '
+                       'no_match INTEGER, high INTEGER, moderate INTEGER, low INTEGER, notes TEXT, size_error TEXT)')
+    return connection
+
+
+def update_collection_dates(dates, accession_data):
+    """Update the earliest and latest date for the collection of one accession, while accessions are scanned
+
+    This keeps the information for collection_dates_table() so the accession data does not need to be
+    grouped again to get the date range for each collection.
+
+    @:parameter
+    dates (dictionary): keys are collections and values are a list with the earliest and latest date, edited in place
+    accession_data (list): the accession data from get_accession_data(), with collection at index 1 and date at 3
+
+    @:returns
+    None
+    """
+
+    # Starts the range with this accession's date if it is the first accession for the collection.
+    # Otherwise, extends the range if the date is earlier or later than the dates found so far.
+    collection = accession_data[1]
+    acc_date = int(accession_data[3])
+    if collection not in dates:
+        dates[collection] = [acc_date, acc_date]
+    elif acc_date < dates[collection][0]:
+        dates[collection][0] = acc_date
+    elif acc_date > dates[collection][1]:
+        dates[collection][1] = acc_date
 
 
 if __name__ == '__main__':
@@ -383,24 +697,32 @@ if __name__ == '__main__':
         print(error)
         sys.exit(1)
 
-    # Starts a CSV for information about each accession. It will also be summarized later by collection.
-    save_accession_report(input_directory, 'header')
-
-    # Navigates to each accession folder, gets the information, and saves it to the accession CSV.
-    # Folders used for other purposes at each level are skipped.
-    for status in os.listdir(input_directory):
-        if status in ('backlogged', 'closed'):
-            for collection in os.listdir(os.path.join(input_directory, status)):
-                for accession in os.listdir(os.path.join(input_directory, status, collection)):
-                    accession_dir = os.path.join(input_directory, status, collection, accession)
-                    is_accession = accession_test(accession, accession_dir)
-                    if is_accession:
-                        print('Starting on accession', accession_dir)
-                        accession_data = get_accession_data(input_directory, status, collection, accession)
-                        save_accession_report(input_directory, accession_data)
+    # Navigates to each accession folder and gets the information.
+    # Accessions are summarized WORKERS at a time, and the rows are kept in the same order every time.
+    # Accessions that have not changed since the last run are read from the cache.
+    # The earliest and latest date for each collection are updated as each accession is finished.
+    # The risk counts for every accession are also saved to the catalog, if there is one (see hub_catalog.py).
+    accession_rows = []
+    collection_dates = {}
+    recorded = catalog_time()
+    catalog_rows = []
+    for accession_dir, accession_data in summarize_accessions(input_directory, WORKERS, CACHE_PATH):
+        print('Finished accession', accession_dir)
+        accession_rows.append(accession_data)
+        update_collection_dates(collection_dates, accession_data)
+        catalog_rows.append([accession_dir, recorded] + [int(count) for count in accession_data[6:10]])
+    save_catalog_rows('risk_count', catalog_rows)
+
+    # Saves the information about each accession to a CSV in "input_directory" (the script argument),
+    # and a Parquet copy if pyarrow is installed.
+    accession_df = accession_table(accession_rows)
+    report_path = save_accession_report(input_directory, accession_df)
+    save_parquet(accession_df, report_path)
 
     # Combines accession information for each collection and saves to a CSV in "input_directory" (the script argument).
     today = datetime.today().strftime('%Y-%m-%d')
-    accession_df = pd.read_csv(os.path.join(input_directory, f'hub-accession-summary_{today}.csv')).fillna('')
-    collection_df = combine_collection_data(accession_df)
+    collection_df = combine_collection_data(accession_df, collection_dates_table(collection_dates))
     collection_df.to_csv(os.path.join(input_directory, f'hub-collection-summary_{today}.csv'), index=False)
+
+    # Saves a Parquet copy of the collection report, if pyarrow is installed.
+    save_parquet(collection_df, os.path.join(input_directory, f'hub-collection-summary_{today}.csv'))
@@ -9,33 +9,139 @@ The script result (combined_format_data.csv) includes:
 - File_Count
 - Size_GB
 
+The same data is also calculated for each status, collection, and accession (combined_format_data_rollups.csv),
+with the columns Level, Status, Collection, and Accession added to identify the group.
+
+A version for combining with format data from other departments (combined_format_data_normalized.csv) has
+a Source column, format names that are different for each file normalized (e.g., Cannot open PATH),
+and rows with the same format name and version but different NARA risk levels merged into one row.
+
 Parameter:
     input_directory (required): the path to the directory with spreadsheets to be combined, which can be any folder
 
 Returns:
     combined_format_data_YYYY-MM-DD.csv, saved in the input_directory folder (script argument)
+    combined_format_data_rollups_YYYY-MM-DD.csv, saved in the input_directory folder (script argument)
+    combined_format_data_normalized_YYYY-MM-DD.csv, saved in the input_directory folder (script argument)
+    If pyarrow is installed, a Parquet copy of each csv with the same name
+    Cache of the format data from each risk csv, saved in the .hub-monitoring folder of the user's home directory
+    If there is a catalog (see hub_catalog.py), the version of every risk csv that was summarized is added to it
 """
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 import os
 import pandas as pd
 import re
+import sqlite3
 import sys
+from hub_catalog import CATALOG_PATH, catalog_time, save_catalog_rows
+from hub_inventory import folder_files
+from risk_update import read_risk_columns, save_parquet
 from validate_fixity import check_argument
 
+# Columns from the risk csvs used for the format list.
+FORMAT_COLUMNS = ['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB', 'NARA_Risk_Level']
+
+# Columns that identify a format in the format list.
+GROUP_LIST = ['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level']
+
+# Rules for normalizing format names that are different for each file, as (pattern, replacement).
+# A format name that matches the entire pattern is replaced. Patterns are checked in order and the first match is used.
+# Patterns cannot include capture groups; use (?:...) for grouping.
+NORMALIZE_RULES = [(r'Cannot open .*', 'Cannot open'),
+                   (r'Cabinet \d+ Files?', 'Cabinet')]
+
+# NARA risk levels from lowest to highest, for merging different risk levels for a format into a range.
+RISK_ORDER = ['Low Risk', 'Moderate Risk', 'High Risk']
+
+# Department name for the Source column, for combining the normalized format data with other departments.
+SOURCE = 'Hub'
+
+# Number of rows read at a time from a risk csv by accession_formats().
+FORMAT_CHUNK_ROWS = 100000
+
+# Number of accession summaries combine_format_rollups() keeps before adding them to the totals for each level.
+FORMAT_FOLD_ACCESSIONS = 500
 
-def combine_risk_csvs(dir_path):
-    """Combine the data from the most recent risk csv for every accession into one dataframe
+# Levels for the format data rollups, and the columns that identify a group at that level.
+# The status, collection, and accession are the folders that contain each risk csv.
+ROLLUP_LEVELS = {'Status': ['Status'], 'Collection': ['Status', 'Collection'],
+                 'Accession': ['Status', 'Collection', 'Accession']}
+ROLLUP_LIST = ['Level', 'Status', 'Collection', 'Accession'] + GROUP_LIST
+
+# Local database with the format summary for each risk csv, so risk csvs that have not changed are not read again.
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.hub-monitoring', 'format_list_cache.sqlite')
+
+# Number of risk csvs to read and summarize at the same time (processes) when the script runs.
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+def accession_formats(csv_path):
+    """Summarize the format data from one accession's risk csv
+
+    Only the columns needed for the format list are read,
+    and duplicates are removed within the accession before summarizing, since file paths are unique to an accession.
+    The risk csv is read FORMAT_CHUNK_ROWS rows at a time and the file paths in each chunk are replaced by
+    64-bit hashes with hash_paths(), so only one chunk of file path strings is in memory at a time.
+
+    @:parameter
+    csv_path (string, file-like): path to the most recent risk csv for an accession, or its contents already read
+
+    @:returns
+    formats (pandas DataFrame): dataframe with format name, version, NARA risk level, number of files, and size in KB
+    """
+
+    # Reads the needed columns. Version is read as a string, so versions are the same in every risk csv,
+    # instead of a float if a risk csv has all numeric versions.
+    # The file paths are only used to remove duplicates, so the hashes can be used instead.
+    chunks = read_risk_columns(csv_path, FORMAT_COLUMNS, {'FITS_Size_KB': float}, chunksize=FORMAT_CHUNK_ROWS)
+    chunk_list = [hash_paths(chunk) for chunk in chunks]
+    if chunk_list:
+        df = pd.concat(chunk_list, ignore_index=True)
+    else:
+        df = hash_paths(pd.DataFrame(columns=FORMAT_COLUMNS))
+    df = df_cleanup(df)
+
+    # Counts the files and adds the size for each format name, version, and NARA risk level combination.
+    formats = df.groupby(GROUP_LIST, as_index=False).agg(File_Count=('FITS_Size_KB', 'size'),
+                                                         FITS_Size_KB=('FITS_Size_KB', 'sum'))
+
+    return formats
+
+
+def combine_format_rollups(dir_path, workers=1, cache_path=None, catalog_path=None):
+    """Combine the format data from the most recent risk csv for every accession, for every level of the folders
+
+    Each risk csv is summarized as it is read, so every risk csv is only read once, and every FORMAT_FOLD_ACCESSIONS
+    summaries are added to the running totals for all accessions (Level "Hub"), each status, each collection,
+    and each accession with fold_formats(), so the totals are grouped once per batch instead of once per accession.
+    The memory used depends on the number of different formats in each group and not the number of files.
+    With more than one worker, the risk csvs are summarized at the same time by formats_parallel(),
+    and the result is the same as with one worker.
+    With a cache, the summary for risk csvs with the same size and modification time as the last run is read
+    from the cache instead of the risk csv, and the summary for other risk csvs is saved to the cache.
+    With a catalog, the version of every risk csv that was summarized is added to it (see hub_catalog.py).
 
     @:parameter
     dir_path (string): path to the directory with risk csvs (script argument)
+    workers (integer): the number of risk csvs to read and summarize at the same time
+    cache_path (string, None): path to the cache database, or None to not use a cache
+    catalog_path (string, None): path to the catalog, or None to not add to a catalog
 
     @:returns
-    df (pandas DataFrame): dataframe with all columns from the most recent risk csv for every accession
+    df (pandas DataFrame): dataframe with level, status, collection, accession, format name, version,
+                           NARA risk level, number of files, and size in KB.
+                           The status, collection, and accession are blank if not part of the level.
     """
 
     # Makes a list of the most recent risk spreadsheet for every accession.
+    # The folders at the accession level are from the Hub inventory, if there is a recent one (see hub_inventory.py),
+    # instead of navigating every folder in dir_path, including the bags.
+    folder_list = folder_files(dir_path)
+    if folder_list is None:
+        folder_list = ((root, files) for root, directories, files in os.walk(dir_path))
     csv_list = []
-    for root, directories, files in os.walk(dir_path):
+    for root, files in folder_list:
         if any('full_risk_data' in x for x in files):
             print('Starting on accession', root)
             file = most_recent_risk_csv(files)
@@ -44,12 +150,92 @@ def combine_risk_csvs(dir_path):
     # Prints the number of CSVs, to give an idea of the amount of coverage since not all accessions have a risk CSV.
     print('\nNumber of CSVs to combine:', len(csv_list))
 
-    # Combines every spreadsheet into one dataframe.
-    df = pd.concat([pd.read_csv(f, low_memory=False) for f in csv_list])
+    # Gets the summary for every spreadsheet that is in the cache and has not changed since it was cached.
+    connection = format_cache(cache_path) if cache_path else None
+    cached = {}
+    if connection:
+        for csv_path in csv_list:
+            formats = read_format_cache(connection, csv_path)
+            if formats is not None:
+                cached[csv_path] = formats
+    uncached_list = [csv_path for csv_path in csv_list if csv_path not in cached]
+
+    # Summarizes every other spreadsheet, in the same order as csv_list.
+    if workers > 1:
+        accession_summaries = formats_parallel(uncached_list, workers)
+    else:
+        accession_summaries = (accession_formats(csv_path) for csv_path in uncached_list)
+
+    # Adds every summary to the totals for each level, in the same order as csv_list, FORMAT_FOLD_ACCESSIONS at a time,
+    # and saves new summaries to the cache.
+    # The cache is saved even if there is an error, so the work already done is not lost.
+    totals = dict.fromkeys(['Hub'] + list(ROLLUP_LEVELS))
+    accession_list = []
+    try:
+        for csv_path in csv_list:
+            if csv_path in cached:
+                formats = cached[csv_path]
+            else:
+                formats = next(accession_summaries)
+                if connection:
+                    save_format_cache(connection, csv_path, formats)
+
+            # The accession, collection, and status are the folder with the risk csv and the two folders above it.
+            accession_path = os.path.dirname(os.path.abspath(csv_path))
+            collection_path = os.path.dirname(accession_path)
+            accession_list.append(formats.assign(Status=os.path.basename(os.path.dirname(collection_path)),
+                                                 Collection=os.path.basename(collection_path),
+                                                 Accession=os.path.basename(accession_path)))
+            if len(accession_list) >= FORMAT_FOLD_ACCESSIONS:
+                totals = fold_formats(totals, accession_list)
+                accession_list = []
+        totals = fold_formats(totals, accession_list)
+    finally:
+        if connection:
+            connection.commit()
+            connection.close()
+
+    # Adds the version of every risk csv that was summarized to the catalog, in one transaction.
+    if catalog_path:
+        recorded = catalog_time()
+        catalog_rows = []
+        for csv_path in csv_list:
+            csv_stat = os.stat(csv_path)
+            catalog_rows.append((os.path.dirname(csv_path), os.path.basename(csv_path), recorded, csv_stat.st_size,
+                                 csv_stat.st_mtime_ns))
+        save_catalog_rows('risk_csv', catalog_rows, catalog_path)
+
+    # Combines the totals for every level into one dataframe.
+    # If there were no risk csvs, returns a dataframe with the columns and no rows.
+    level_list = [level_df.assign(Level=level) for level, level_df in totals.items() if level_df is not None]
+    if level_list:
+        df = pd.concat(level_list, ignore_index=True).fillna({'Status': '', 'Collection': '', 'Accession': ''})
+    else:
+        df = pd.DataFrame(columns=ROLLUP_LIST + ['File_Count', 'FITS_Size_KB'])
+    df = df[ROLLUP_LIST + ['File_Count', 'FITS_Size_KB']]
 
     return df
 
 
+def combine_risk_csvs(dir_path, workers=1, cache_path=None):
+    """Combine the format data from the most recent risk csv for every accession into one dataframe
+
+    This is the Hub level of combine_format_rollups(), which has the totals for all accessions.
+
+    @:parameter
+    dir_path (string): path to the directory with risk csvs (script argument)
+    workers (integer): the number of risk csvs to read and summarize at the same time
+    cache_path (string, None): path to the cache database, or None to not use a cache
+
+    @:returns
+    df (pandas DataFrame): dataframe with format name, version, NARA risk level, number of files, and size in KB
+    """
+    df = combine_format_rollups(dir_path, workers, cache_path)
+    df = df[df['Level'] == 'Hub']
+    df = df[GROUP_LIST + ['File_Count', 'FITS_Size_KB']].reset_index(drop=True)
+    return df
+
+
 def df_cleanup(df):
     """Remove unneeded columns, rename a column, remove duplicates, fill empty NARA and version, reformat version
 
@@ -70,6 +256,7 @@ def df_cleanup(df):
 
     # Removes duplicates from multiple NARA matches with the same NARA risk level to the same file.
     # The file will still be repeated once per NARA risk level.
+    # The file path column may have the paths or the hashes of the paths from hash_paths(), which are faster to compare.
     # The file path column is then removed, since it is only needed for removing duplicates.
     df = df.drop_duplicates()
     df = df.drop(columns='FITS_File_Path')
@@ -86,26 +273,160 @@ def df_cleanup(df):
     return df
 
 
-def files_per_format(df):
-    """Calculate the number of files for each format name, version, and NARA risk level combination
+def fold_formats(totals, accession_list):
+    """Add a batch of accession summaries to the running totals for every level
 
     @:parameter
-    df (pandas DataFrame): dataframe with a subset of cleaned data from the most recent risk csv for every accession
+    totals (dictionary): keys are Hub and the levels in ROLLUP_LEVELS, and values are the totals so far,
+                         or None if there are no totals yet for that level
+    accession_list (list): format summaries from accession_formats(), with the Status, Collection, and Accession
+
+    @:returns
+    totals (dictionary): keys are Hub and the levels in ROLLUP_LEVELS, and values are the updated totals,
+                         with the group columns for that level, number of files, and size in KB
+    """
+    if not accession_list:
+        return totals
+    batch_df = pd.concat(accession_list, ignore_index=True)
+    level_columns = {'Hub': []}
+    level_columns.update(ROLLUP_LEVELS)
+    for level, columns in level_columns.items():
+        level_df = batch_df if totals[level] is None else pd.concat([totals[level], batch_df], ignore_index=True)
+        totals[level] = sum_formats(level_df, columns + GROUP_LIST)
+    return totals
+
+
+def format_cache(cache_path):
+    """Connect to the cache database of format summaries, making it if it does not exist
+
+    The table risk_csv has the path, size, and modification time of every risk csv in the cache.
+    The table formats has the summary from accession_formats() for every risk csv in the cache.
+
+    @:parameter
+    cache_path (string): path to the cache database
+
+    @:returns
+    connection (sqlite3.Connection): connection to the cache database
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    connection = sqlite3.connect(cache_path)
+    connection.execute('CREATE TABLE IF NOT EXISTS risk_csv (path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER)')
+    connection.execute('CREATE TABLE IF NOT EXISTS formats (path TEXT, name TEXT, version TEXT, risk TEXT, '
+                       'file_count INTEGER, size_kb REAL)')
+    connection.execute('CREATE INDEX IF NOT EXISTS formats_path ON formats (path)')
+    return connection
+
+
+def format_totals(df, group_list=GROUP_LIST):
+    """Calculate the number of files and size in GB for each format name, version, and NARA risk level combination
+
+    This has the same result as counting the files and adding the sizes with separate groupbys merged together
+    (see tests/format_list/benchmark_format_totals.py), but groups the data once with named aggregation.
+
+    @:parameter
+    df (pandas DataFrame): dataframe with a subset of cleaned data from the most recent risk csv for every accession,
+                           or the summary of that data from combine_risk_csvs()
+    group_list (list): the columns to group by, which is the format name, version, and NARA risk level,
+                       plus the rollup columns for the summary from combine_format_rollups()
+
+    @:returns
+    totals (pandas DataFrame): dataframe with the group_list columns, number of files, and size in GB
+    """
+
+    # If the dataframe is already a summary with File_Count, from combine_risk_csvs(), the counts are added.
+    # Otherwise, each row is one file.
+    if 'File_Count' in df.columns:
+        file_count = ('File_Count', 'sum')
+    else:
+        file_count = ('FITS_Size_KB', 'size')
+    totals = df.groupby(group_list, as_index=False, observed=True).agg(File_Count=file_count,
+                                                                       Size_GB=('FITS_Size_KB', 'sum'))
+
+    # Converts the KB to GB and rounds to 3 decimal places.
+    # Anything less than 1 MB with have a size of 0.
+    totals['Size_GB'] = round(totals['Size_GB'] / 1000000, 3)
+
+    return totals
+
+
+def formats_parallel(csv_list, workers):
+    """Summarize the format data from many risk csvs at the same time, returning them in the order of the list
+
+    Each process is given the path and reads the risk csv itself with accession_formats(), FORMAT_CHUNK_ROWS rows
+    at a time, so at most one chunk per process is in memory and only the small summaries are sent back.
+    The Parquet copy of the risk csv is read instead, if there is one that can be used.
+
+    @:parameter
+    csv_list (list): paths to the most recent risk csv for every accession
+    workers (integer): the number of processes
 
     @:returns
-    files (pandas DataFrame): dataframe with format name, version, NARA risk level, and number of files
+    Generator with the dataframe from accession_formats() for each risk csv, in the same order as csv_list
     """
+    with ProcessPoolExecutor(max_workers=workers) as parsers:
+        for summary in parsers.map(accession_formats, csv_list):
+            yield summary
+
 
-    # Groupby includes NARA risk level so different possible risks for each name/version combination are kept.
-    # Reset index keeps the name, version, and risk level as columns in the dataframe.
-    # Without reset index, it would return a series with those columns as part of the index.
-    group_list = ['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level']
-    files = df.groupby(group_list).size().reset_index()
+def hash_paths(df):
+    """Replace the file paths with a 64-bit hash of each path
 
-    # Renames the default column name for the count to be more descriptive.
-    files = files.rename({0: 'File_Count'}, axis=1)
+    The hashes take less memory and are faster to compare than the path strings when removing duplicates.
+    A hash is the same for the same path, and different paths in an accession are very unlikely
+    to have the same hash (about 1 in 37 million for an accession with one million files).
 
-    return files
+    @:parameter
+    df (pandas DataFrame): dataframe with the FITS_File_Path column, from a risk csv
+
+    @:returns
+    df (pandas DataFrame): dataframe with the FITS_File_Path column as unsigned 64-bit integers
+    """
+    paths = df['FITS_File_Path'].to_numpy(dtype=object)
+    df = df.assign(FITS_File_Path=pd.util.hash_array(paths, categorize=False))
+    return df
+
+
+def merge_risk_levels(df):
+    """Merge rows with the same format name and version and different NARA risk levels into one row
+
+    If one of the risk levels is No Match (or another value that is not in RISK_ORDER),
+    it is only included if there are no other risk levels.
+    More than one risk level from RISK_ORDER is converted to a range, e.g., Low-High Risk.
+
+    @:parameter
+    df (pandas DataFrame): dataframe with format name, version, NARA risk level, number of files, and size in KB,
+                           from combine_risk_csvs() or normalize_formats()
+
+    @:returns
+    merged (pandas DataFrame): dataframe with format name, version, NARA risk level (which may be a range),
+                               number of files, and size in KB
+    """
+
+    # Ranks each risk level, lowest to highest, with its code in an ordered category of RISK_ORDER.
+    # Risk levels that are not in RISK_ORDER have the code -1, which is made blank so it is not the lowest rank.
+    codes = pd.Categorical(df['NARA_Risk_Level'], categories=RISK_ORDER, ordered=True).codes
+    df = df.assign(Rank=pd.Series(codes, index=df.index, dtype=float).where(codes >= 0))
+
+    # Combines the rows for each format name and version, keeping the lowest and highest rank.
+    merged = df.groupby(GROUP_LIST[:2], as_index=False).agg(File_Count=('File_Count', 'sum'),
+                                                            FITS_Size_KB=('FITS_Size_KB', 'sum'),
+                                                            Low=('Rank', 'min'), High=('Rank', 'max'))
+
+    # Adds every different risk level that is not ranked, sorted and joined with a "|",
+    # in case there are no ranked risk levels. Only the rows that are not ranked are combined this way.
+    unranked = df.loc[df['Rank'].isna(), GROUP_LIST].drop_duplicates().sort_values(GROUP_LIST)
+    unranked = unranked.groupby(GROUP_LIST[:2])['NARA_Risk_Level'].agg('|'.join).rename('Unranked')
+    merged = merged.join(unranked, on=GROUP_LIST[:2])
+
+    # Makes the risk level from the ranks: the risk level if there is one, a range if there is more than one,
+    # or the unranked risk levels if there are no ranked ones.
+    low = merged['Low'].map(dict(enumerate(RISK_ORDER))).astype(object)
+    high = merged['High'].map(dict(enumerate(RISK_ORDER))).astype(object)
+    risk_range = low.str.replace(' Risk', '') + '-' + high
+    merged['NARA_Risk_Level'] = high.where(merged['Low'] == merged['High'], risk_range).fillna(merged['Unranked'])
+
+    merged = merged[GROUP_LIST + ['File_Count', 'FITS_Size_KB']]
+    return merged
 
 
 def most_recent_risk_csv(file_list):
@@ -131,8 +452,8 @@ def most_recent_risk_csv(file_list):
     # Tests each file in the file list looking for the most recent one, based on the date in the file name.
     for file_name in file_list:
 
-        # Skips files that are not risk spreadsheets, like the preservation log.
-        if not ('full_risk_data' in file_name):
+        # Skips files that are not risk spreadsheets, like the preservation log or the Parquet copy of a risk csv.
+        if not ('full_risk_data' in file_name and file_name.endswith('.csv')):
             continue
 
         # Extracts the date from the risk spreadsheet file name, if it has one. If it doesn't, assigns 1900-01-01
@@ -153,30 +474,113 @@ def most_recent_risk_csv(file_list):
     return most_recent_file
 
 
-def size_per_format(df):
-    """Calculate the size in GB for each format name, version, and NARA risk level combination
+def normalize_formats(df, rules=NORMALIZE_RULES):
+    """Normalize format names that are different for each file, and combine rows that are now the same format
+
+    All rules are compiled into one regular expression with normalize_pattern(),
+    so the format names are only searched once no matter how many rules there are.
 
     @:parameter
-    df (pandas Dataframe): dataframe with a subset of cleaned data from the most recent risk csv for every accession
+    df (pandas DataFrame): dataframe with format name, version, NARA risk level, number of files, and size in KB,
+                           from combine_risk_csvs()
+    rules (list): list of tuples with the pattern for format names to normalize and the replacement
 
     @:returns
-    size (pandas Dataframe): dataframe with format name, version, NARA risk level, and size in GB
+    normalized (pandas DataFrame): dataframe with format name, version, NARA risk level, number of files,
+                                   and size in KB, with one row per normalized format
     """
 
-    # Groupby includes NARA risk level so different possible risks for the name/version combination are kept.
-    # Reset index keeps the name, version, and risk level as columns in the dataframe.
-    # Without reset index, it would return a series with those columns as part of the index.
-    group_list = ['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level']
-    size = df.groupby(group_list)['FITS_Size_KB'].sum().reset_index()
+    # Finds the rule, if any, that matches each format name.
+    # extract() has one column per rule, and only the rule that matched is not blank.
+    # If there are no rules, no format names are changed.
+    if rules:
+        names = df['FITS_Format_Name'].astype(str)
+        matches = names.str.extract(normalize_pattern(rules))
+        matched = matches.notna().any(axis=1)
+        replacements = {f'rule{number}': replacement for number, (pattern, replacement) in enumerate(rules)}
+        rule = matches[matched].notna().idxmax(axis=1)
 
-    # Converts the KB to GB and rounds to 3 decimal places.
-    # Anything less than 1 MB with have a size of 0.
-    size['Size_GB'] = round(size['FITS_Size_KB'] / 1000000, 3)
+        # Replaces the format names that matched a rule with that rule's replacement.
+        df = df.assign(FITS_Format_Name=names.where(~matched, rule.map(replacements)))
 
-    # Removes the KB column, which is not needed now that we have GB.
-    size = size.drop(columns='FITS_Size_KB')
+    # Combines rows that have the same format name, version, and NARA risk level after normalizing.
+    normalized = df.groupby(GROUP_LIST, as_index=False)[['File_Count', 'FITS_Size_KB']].sum()
+    return normalized
 
-    return size
+
+def normalize_pattern(rules):
+    """Compile the normalization rules into one regular expression, with a named group for each rule
+
+    @:parameter
+    rules (list): list of tuples with the pattern for format names to normalize and the replacement
+
+    @:returns
+    pattern (re.Pattern): regular expression that matches an entire format name, with groups named rule0, rule1, etc.
+    """
+    alternatives = '|'.join(f'(?P<rule{number}>{rule[0]})' for number, rule in enumerate(rules))
+    pattern = re.compile(f'^(?:{alternatives})$')
+    return pattern
+
+
+def read_format_cache(connection, csv_path):
+    """Get the format summary for a risk csv from the cache, if it has not changed since it was cached
+
+    @:parameter
+    connection (sqlite3.Connection): connection to the cache database
+    csv_path (string): path to the risk csv
+
+    @:returns
+    formats (pandas DataFrame, None): the summary from accession_formats(), or None if it is not in the cache
+    or the risk csv has a different size or modification time than when it was cached
+    """
+    csv_stat = os.stat(csv_path)
+    row = connection.execute('SELECT size, mtime FROM risk_csv WHERE path = ?', (os.path.abspath(csv_path),)).fetchone()
+    if row is None or row != (csv_stat.st_size, csv_stat.st_mtime_ns):
+        return None
+
+    rows = connection.execute('SELECT name, version, risk, file_count, size_kb FROM formats WHERE path = ?',
+                              (os.path.abspath(csv_path),)).fetchall()
+    formats = pd.DataFrame(rows, columns=GROUP_LIST + ['File_Count', 'FITS_Size_KB'])
+    return formats
+
+
+def save_format_cache(connection, csv_path, formats):
+    """Save the format summary for a risk csv to the cache, replacing any earlier summary for that risk csv
+
+    The changes are committed by combine_risk_csvs() after every risk csv is summarized.
+
+    @:parameter
+    connection (sqlite3.Connection): connection to the cache database
+    csv_path (string): path to the risk csv
+    formats (pandas DataFrame): the summary from accession_formats()
+
+    @:returns
+    None
+    """
+    csv_stat = os.stat(csv_path)
+    path = os.path.abspath(csv_path)
+    connection.execute('DELETE FROM formats WHERE path = ?', (path,))
+    connection.executemany('INSERT INTO formats VALUES (?, ?, ?, ?, ?, ?)',
+                           [(path, name, version, risk, int(count), float(size_kb))
+                            for name, version, risk, count, size_kb in formats.itertuples(index=False)])
+    connection.execute('INSERT OR REPLACE INTO risk_csv VALUES (?, ?, ?)',
+                       (path, csv_stat.st_size, csv_stat.st_mtime_ns))
+
+
+def sum_formats(formats, group_list=GROUP_LIST):
+    """Add together the format summaries for the accessions in a group
+
+    @:parameter
+    formats (pandas DataFrame): format summaries for every accession, from accession_formats(),
+                                with the Status, Collection, and Accession of each
+    group_list (list): the columns that identify a row in the totals, which is the format name, version,
+                       and NARA risk level, plus any columns for the status, collection, or accession
+
+    @:returns
+    totals (pandas DataFrame): group_list columns, number of files, and size in KB
+    """
+    totals = formats.groupby(group_list, as_index=False)[['File_Count', 'FITS_Size_KB']].sum()
+    return totals
 
 
 if __name__ == '__main__':
@@ -188,18 +592,33 @@ if __name__ == '__main__':
         print(error)
         sys.exit(1)
 
-    # Combines the most recent risk csv for each accession into one dataframe.
-    df_all = combine_risk_csvs(input_directory)
+    # Combines the format data from the most recent risk csv for each accession into one dataframe,
+    # with totals for all accessions (Hub) and for each status, collection, and accession.
+    # The data is cleaned up and summarized for each accession as it is read.
+    df_rollups = combine_format_rollups(input_directory, WORKERS, CACHE_PATH, CATALOG_PATH)
+    df_formats = df_rollups[df_rollups['Level'] == 'Hub']
 
-    # Transforms the dataframe with all risk data to a dataframe with the desired data.
-    df_formats = df_cleanup(df_all)
-
-    # Calculates the number of files per format and GB per format, and combines them into one dataframe.
+    # Calculates the number of files per format and GB per format in one dataframe.
     # It also includes the format name, version, and NARA risk level.
-    df_files = files_per_format(df_formats)
-    df_size = size_per_format(df_formats)
-    df_format_list = pd.merge(df_files, df_size, how='outer')
+    df_format_list = format_totals(df_formats)
+
+    # Calculates the same for each status, collection, and accession.
+    # Rows are in the order of the levels, from the largest group to the smallest.
+    df_level_list = format_totals(df_rollups[df_rollups['Level'] != 'Hub'], ROLLUP_LIST)
+    df_level_list['Level'] = pd.Categorical(df_level_list['Level'], categories=list(ROLLUP_LEVELS))
+    df_level_list = df_level_list.sort_values('Level', kind='stable')
+
+    # Makes a version for combining with other departments' format data, with format names normalized,
+    # different NARA risk levels for a format name and version merged, and the Source as the first column.
+    df_normalized_list = format_totals(merge_risk_levels(normalize_formats(df_formats)))
+    df_normalized_list.insert(0, 'Source', SOURCE)
 
-    # Saves the result to a CSV in the input directory (script argument).
+    # Saves the results to CSVs in the input directory (script argument),
+    # and a Parquet copy of each if pyarrow is installed.
     today = date.today().strftime('%Y-%m-%d')
-    df_format_list.to_csv(os.path.join(input_directory, f'combined_format_data_{today}.csv'), index=False)
+    reports = {f'combined_format_data_{today}.csv': df_format_list,
+               f'combined_format_data_rollups_{today}.csv': df_level_list,
+               f'combined_format_data_normalized_{today}.csv': df_normalized_list}
+    for report_name, report_df in reports.items():
+        report_df.to_csv(os.path.join(input_directory, report_name), index=False)
+        save_parquet(report_df, os.path.join(input_directory, report_name))
@@ -0,0 +1,179 @@
+"""Makes a local database (catalog) with the results from every script, so results can be compared across runs
+
+The catalog is optional. Once it is made by running this script, the other scripts add their results to it:
+- accession: every accession any script has found, with when it was last seen
+- completeness: findings from accession_completeness_report.py
+- fixity_event: every validation from validate_fixity.py
+- risk_count: the number of files at each NARA risk level from collection_summary.py
+- risk_csv: every version of a risk csv read by format_list.py or made by risk_update.py
+
+The catalog can be queried with any SQLite tool. This script also finds accessions not validated recently.
+
+Parameter:
+    months (optional): print the accessions that have not been validated in this many months
+
+Returns:
+    hub_catalog.sqlite, saved in the .hub-monitoring folder of the user's home directory, if it does not exist
+    If months is provided, prints the accessions not validated in that many months
+"""
+from datetime import datetime
+import os
+import pandas as pd
+import sqlite3
+import sys
+
+# Location of the catalog. The other scripts only add to it if it already exists.
+CATALOG_PATH = os.path.join(os.path.expanduser('~'), '.hub-monitoring', 'hub_catalog.sqlite')
+
+# Scripts that run for a long time save their rows to the catalog after this many, in one transaction.
+CATALOG_BATCH_ROWS = 100
+
+# Columns for each table with results from a script, in the order of the rows from the scripts.
+# Every table starts with the path to the accession folder, which is also added to the accession table.
+CATALOG_TABLES = {'completeness': ['path', 'checked', 'pres_log', 'pres_log_format', 'full_risk', 'initial_manifest',
+                                   'bag'],
+                  'fixity_event': ['path', 'validated', 'fixity_type', 'valid', 'result'],
+                  'risk_count': ['path', 'recorded', 'no_match', 'high', 'moderate', 'low'],
+                  'risk_csv': ['path', 'csv_name', 'recorded', 'size', 'mtime_ns']}
+
+# Statements to make the tables and the indexes used to look up results for an accession or by date.
+CATALOG_SCHEMA = ['CREATE TABLE IF NOT EXISTS accession (path TEXT PRIMARY KEY, status TEXT, collection TEXT, '
+                  'accession TEXT, last_seen TEXT)',
+                  'CREATE TABLE IF NOT EXISTS completeness (path TEXT, checked TEXT, pres_log INTEGER, '
+                  'pres_log_format TEXT, full_risk INTEGER, initial_manifest INTEGER, bag INTEGER, '
+                  'PRIMARY KEY (path, checked))',
+                  'CREATE TABLE IF NOT EXISTS fixity_event (path TEXT, validated TEXT, fixity_type TEXT, '
+                  'valid INTEGER, result TEXT, PRIMARY KEY (path, validated))',
+                  'CREATE TABLE IF NOT EXISTS risk_count (path TEXT, recorded TEXT, no_match INTEGER, high INTEGER, '
+                  'moderate INTEGER, low INTEGER, PRIMARY KEY (path, recorded))',
+                  'CREATE TABLE IF NOT EXISTS risk_csv (path TEXT, csv_name TEXT, recorded TEXT, size INTEGER, '
+                  'mtime_ns INTEGER, PRIMARY KEY (path, csv_name, mtime_ns))',
+                  'CREATE INDEX IF NOT EXISTS accession_collection ON accession (collection)',
+                  'CREATE INDEX IF NOT EXISTS fixity_event_validated ON fixity_event (validated)',
+                  'CREATE INDEX IF NOT EXISTS risk_count_recorded ON risk_count (recorded)',
+                  'CREATE INDEX IF NOT EXISTS completeness_checked ON completeness (checked)']
+
+
+def accession_row(acc_path, seen):
+    """Make the row for the accession table from the path to an accession folder
+
+    The status, collection, and accession are the accession folder and the two folders above it.
+
+    @:parameter
+    acc_path (string): the path to the accession folder
+    seen (string): the date and time the accession was found by a script
+
+    @:returns
+    row (tuple): the full path, status, collection, accession, and date and time last seen
+    """
+    full_path = os.path.abspath(acc_path)
+    collection_path = os.path.dirname(full_path)
+    row = (full_path, os.path.basename(os.path.dirname(collection_path)), os.path.basename(collection_path),
+           os.path.basename(full_path), seen)
+    return row
+
+
+def catalog_time():
+    """Get the current date and time formatted for the catalog, which SQLite date functions can compare
+
+    @:returns
+    String: the date and time formatted YYYY-MM-DD HH:MM:SS
+    """
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def make_catalog(catalog_path=CATALOG_PATH):
+    """Make the catalog and its tables, if they do not already exist
+
+    @:parameter
+    catalog_path (string): path to the catalog
+
+    @:returns
+    None
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(catalog_path)), exist_ok=True)
+    connection = sqlite3.connect(catalog_path)
+    with connection:
+        for statement in CATALOG_SCHEMA:
+            connection.execute(statement)
+    connection.close()
+
+
+def not_validated(months, catalog_path=CATALOG_PATH):
+    """Find the accessions that have not been validated in the given number of months, including never validated
+
+    @:parameter
+    months (integer): the number of months
+    catalog_path (string): path to the catalog
+
+    @:returns
+    df (Pandas dataframe): path, status, collection, accession, and date last validated (blank if never),
+                           sorted by the date last validated
+    """
+    query = ('SELECT a.path, a.status, a.collection, a.accession, MAX(f.validated) AS last_validated '
+             'FROM accession a LEFT JOIN fixity_event f ON f.path = a.path '
+             'GROUP BY a.path '
+             'HAVING last_validated IS NULL OR last_validated < datetime(\'now\', \'localtime\', ?) '
+             'ORDER BY last_validated, a.path')
+    connection = sqlite3.connect(catalog_path)
+    df = pd.read_sql_query(query, connection, params=(f'-{int(months)} months',))
+    connection.close()
+    return df
+
+
+def save_catalog_rows(table, rows, catalog_path=CATALOG_PATH):
+    """Save rows to a table in the catalog in one transaction, if the catalog exists
+
+    The accession for each row is also added to the accession table, or updated with when it was last seen.
+    Rows that are already in the table (same primary key) are replaced.
+
+    Used by accession_completeness_report.py, collection_summary.py, format_list.py, risk_update.py,
+    and validate_fixity.py.
+
+    @:parameter
+    table (string): the name of the table, which is a key in CATALOG_TABLES
+    rows (list): a list of tuples or lists with a value for each column in CATALOG_TABLES[table],
+                 starting with the path to the accession folder
+    catalog_path (string): path to the catalog
+
+    @:returns
+    Boolean: True if the rows were saved and False if there is no catalog
+    """
+    if not os.path.exists(catalog_path):
+        return False
+    if len(rows) == 0:
+        return True
+
+    # Paths are saved as full paths so results from scripts run from different folders match.
+    seen = catalog_time()
+    rows = [(os.path.abspath(row[0]),) + tuple(row[1:]) for row in rows]
+    accession_rows = {row[0]: accession_row(row[0], seen) for row in rows}
+
+    # Saves all the rows in one transaction, which is much faster than one transaction per row.
+    columns = CATALOG_TABLES[table]
+    connection = sqlite3.connect(catalog_path)
+    with connection:
+        connection.executemany('INSERT OR REPLACE INTO accession VALUES (?, ?, ?, ?, ?)', accession_rows.values())
+        connection.executemany(f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) '
+                               f'VALUES ({", ".join("?" * len(columns))})', rows)
+    connection.close()
+    return True
+
+
+if __name__ == '__main__':
+
+    # Makes the catalog, if it does not exist, so the other scripts start adding their results to it.
+    if not os.path.exists(CATALOG_PATH):
+        make_catalog()
+        print('Made the catalog:', CATALOG_PATH)
+
+    # Prints the accessions that have not been validated in the number of months in the script argument, if any.
+    if len(sys.argv) == 2:
+        try:
+            not_validated_df = not_validated(int(sys.argv[1]))
+        except ValueError:
+            print(f"Provided months '{sys.argv[1]}' is not a number")
+            sys.exit(1)
+        print(f'\n{len(not_validated_df.index)} accessions have not been validated in {sys.argv[1]} months')
+        if len(not_validated_df.index) > 0:
+            print(not_validated_df.fillna('Never').to_string(index=False))
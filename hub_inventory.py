@@ -0,0 +1,439 @@
+"""Makes an inventory of every folder at the accession level in a department folder, in one pass over the folders
+
+The other scripts use the saved inventory, if it is recent, instead of navigating the folders on Hub again,
+after checking which folders changed since it was saved.
+If there is no recent inventory, the scripts that need one make it again without saving it.
+
+Data included for every folder at the accession level (within a status and collection folder):
+- Status (backlogged or closed)
+- Collection
+- Accession (folder name, which may not be an accession)
+- Path
+- Is_Accession (if the folder name matches the patterns for an accession number)
+- Created (timestamp of when the folder was made)
+- Bag_Type (Bag, Multiple_Bags, Zipped_Bag, Zip, or blank if there is no fixity information)
+- Bagging_Date and Payload_Oxum (from bag-info.txt, if there is a bag or zipped bag)
+- Risk_CSVs (names of every risk spreadsheet, separated by RISK_CSV_SEPARATOR)
+- Preservation_Log and Initial_Manifest (if they are present)
+
+Parameter:
+    input_directory (required): the directory with the folders to be inventoried,
+                                which must be the directory containing the status folders ("born-digital")
+
+Returns:
+    hub_inventory.csv, saved in input_directory and replaced each time the script runs
+"""
+from concurrent.futures import ThreadPoolExecutor
+import locale
+import os
+import pandas as pd
+import sys
+import time
+
+# Columns in the inventory and their data types, in the order of the list from accession_record().
+INVENTORY_COLUMNS = {'Status': object, 'Collection': object, 'Accession': object, 'Path': object,
+                     'Is_Accession': bool, 'Created': 'float64', 'Bag_Type': object, 'Bagging_Date': object,
+                     'Payload_Oxum': object, 'Risk_CSVs': object, 'Preservation_Log': bool, 'Initial_Manifest': bool}
+
+# Name of the inventory saved in the input_directory.
+INVENTORY_NAME = 'hub_inventory.csv'
+
+# A saved inventory older than this (in seconds) is not used, since folders may have been added or changed.
+INVENTORY_MAX_AGE = 24 * 60 * 60
+
+# Bytes read at a time from the end of a preservation log by read_log_ends(), to find the start of the last row.
+LOG_TAIL_BYTES = 4096
+
+# Character between the names of risk spreadsheets in Risk_CSVs, which cannot be part of a Windows file name.
+RISK_CSV_SEPARATOR = '|'
+
+# Status folders within the input_directory that are inventoried. Other folders at this level are skipped.
+STATUS_FOLDERS = ('backlogged', 'closed')
+
+
+def accession_record(status, collection, entry):
+    """Get the inventory information for one folder at the accession level, from one listing of its contents
+
+    @:parameter
+    status (string): the name of the status folder
+    collection (string): the name of the collection folder
+    entry (os.DirEntry): the folder at the accession level, from os.scandir() of the collection folder
+
+    @:returns
+    record (list): the values for each column in INVENTORY_COLUMNS
+    """
+
+    # Lists the contents of the folder once and checks every name, instead of testing for each item separately.
+    folder = entry.name
+    with os.scandir(entry.path) as contents:
+        names = [item.name for item in contents]
+    name_set = set(names)
+
+    # Fixity information, in the same order of precedence as validate_fixity.py.
+    # Bags also have size and date information in bag-info.txt.
+    bag_info = {}
+    if f'{folder}_bag' in name_set:
+        bag_type = 'Bag'
+        bag_info = read_bag_info(os.path.join(entry.path, f'{folder}_bag'))
+    elif f'{folder}_bags' in name_set:
+        bag_type = 'Multiple_Bags'
+    elif f'{folder}_zipped_bag' in name_set:
+        bag_type = 'Zipped_Bag'
+        bag_info = read_bag_info(os.path.join(entry.path, f'{folder}_zipped_bag'))
+    elif f'{folder}_zip_md5.txt' in name_set:
+        bag_type = 'Zip'
+    else:
+        bag_type = ''
+
+    # Preservation metadata files, in the order they are listed.
+    risk_csvs = [name for name in names if 'full_risk_data' in name and name.endswith('.csv')]
+    pres_log = 'preservation_log.txt' in name_set
+    manifest = any(name.startswith('initialmanifest_') and name.endswith('.csv') for name in names)
+
+    record = [status, collection, folder, entry.path, accession_test(folder), entry.stat().st_ctime, bag_type,
+              bag_info.get('Bagging-Date', ''), bag_info.get('Payload-Oxum', ''),
+              RISK_CSV_SEPARATOR.join(risk_csvs), pres_log, manifest]
+    return record
+
+
+def accession_test(folder_name):
+    """Determine if a folder name is an accession number
+
+    Keep in sync with the copy of this function in validate_fixity.py.
+
+    @:parameter
+    folder_name (string): the name of a folder to be checked for accession number formatting
+
+    @:return
+    Boolean: True if it is an accession number and False if not
+    """
+
+    # Pattern one: ends with -er or -ER.
+    if folder_name.lower().endswith('-er'):
+        return True
+    # Pattern two: ends with _er or _ER.
+    elif folder_name.lower().endswith('_er'):
+        return True
+    # Temporary designation for legacy content while determining an accession number.
+    elif folder_name == 'no-acc-num':
+        return True
+    # Folder that matches none of the patterns for an accession.
+    else:
+        return False
+
+
+def folder_files(input_dir, accessions_only=False):
+    """List the files in every folder at the accession level in the input directory, using a recent saved inventory
+
+    This replaces navigating every folder in the input directory, including the contents of every bag,
+    to find the accession folders. The files in each folder are listed again, not read from the inventory,
+    so risk spreadsheets made since the inventory was saved are included.
+
+    Used by format_list.py and risk_update.py.
+
+    @:parameter
+    input_dir (string): the path to the folder with data to be processed (script argument), which may be any folder
+    accessions_only (Boolean): if True, only includes folders with a name that matches the pattern for an accession
+
+    @:returns
+    folder_list (list, None): a list with the path and a list of file names for each folder,
+                              or None if there is no recent saved inventory for the input directory
+    """
+    inventory_df = load_inventory(input_dir, scan=False)
+    if inventory_df is None:
+        return None
+    if accessions_only:
+        inventory_df = inventory_df[inventory_df['Is_Accession']]
+
+    # Lists the files (not folders) in each folder.
+    folder_list = []
+    for folder_path in inventory_df['Path']:
+        with os.scandir(folder_path) as contents:
+            folder_list.append((folder_path, [item.name for item in contents if item.is_file()]))
+    return folder_list
+
+
+def load_inventory(input_dir, scan=True, max_age=INVENTORY_MAX_AGE, workers=1):
+    """Get the inventory for the folders in the input directory, from a recent saved inventory if there is one
+
+    The saved inventory may be in the input directory or a folder above it, such as when the input directory
+    is a collection folder and the inventory was saved in the born-digital folder.
+    Only the rows for folders within the input directory are returned.
+
+    Also used by accession_completeness_report.py, collection_summary.py, format_list.py, risk_update.py,
+    and validate_fixity.py.
+
+    @:parameter
+    input_dir (string): the path to the folder with data to be inventoried (script argument)
+    scan (Boolean): if True, the folders are inventoried if there is no recent saved inventory,
+                    which requires input_dir to be the folder containing the status folders
+    max_age (integer): the age, in seconds, of the oldest saved inventory that can be used
+    workers (integer): the number of folders to list at the same time, if the folders are inventoried
+
+    @:returns
+    inventory_df (Pandas dataframe, None): the inventory, or None if there is no recent saved inventory
+                                           for the input directory and scan is False
+    """
+
+    # Looks for a saved inventory in the input directory and every folder above it, using the closest one.
+    # A saved inventory is only used if it is recent and includes the input directory, which is the folder
+    # with the inventory or a status, collection, or accession folder within it. Other folders are not inventoried.
+    # Folders may have been added or changed since it was saved, so it is also updated (see refresh_inventory()).
+    input_root = os.path.abspath(input_dir)
+    folder = input_root
+    while True:
+        inventory_path = os.path.join(folder, INVENTORY_NAME)
+        if os.path.exists(inventory_path):
+            saved_time = os.path.getmtime(inventory_path)
+            parts = [] if folder == input_root else os.path.relpath(input_root, folder).split(os.sep)
+            covered = not parts or (parts[0] in STATUS_FOLDERS and len(parts) <= 3)
+            if covered and time.time() - saved_time <= max_age:
+                inventory_df = pd.read_csv(inventory_path, dtype=INVENTORY_COLUMNS, keep_default_na=False)
+                paths = inventory_df['Path'].map(os.path.abspath)
+                in_dir = (paths == input_root) | paths.str.startswith(os.path.join(input_root, ''))
+                inventory_df = refresh_inventory(inventory_df[in_dir].reset_index(drop=True), folder, parts,
+                                                 saved_time)
+                if inventory_df is not None:
+                    return inventory_df
+            break
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            break
+        folder = parent
+
+    # Makes the inventory again, if allowed, or returns None so the script can navigate the folders itself.
+    if scan:
+        return scan_inventory(input_dir, workers)
+    return None
+
+
+def read_bag_info(bag_path, tag_file='bag-info.txt'):
+    """Read the fields in a bag's bag-info.txt file, without validating the bag
+
+    Also used by accession_completeness_report.py to read bagit.txt, which has the same format.
+
+    @:parameter
+    bag_path (string): the path to the bag folder
+    tag_file (string): the name of the file with the fields, which is bag-info.txt unless another is needed
+
+    @:returns
+    bag_info (dictionary): keys are field names (e.g., Payload-Oxum) and values are the field values,
+                           or empty if there is no tag_file or it cannot be read
+    """
+
+    # Each field is one row formatted "Name: Value".
+    # Rows that start with whitespace continue the value from the row before.
+    bag_info = {}
+    try:
+        with open(os.path.join(bag_path, tag_file), encoding='utf-8') as open_info:
+            name = None
+            for line in open_info:
+                if line[:1].isspace() and name:
+                    bag_info[name] += ' ' + line.strip()
+                elif ':' in line:
+                    name, value = line.split(':', 1)
+                    name = name.strip()
+                    bag_info[name] = value.strip()
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    return bag_info
+
+
+def read_log_ends(log_path):
+    """Read the first and last row of a preservation log, without reading the rows in between
+
+    The first row is read from the start of the file. The last row is found by reading backwards from the end
+    of the file, LOG_TAIL_BYTES at a time, until the line return before it is found,
+    so the time to read a log is the same no matter how many rows it has.
+    The rows are the same as the first and last item from readlines() of the log opened as text:
+    they are decoded with the default encoding and end with "\n" (any "\r\n" is converted),
+    except the last row does not if the log does not end with a line return.
+
+    Used by accession_completeness_report.py and validate_fixity.py.
+
+    @:parameter
+    log_path (string): path to the preservation log
+
+    @:returns
+    first_row (string): the first row of the log, or an empty string if the log is empty
+    last_row (string): the last row of the log, which may be just "\n", or an empty string if the log is empty
+    Raises UnicodeDecodeError if either row cannot be decoded
+    """
+    encoding = locale.getpreferredencoding(False)
+    with open(log_path, 'rb') as open_log:
+        first_bytes = open_log.readline()
+
+        # Reads more of the end of the log until it includes the line return before the last row,
+        # not counting a line return that is the last character of the log, or it reaches the start of the log.
+        end = open_log.seek(0, os.SEEK_END)
+        start = end
+        tail = b''
+        while start > 0:
+            start = max(0, start - LOG_TAIL_BYTES)
+            open_log.seek(start)
+            tail = open_log.read(end - start)
+            if tail.rfind(b'\n', 0, len(tail) - 1) != -1:
+                break
+        last_bytes = tail[tail.rfind(b'\n', 0, len(tail) - 1) + 1:]
+
+    # Decodes the rows and converts Windows line returns, the same as reading the log as text.
+    first_row = first_bytes.decode(encoding).replace('\r\n', '\n')
+    last_row = last_bytes.decode(encoding).replace('\r\n', '\n')
+    return first_row, last_row
+
+
+def refresh_inventory(inventory_df, inventory_folder, parts, saved_time):
+    """Update a saved inventory for the folders that changed since it was saved
+
+    Adding, removing, or renaming a folder or file changes the modification time of the folder that contains it.
+    If a status or collection folder changed, folders at the accession level may have been added or removed,
+    so the inventory cannot be used. If a folder at the accession level changed, such as a new risk spreadsheet
+    or bag, or its bag-info.txt or a risk spreadsheet was edited or replaced, which does not change the folder,
+    only the row for that folder is made again. This checks the modification time of each folder and those files,
+    which is much faster than listing the contents of every folder.
+
+    @:parameter
+    inventory_df (Pandas dataframe): the rows of the saved inventory for the input directory
+    inventory_folder (string): the path to the folder with the saved inventory
+    parts (list): the folder names from the inventory_folder to the input directory, or empty if they are the same
+    saved_time (float): the modification time of the saved inventory, which is when the scan started
+
+    @:returns
+    inventory_df (Pandas dataframe, None): the updated inventory,
+                                           or None if a status or collection folder changed since it was saved
+    """
+
+    # Makes a list of the status and collection folders that are the input directory or within it,
+    # or the collection folder that contains it if the input directory is a folder at the accession level.
+    if len(parts) >= 2:
+        container_list = [os.path.join(inventory_folder, parts[0], parts[1])]
+    else:
+        statuses = parts if parts else STATUS_FOLDERS
+        container_list = []
+        for status in statuses:
+            status_path = os.path.join(inventory_folder, status)
+            if not os.path.isdir(status_path):
+                # A status folder that was removed since the inventory was saved.
+                if (inventory_df['Status'] == status).any():
+                    return None
+                continue
+            container_list.append(status_path)
+            with os.scandir(status_path) as collections:
+                container_list.extend(entry.path for entry in collections if entry.is_dir())
+
+    # The inventory cannot be used if any status or collection folder changed after it was saved.
+    if any(os.path.getmtime(container) > saved_time for container in container_list):
+        return None
+
+    # Finds every folder at the accession level that changed after the inventory was saved,
+    # including the bag-info.txt of a bag and the risk spreadsheets, which are the data read from files in the folder.
+    changed = {}
+    for row, folder in enumerate(inventory_df.itertuples()):
+        path_list = [folder.Path]
+        if folder.Bag_Type in ('Bag', 'Zipped_Bag'):
+            bag_name = f'{folder.Accession}_bag' if folder.Bag_Type == 'Bag' else f'{folder.Accession}_zipped_bag'
+            path_list.append(os.path.join(folder.Path, bag_name, 'bag-info.txt'))
+        path_list.extend(os.path.join(folder.Path, name) for name in folder.Risk_CSVs.split(RISK_CSV_SEPARATOR) if name)
+        try:
+            is_changed = any(os.path.getmtime(path) > saved_time for path in path_list)
+        except FileNotFoundError:
+            if not os.path.isdir(folder.Path):
+                return None
+            is_changed = True
+        if is_changed:
+            changed.setdefault(os.path.dirname(folder.Path), {})[folder.Accession] = row
+
+    # Makes the row again for each changed folder, listing each collection folder with a changed folder once.
+    for collection_path, folders in changed.items():
+        with os.scandir(collection_path) as entries:
+            entry_list = [entry for entry in entries if entry.name in folders]
+        for entry in entry_list:
+            row = folders[entry.name]
+            status, collection = inventory_df.at[row, 'Status'], inventory_df.at[row, 'Collection']
+            inventory_df.loc[row, list(INVENTORY_COLUMNS)] = accession_record(status, collection, entry)
+    return inventory_df
+
+
+def save_inventory(input_dir, inventory_df, scan_time=None):
+    """Save the inventory to a csv in the input directory, replacing any earlier inventory
+
+    It is first saved with a temporary name and only renamed once it is complete,
+    so other scripts do not read an inventory that is not done.
+    The modification time of the saved inventory is when the scan started, if it is given,
+    so folders that changed while they were being scanned are found by refresh_inventory().
+
+    @:parameter
+    input_dir (string): the path to the folder that was inventoried (script argument)
+    inventory_df (Pandas dataframe): the inventory, from scan_inventory()
+    scan_time (float, None): the time the scan started, from time.time(), or None to use when it is saved
+
+    @:returns
+    inventory_path (string): the path to the saved inventory
+    """
+    # The paths are saved as full paths, so they can be used by scripts run from any folder.
+    inventory_path = os.path.join(input_dir, INVENTORY_NAME)
+    inventory_df = inventory_df.assign(Path=inventory_df['Path'].map(os.path.abspath))
+    inventory_df.to_csv(f'{inventory_path}.tmp', index=False)
+    os.replace(f'{inventory_path}.tmp', inventory_path)
+    if scan_time is not None:
+        os.utime(inventory_path, (scan_time, scan_time))
+    return inventory_path
+
+
+def scan_inventory(input_dir, workers=1):
+    """Make the inventory of every folder at the accession level, using one listing of each folder
+
+    os.scandir() gets if each item is a folder with the listing, so every item does not need to be checked separately,
+    which is slow over the network.
+    Files and folders at each level which are not part of the expected structure are skipped.
+    With more than one worker, that many folders at the accession level are listed at the same time by threads,
+    and the rows are still in the same order as with one worker.
+
+    @:parameter
+    input_dir (string): the path to the folder containing the status folders (script argument)
+    workers (integer): the number of folders at the accession level to list at the same time
+
+    @:returns
+    inventory_df (Pandas dataframe): one row for every folder at the accession level,
+                                     with the columns in INVENTORY_COLUMNS, in the order the folders are listed
+    """
+
+    # Navigates the status and collection folders to find every folder at the accession level.
+    folder_list = []
+    with os.scandir(input_dir) as statuses:
+        status_entries = [entry for entry in statuses if entry.name in STATUS_FOLDERS and entry.is_dir()]
+    for status in status_entries:
+        with os.scandir(status.path) as collections:
+            collection_entries = [entry for entry in collections if entry.is_dir()]
+        for collection in collection_entries:
+            with os.scandir(collection.path) as folders:
+                folder_list.extend((status.name, collection.name, entry) for entry in folders if entry.is_dir())
+
+    # Makes a record for each folder at the accession level, one at a time or at the same time.
+    # map() returns the records in the order of folder_list.
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            records = list(executor.map(lambda folder: accession_record(*folder), folder_list))
+    else:
+        records = [accession_record(*folder) for folder in folder_list]
+
+    # Makes the dataframe, with every column the expected data type, even if there are no folders.
+    inventory_df = pd.DataFrame(records, columns=list(INVENTORY_COLUMNS)).astype(INVENTORY_COLUMNS)
+    return inventory_df
+
+
+if __name__ == '__main__':
+
+    # Gets the path to the input_directory with the folders to be inventoried from the script argument.
+    # Exits the script if it is missing or is not a folder.
+    if len(sys.argv) != 2 or not os.path.isdir(sys.argv[1]):
+        print('Provide one argument, input_directory, which is the folder containing the status folders')
+        sys.exit(1)
+    input_directory = sys.argv[1]
+
+    # Makes the inventory and saves it to the input_directory, where the other scripts will find it,
+    # with the time the scan started so anything that changes during the scan is checked again when it is used.
+    started = time.time()
+    inventory = scan_inventory(input_directory)
+    saved_path = save_inventory(input_directory, inventory, started)
+    print(f'Inventoried {len(inventory.index)} folders at the accession level. See {saved_path}.')
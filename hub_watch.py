@@ -0,0 +1,469 @@
+"""Watches a department folder and updates a report for each accession that is new or has changed
+
+Instead of running the monitoring scripts on everything, the watcher checks only the accessions that changed:
+- Completeness (same as accession_completeness_report.py)
+- Bag check, which compares the bag Payload-Oxum to the files without calculating checksums (not full validation)
+- Summary data (same as the accession report from collection_summary.py)
+
+On Linux, if inotify_simple is installed, the operating system reports changes to the accession folders.
+Otherwise, including for network shares (SMB) where those reports are not available,
+the folders are checked for changes every POLL_SECONDS.
+The watcher runs until it is stopped with Ctrl+C.
+
+Parameter:
+    input_directory (required): the directory with the folders to be watched,
+                                which must be the directory containing the status folders ("born-digital")
+
+Returns:
+    hub_watch_report.csv, saved in input_directory and updated each time accessions change
+    If there is a catalog (see hub_catalog.py), the completeness and risk counts for changed accessions are added to it
+"""
+import bagit
+from datetime import datetime
+import os
+import pandas as pd
+import sys
+import time
+from accession_completeness_report import check_completeness
+from collection_summary import get_accession_data
+from hub_catalog import catalog_time, save_catalog_rows
+from hub_inventory import accession_record, scan_inventory
+from validate_fixity import check_argument
+
+# inotify_simple is optional and only works on Linux.
+# If it is not installed, the folders are checked every POLL_SECONDS.
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+# Seconds between checking the folders for changes, if inotify is not used.
+POLL_SECONDS = 300
+
+# Seconds with no changes to wait for after a change is found, so a copy that is still in progress is checked when done.
+SETTLE_SECONDS = 30
+
+# Columns in the watch report, in the order of the rows from update_accession().
+WATCH_COLUMNS = ['Status', 'Collection', 'Accession', 'Path', 'Checked', 'Preservation_Log', 'Preservation_Log_Format',
+                 'Full_Risk', 'Initial_Manifest', 'Bag', 'Bag_Check', 'Date', 'GB', 'Files', 'No_Match_Risk',
+                 'High_Risk', 'Moderate_Risk', 'Low_Risk', 'Notes', 'Size_Error']
+
+# Name of the watch report saved in the input_directory.
+WATCH_REPORT_NAME = 'hub_watch_report.csv'
+
+
+def changed_accessions(previous, current):
+    """Find the accessions that are new or have changed since the last check
+
+    @:parameter
+    previous (dictionary): keys are accession paths and values are from folder_state(), from the last check
+    current (dictionary): keys are accession paths and values are from folder_state(), from this check
+
+    @:returns
+    changed_list (list): paths to the accessions that are new or changed, in the order of current
+    """
+    changed_list = [path for path, state in current.items() if previous.get(path) != state]
+    return changed_list
+
+
+def check_bag(acc_path, bag_type):
+    """Check that the bag has the files and size in its Payload-Oxum, without calculating checksums
+
+    This is much faster than validating the bag and finds most problems, like files that are missing or added.
+    Run validate_fixity.py for full validation.
+
+    @:parameter
+    acc_path (string): the path to the accession folder
+    bag_type (string): the bag type from the Hub inventory (Bag, Multiple_Bags, Zipped_Bag, Zip, or blank)
+
+    @:returns
+    check_result (string): "Payload-Oxum matches", an error message, or why the bag was not checked
+    """
+    # Only bags can be checked this way.
+    if bag_type == 'Multiple_Bags':
+        return 'Validate separately'
+    elif bag_type == 'Zip':
+        return 'Zip, not checked'
+    elif bag_type not in ('Bag', 'Zipped_Bag'):
+        return 'No fixity information'
+
+    # Checks the bag with bagit's fast validation, which only compares the Payload-Oxum to the files.
+    bag_name = f'{os.path.basename(acc_path)}_bag' if bag_type == 'Bag' else f'{os.path.basename(acc_path)}_zipped_bag'
+    try:
+        bagit.Bag(os.path.join(acc_path, bag_name)).validate(fast=True)
+        check_result = 'Payload-Oxum matches'
+    except bagit.BagValidationError as errors:
+        check_result = str(errors)
+    except bagit.BagError as error:
+        check_result = f'Cannot read bag: {error}'
+    return check_result
+
+
+def folder_state(acc_path):
+    """Get the information used to tell if an accession folder has changed since the last check
+
+    This is the name, size, and modification time of everything directly in the accession folder,
+    and the modification time of the bag-info.txt and manifest-md5.txt files of a bag,
+    which change when a bag is made or updated. It does not include every file in the bag.
+
+    @:parameter
+    acc_path (string): the path to the accession folder
+
+    @:returns
+    state (tuple): the information, which is equal for two checks if the accession did not change,
+                   or None if the folder cannot be read
+    """
+    try:
+        with os.scandir(acc_path) as contents:
+            items = sorted((item.name, item.stat().st_size, item.stat().st_mtime_ns) for item in contents)
+    except FileNotFoundError:
+        return None
+
+    # Adds the bag metadata files, for any bag in the folder.
+    bag_files = []
+    for name, size, modified in items:
+        if name.endswith(('_bag', '_zipped_bag')):
+            for bag_file in ('bag-info.txt', 'manifest-md5.txt'):
+                try:
+                    bag_files.append((name, bag_file, os.stat(os.path.join(acc_path, name, bag_file)).st_mtime_ns))
+                except FileNotFoundError:
+                    pass
+    state = tuple(items) + tuple(bag_files)
+    return state
+
+
+def inventory_states(input_dir):
+    """Make the inventory and get the state of every accession folder
+
+    @:parameter
+    input_dir (string): the path to the folder containing the status folders (script argument)
+
+    @:returns
+    inventory_df (Pandas dataframe): the accessions in the inventory, from scan_inventory()
+    states (dictionary): keys are accession paths and values are from folder_state()
+    """
+    inventory_df = scan_inventory(input_dir)
+    inventory_df = inventory_df[inventory_df['Is_Accession']].reset_index(drop=True)
+    states = {path: folder_state(path) for path in inventory_df['Path']}
+    return inventory_df, states
+
+
+def report_changes(report_path, states):
+    """Find the accessions that are new, changed, or deleted since they were added to an existing watch report
+
+    Used when the watcher starts, for changes made while it was stopped.
+    An accession changed if the accession folder or anything in its state was modified after the time in Checked,
+    which is to the minute, so an accession changed in the same minute it was checked is updated again.
+
+    @:parameter
+    report_path (string): the path to the watch report
+    states (dictionary): keys are accession paths and values are from folder_state(), from the current inventory
+
+    @:returns
+    changed_list (list): paths to the accessions that are not in the report or changed since they were checked,
+                         in the order of states
+    removed_list (list): paths to the accessions in the report that are no longer in the inventory
+    """
+    report_df = pd.read_csv(report_path, dtype=object, keep_default_na=False, usecols=['Path', 'Checked'])
+    checked = dict(zip(report_df['Path'], report_df['Checked']))
+    removed_list = [path for path in report_df['Path'] if path not in states]
+
+    # The latest modification time is the accession folder, for files that were deleted,
+    # or any file or bag metadata file in the state, which is the last value in each tuple.
+    changed_list = []
+    for acc_path, state in states.items():
+        if acc_path not in checked or state is None:
+            changed_list.append(acc_path)
+            continue
+        checked_ns = datetime.strptime(checked[acc_path], '%Y-%m-%d %H:%M').timestamp() * 1_000_000_000
+        latest_ns = max([os.stat(acc_path).st_mtime_ns] + [item[-1] for item in state])
+        if latest_ns >= checked_ns:
+            changed_list.append(acc_path)
+    return changed_list, removed_list
+
+
+def rescan_accessions(inventory_df, states, changed_set):
+    """Update the inventory and state for only the accessions with a change reported by inotify
+
+    @:parameter
+    inventory_df (Pandas dataframe): the accessions in the inventory, from inventory_states()
+    states (dictionary): keys are accession paths and values are from folder_state(), from the last check
+    changed_set (set): paths to the accessions with a change, from wait_for_change()
+
+    @:returns
+    inventory_df (Pandas dataframe): the accessions in the inventory, with new rows for the changed accessions
+    new_states (dictionary): keys are accession paths and values are from folder_state(), for this check
+    """
+    inventory_df = inventory_df.copy()
+    new_states = dict(states)
+    for acc_path in changed_set:
+        # Lists the collection folder to get the folder information needed for the inventory.
+        row_index = inventory_df.index[inventory_df['Path'] == acc_path][0]
+        with os.scandir(os.path.dirname(acc_path)) as folders:
+            entry = next((folder for folder in folders if folder.path == acc_path), None)
+        # Removes an accession folder that was deleted or renamed. A renamed folder is new in the collection folder,
+        # which is a change that needs every accession to be checked.
+        if entry is None:
+            inventory_df = inventory_df.drop(row_index)
+            new_states.pop(acc_path, None)
+            continue
+        record = accession_record(inventory_df.loc[row_index, 'Status'], inventory_df.loc[row_index, 'Collection'],
+                                  entry)
+        inventory_df.loc[row_index] = record
+        new_states[acc_path] = folder_state(acc_path)
+    inventory_df = inventory_df.reset_index(drop=True)
+    return inventory_df, new_states
+
+
+def save_watch_report(report_path, rows, removed_list=()):
+    """Add rows for changed accessions to the watch report, replacing any earlier rows for those accessions
+
+    It is first saved with a temporary name and only renamed once it is complete,
+    so the report is never partly saved if the watcher is stopped.
+
+    @:parameter
+    report_path (string): the path to the watch report
+    rows (list): the lists from update_accession() for every accession that changed
+    removed_list (list, tuple): paths to accessions that no longer exist, which are removed from the report
+
+    @:returns
+    report_df (Pandas dataframe): the updated watch report, sorted by status, collection, and accession
+    """
+    # Blanks are the same in new rows and rows read from the report, instead of None becoming "None" as text.
+    new_df = pd.DataFrame(rows, columns=WATCH_COLUMNS).fillna('')
+    if os.path.exists(report_path):
+        report_df = pd.read_csv(report_path, dtype=object, keep_default_na=False)
+        report_df = report_df[~report_df['Path'].isin(new_df['Path']) & ~report_df['Path'].isin(removed_list)]
+        report_df = pd.concat([report_df, new_df.astype(str)], ignore_index=True)
+    else:
+        report_df = new_df
+    report_df = report_df.sort_values(['Status', 'Collection', 'Accession'], ignore_index=True)
+    report_df.to_csv(f'{report_path}.tmp', index=False)
+    os.replace(f'{report_path}.tmp', report_path)
+    return report_df
+
+
+def settle_accessions(inventory_df, states, changed_list):
+    """Wait until the accessions that changed stop changing, such as when an accession is still being copied
+
+    Used when the folders are checked every POLL_SECONDS.
+    With inotify, wait_for_change() waits for changes to stop instead.
+
+    @:parameter
+    inventory_df (Pandas dataframe): the accessions in the inventory, from inventory_states()
+    states (dictionary): keys are accession paths and values are from folder_state(), from this check
+    changed_list (list): paths to the accessions that are new or changed, from changed_accessions()
+
+    @:returns
+    inventory_df (Pandas dataframe): the accessions in the inventory, with new rows for the changed accessions
+    states (dictionary): keys are accession paths and values are from folder_state(), once nothing changed
+                         in SETTLE_SECONDS
+    """
+    # Accessions that were deleted while waiting are not checked again.
+    while True:
+        time.sleep(SETTLE_SECONDS)
+        changed_set = {path for path in changed_list if path in states}
+        inventory_df, new_states = rescan_accessions(inventory_df, states, changed_set)
+        if all(new_states.get(path) == states.get(path) for path in changed_set):
+            return inventory_df, new_states
+        states = new_states
+
+
+def update_accession(input_dir, accession):
+    """Check the completeness and bag of one accession and calculate its summary data
+
+    @:parameter
+    input_dir (string): the path to the folder containing the status folders (script argument)
+    accession (named tuple): the row for the accession from the Hub inventory
+
+    @:returns
+    row (list): the values for each column in WATCH_COLUMNS
+    """
+    completeness = check_completeness(accession.Path)
+    bag_check = check_bag(accession.Path, accession.Bag_Type)
+    summary = get_accession_data(input_dir, accession.Status, accession.Collection, accession.Accession)
+    row = ([accession.Status, accession.Collection, accession.Accession, accession.Path,
+            datetime.now().strftime('%Y-%m-%d %H:%M')] + list(completeness.values()) + [bag_check] + summary[3:])
+    return row
+
+
+def update_changed(input_dir, inventory_df, changed_list):
+    """Update the watch report and catalog for the accessions that changed
+
+    @:parameter
+    input_dir (string): the path to the folder containing the status folders (script argument)
+    inventory_df (Pandas dataframe): the accessions in the inventory, from inventory_states()
+    changed_list (list): paths to the accessions that are new or changed, from changed_accessions()
+
+    @:returns
+    error_list (list): paths to the accessions that could not be updated, such as a bag that is still being copied,
+                       which are not in the watch report so they can be updated after the next change
+    """
+    # An error for one accession is printed and the rest are still updated, so the watcher keeps running.
+    rows = []
+    error_list = []
+    for accession in inventory_df[inventory_df['Path'].isin(changed_list)].itertuples():
+        print('Updating accession', accession.Path)
+        try:
+            rows.append(update_accession(input_dir, accession))
+        except (bagit.BagError, KeyError, OSError, ValueError) as error:
+            print(f'Cannot update accession {accession.Path}, will try again after the next change: {error}')
+            error_list.append(accession.Path)
+    if len(rows) == 0:
+        return error_list
+    save_watch_report(os.path.join(input_dir, WATCH_REPORT_NAME), rows)
+
+    # Adds the completeness and risk counts to the catalog, if there is one (see hub_catalog.py).
+    checked = catalog_time()
+    save_catalog_rows('completeness', [[row[3], checked] + row[5:10] for row in rows])
+    save_catalog_rows('risk_count', [[row[3], checked] + [int(count) for count in row[14:18]] for row in rows])
+    return error_list
+
+
+def wait_for_change(inotify, watches):
+    """Wait until inotify reports a change in the watched folders, or POLL_SECONDS passes
+
+    If inotify is not available, waits POLL_SECONDS.
+    The same inotify instance is used the whole time the watcher runs, so changes made while accessions are updated
+    are reported the next time this runs.
+
+    @:parameter
+    inotify (INotify, None): the inotify instance with watches from watch_folders(), or None if it is not available
+    watches (dictionary): keys are watch descriptors and values are the folder path and its accession path (or None),
+                          from watch_folders(). Watches for folders that were deleted are removed.
+
+    @:returns
+    changed_set (set, None): paths to the accessions with a change reported by inotify,
+                             or None if every accession needs to be checked, because inotify is not available,
+                             there was a change in a status or collection folder (like a new accession),
+                             or no change was reported in POLL_SECONDS
+    """
+    if inotify is None:
+        time.sleep(POLL_SECONDS)
+        return None
+
+    # Waits for the first change, and then for changes to stop for SETTLE_SECONDS,
+    # since copying an accession makes many changes.
+    events = inotify.read(timeout=POLL_SECONDS * 1000)
+    if not events:
+        return None
+    while True:
+        more_events = inotify.read(timeout=SETTLE_SECONDS * 1000)
+        if not more_events:
+            break
+        events.extend(more_events)
+
+    # Gets the accession for each change, or None if every accession needs to be checked.
+    # inotify removes the watch for a folder that was deleted, so it is removed from watches as well.
+    changed_set = {watches[event.wd][1] if event.wd in watches else None for event in events}
+    for event in events:
+        if event.mask & flags.IGNORED:
+            watches.pop(event.wd, None)
+    if None in changed_set:
+        return None
+    return changed_set
+
+
+def watch_folders(inotify, input_dir, inventory_df, watches, failed_set):
+    """Add an inotify watch for every folder that is not watched yet
+
+    Every accession folder and the bags in it are watched, each for changes to that accession,
+    and the status and collection folders, for changes that need every accession to be checked.
+    inotify does not watch the folders within a folder, so each folder is watched separately.
+    A folder that cannot be watched, such as when the limit for watches is reached, is printed the first time,
+    and changes to it are found when every accession is checked after POLL_SECONDS with no changes.
+    It is tried again each time.
+
+    @:parameter
+    inotify (INotify): the inotify instance
+    input_dir (string): the path to the folder containing the status folders (script argument)
+    inventory_df (Pandas dataframe): the accessions in the inventory, from inventory_states()
+    watches (dictionary): keys are watch descriptors and values are the folder path and its accession path (or None),
+                          which is updated with the new watches
+    failed_set (set): paths to the folders that could not be watched, which is updated
+
+    @:returns
+    None
+    """
+    # Makes a list of the folders to watch, with the accession path for changes to one accession.
+    folders = {}
+    for acc_path in inventory_df['Path']:
+        folders[acc_path] = acc_path
+        for bag_name in (f'{os.path.basename(acc_path)}_bag', f'{os.path.basename(acc_path)}_zipped_bag'):
+            if os.path.isdir(os.path.join(acc_path, bag_name)):
+                folders[os.path.join(acc_path, bag_name)] = acc_path
+    for acc_path in inventory_df['Path']:
+        folders[os.path.dirname(acc_path)] = None
+    for status in inventory_df['Status'].unique():
+        folders[os.path.join(input_dir, status)] = None
+
+    # Adds a watch for each folder that is not already watched.
+    watched = {folder for folder, acc_path in watches.values()}
+    watch_flags = flags.CREATE | flags.DELETE | flags.MODIFY | flags.MOVED_FROM | flags.MOVED_TO | flags.CLOSE_WRITE
+    for folder, acc_path in folders.items():
+        if folder in watched:
+            continue
+        try:
+            watches[inotify.add_watch(folder, watch_flags)] = (folder, acc_path)
+            failed_set.discard(folder)
+        except OSError as error:
+            if folder not in failed_set:
+                print(f'Cannot watch {folder}, will check it every {POLL_SECONDS} seconds with no changes: {error}')
+                failed_set.add(folder)
+
+
+if __name__ == '__main__':
+
+    # Gets the path to the input_directory with the folders to be watched from the script argument.
+    # Exits the script if there is an error.
+    input_directory, error = check_argument(sys.argv)
+    if error:
+        print(error)
+        sys.exit(1)
+
+    # Gets the current state of every accession.
+    # If there is no watch report yet, every accession is added to it first.
+    # Otherwise, accessions that are new or changed since the report was updated are updated,
+    # and accessions that were deleted while the watcher was stopped are removed from the report.
+    # An accession that could not be updated is removed from the states, so it is updated after the next change.
+    inventory, accession_states = inventory_states(input_directory)
+    report = os.path.join(input_directory, WATCH_REPORT_NAME)
+    if os.path.exists(report):
+        start_changes, start_removed = report_changes(report, accession_states)
+        if start_removed:
+            save_watch_report(report, [], start_removed)
+    else:
+        start_changes = list(accession_states)
+    for error_path in update_changed(input_directory, inventory, start_changes):
+        accession_states.pop(error_path, None)
+    print(f'Watching {len(accession_states)} accessions', '(inotify)' if INotify else f'(every {POLL_SECONDS} seconds)')
+
+    # Updates the report for any accessions that are new or changed, until the script is stopped.
+    # Only the folders at the accession level and the files directly in each accession are checked for changes,
+    # and if inotify reported which accessions changed, only those accessions are checked.
+    # Without inotify, accessions that changed are only updated once they stop changing.
+    # The inotify instance is kept the whole time, so no changes are missed while accessions are updated,
+    # and watches are added for new folders each time.
+    inotify = INotify() if INotify else None
+    inotify_watches = {}
+    failed_watches = set()
+    try:
+        while True:
+            if inotify:
+                watch_folders(inotify, input_directory, inventory, inotify_watches, failed_watches)
+            changed_folders = wait_for_change(inotify, inotify_watches)
+            if changed_folders is None:
+                inventory, new_states = inventory_states(input_directory)
+            else:
+                inventory, new_states = rescan_accessions(inventory, accession_states, changed_folders)
+            changed_list = changed_accessions(accession_states, new_states)
+            if inotify is None and changed_list:
+                inventory, new_states = settle_accessions(inventory, new_states, changed_list)
+            for error_path in update_changed(input_directory, inventory, changed_list):
+                new_states.pop(error_path, None)
+            accession_states = new_states
+    except KeyboardInterrupt:
+        print('\nStopped watching')
+    finally:
+        if inotify:
+            inotify.close()
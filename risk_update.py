@@ -8,12 +8,55 @@ Parameters:
 Returns:
     New risk spreadsheet is added to each accession folder
     Log of all accessions (with collection and accession number) and if a new risk csv was made in the input_directory
+    Report of the number of files in each accession with a different NARA risk level or match type than before,
+    and a summary of those changes for every accession combined, in the input_directory
+    Cache of the NARA spreadsheet (NARA_CSV_NAME_cache.pkl) in the same folder as the NARA spreadsheet
+    If pyarrow is installed, a Parquet copy of each new risk spreadsheet with the same name
+    If there is a catalog (see hub_catalog.py), every new risk spreadsheet is added to it
 """
 from datetime import date, datetime
+import hashlib
+import io
+import numpy as np
 import os
 import pandas as pd
+import pickle
 import re
 import sys
+import time
+from hub_catalog import CATALOG_BATCH_ROWS, catalog_time, save_catalog_rows
+from hub_inventory import folder_files
+
+# pyarrow is optional. If it is installed, a Parquet copy (sidecar) is saved with each new risk csv and report,
+# which is faster to read and smaller than the csv. The csv is always saved for archivists to use.
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# Columns with FITS format information, which are the first 13 columns of every risk CSV.
+FITS_COLUMNS = ['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_PUID', 'FITS_Identifying_Tool(s)',
+                'FITS_Multiple_IDs', 'FITS_Date_Last_Modified', 'FITS_Size_KB', 'FITS_MD5',
+                'FITS_Creating_Application', 'FITS_Valid', 'FITS_Well-Formed', 'FITS_Status_Message']
+
+# Risk CSVs larger than STREAMING_BYTES are updated CHUNK_ROWS rows at a time by update_risk_csv_chunks(),
+# so the memory used does not depend on the size of the accession.
+STREAMING_BYTES = 250000000
+CHUNK_ROWS = 100000
+
+# Rows for the update risk log that are not saved yet and when the log was last saved.
+# update_log() saves the rows every LOG_FLUSH_SECONDS, instead of opening the log once per accession.
+LOG_FLUSH_SECONDS = 60
+log_rows = []
+log_last_saved = None
+
+# Data types for risk CSV columns with a small number of values repeated for many files.
+# Reading them as categories instead of strings uses much less memory and is faster on large risk CSVs.
+RISK_CSV_CATEGORIES = {'FITS_Format_Name': 'category', 'FITS_Format_Version': 'category', 'FITS_PUID': 'category',
+                       'FITS_Identifying_Tool(s)': 'category', 'FITS_Multiple_IDs': 'category',
+                       'FITS_Creating_Application': 'category', 'FITS_Valid': 'category',
+                       'FITS_Well-Formed': 'category', 'NARA_Risk_Level': 'category',
+                       'NARA_Match_Type': 'category'}
 
 
 def accession_test(acc_id, acc_path):
@@ -94,6 +137,54 @@ def check_arguments(argument_list):
     return dir_path, nara_path, errors
 
 
+def fill_no_value(risk_df):
+    """Fill blanks in the FITS columns of a risk dataframe with NO VALUE
+
+    This matches the formatting expected by match_nara_risk.
+    Category columns need NO VALUE added as a category before it can be used to fill blanks.
+
+    @:parameter
+    risk_df (pandas DataFrame): dataframe with FITS format information columns from a risk csv
+
+    @:returns
+    None. The blanks in risk_df are filled.
+    """
+    for column in risk_df.select_dtypes('category').columns:
+        if 'NO VALUE' not in risk_df[column].cat.categories:
+            risk_df[column] = risk_df[column].cat.add_categories('NO VALUE')
+    risk_df.fillna('NO VALUE', inplace=True)
+
+
+def flush_log(log_dir):
+    """Save the rows for the update risk log that are waiting in log_rows
+
+    If the log doesn't exist yet, it is made with a header row.
+
+    @:parameter
+    log_dir (string): the path to the directory for saving the log (script argument input_directory)
+
+    @:returns
+    None. Makes or updates the log.
+    """
+    global log_last_saved
+
+    # Nothing to save, for example if the input_directory has no accessions.
+    if not log_rows:
+        return
+
+    today = datetime.today().strftime('%Y-%m-%d')
+    log_path = os.path.join(log_dir, f"update_risk_log_{today}.csv")
+    if not os.path.exists(log_path):
+        with open(log_path, 'w') as f:
+            f.write('Collection,Accession,Risk_Updated\n')
+
+    # Adds every waiting row to the log at once.
+    with open(log_path, 'a') as f:
+        f.writelines(log_rows)
+    log_rows.clear()
+    log_last_saved = time.monotonic()
+
+
 def match_nara_risk(risk_df, nara_df):
     """Match format identifications to NARA's Preservation Action Plan spreadsheet
 
@@ -120,14 +211,12 @@ def match_nara_risk(risk_df, nara_df):
     risk_df['name_version'] = risk_df['FITS_Format_Name'].str.lower() + ' ' + risk_df['version_string']
     risk_df['name_version'] = risk_df['name_version'].str.replace(' NO VALUE', '')
 
-    # Makes lowercase versions of FITS and NARA format names for case-insensitive matching.
+    # Makes a lowercase version of the FITS format name for case-insensitive matching.
     risk_df['name_lower'] = risk_df['FITS_Format_Name'].str.lower()
-    nara_df['nara_format_lower'] = nara_df['NARA_Format_Name'].str.lower()
 
-    # Makes a column with the NARA version, since FITS has that in a separate column.
-    # The version is assumed to be anything after the last space in the format name, the most common pattern.
-    # For ones that don't actually end in a version, it gets the last word, which does not interfere with matching.
-    nara_df['nara_version'] = nara_df['NARA_Format_Name'].str.split(' ').str[-1]
+    # Adds the NARA lowercase name and version columns, unless they were already made by read_nara_cache().
+    if 'nara_format_lower' not in nara_df.columns:
+        nara_match_columns(nara_df)
 
     # List of columns in the NARA dataframe used for matching or that should be in the final result.
     nara_columns = ['NARA_Format_Name', 'NARA_File_Extensions', 'NARA_PRONOM_URL', 'NARA_Risk_Level',
@@ -243,8 +332,8 @@ def most_recent_risk_csv(file_list):
     # Tests each file in the file list looking for the most recent one, based on the date in the file name.
     for file_name in file_list:
 
-        # Skips files that are not risk spreadsheets, like the preservation log.
-        if not('full_risk_data' in file_name):
+        # Skips files that are not risk spreadsheets, like the preservation log or the Parquet copy of a risk csv.
+        if not ('full_risk_data' in file_name and file_name.endswith('.csv')):
             continue
 
         # Extracts the date from the risk spreadsheet file name, if it has one. If it doesn't, assigns 1900-01-01
@@ -265,6 +354,146 @@ def most_recent_risk_csv(file_list):
     return most_recent_file
 
 
+def nara_match_columns(nara_df):
+    """Add the temporary columns used for matching to the NARA dataframe
+
+    These are made once for the NARA spreadsheet, instead of once per accession, when read_nara_cache() is used.
+
+    @:parameter
+    nara_df (Pandas dataframe): a dataframe with the select columns from the NARA Preservation Action Plan spreadsheet
+
+    @:returns
+    None. The columns nara_format_lower and nara_version are added to nara_df.
+    """
+
+    # Makes a lowercase version of the NARA format name for case-insensitive matching.
+    nara_df['nara_format_lower'] = nara_df['NARA_Format_Name'].str.lower()
+
+    # Makes a column with the NARA version, since FITS has that in a separate column.
+    # The version is assumed to be anything after the last space in the format name, the most common pattern.
+    # For ones that don't actually end in a version, it gets the last word, which does not interfere with matching.
+    nara_df['nara_version'] = nara_df['NARA_Format_Name'].str.split(' ').str[-1]
+
+
+def new_risk_csv_paths(accession_path):
+    """Calculate the path for the new risk spreadsheet and the temporary path it is saved to while being made
+
+    The temporary file name does not include full_risk_data,
+    so it is not mistaken for a risk spreadsheet by this or other scripts if the script is interrupted.
+
+    @:parameter
+    accession_path (string): path to the accession folder, which is the folder that contains the risk csv(s).
+
+    @:returns
+    update_csv_path (string): path to the new risk spreadsheet, accession_full_risk_data_date.csv
+    temp_csv_path (string): path to the temporary file, accession_risk_update_in_progress.tmp
+    """
+    accession_number = os.path.basename(accession_path)
+    today = datetime.today().strftime('%Y-%m-%d')
+    update_csv_path = os.path.join(accession_path, f'{accession_number}_full_risk_data_{today}.csv')
+    temp_csv_path = os.path.join(accession_path, f'{accession_number}_risk_update_in_progress.tmp')
+    return update_csv_path, temp_csv_path
+
+
+def parquet_df(data, column_types):
+    """Convert data read from a Parquet file to a dataframe with the same data types as reading the csv
+
+    @:parameter
+    data (pyarrow Table, pyarrow RecordBatch): the data read from the Parquet file
+    column_types (dictionary): the data type for each column
+
+    @:returns
+    df (pandas DataFrame): dataframe with the data, where blanks are NaN like they are when reading a csv
+    """
+    df = data.to_pandas(ignore_metadata=True).fillna(np.nan)
+    df = df.astype({column: column_type for column, column_type in column_types.items() if column in df.columns})
+    return df
+
+
+def parquet_path(csv_path):
+    """Make the path for the Parquet copy (sidecar) of a csv, which is the same path with the extension .parquet
+
+    @:parameter
+    csv_path (string): path to a csv
+
+    @:returns
+    sidecar_path (string): path to the Parquet copy of the csv
+    """
+    sidecar_path = f'{os.path.splitext(csv_path)[0]}.parquet'
+    return sidecar_path
+
+
+def preferred_path(csv_path):
+    """Get the path to read for a csv, which is the Parquet copy if there is one that can be used
+
+    The Parquet copy is only used if pyarrow is installed
+    and the Parquet copy is at least as new as the csv, so edits made to the csv are not ignored.
+
+    Also used by format_list.py.
+
+    @:parameter
+    csv_path (string): path to a csv
+
+    @:returns
+    read_path (string): path to the Parquet copy of the csv, or the csv path if the Parquet copy cannot be used
+    """
+    sidecar_path = parquet_path(csv_path)
+    if pq is not None and os.path.exists(sidecar_path):
+        if os.path.getmtime(sidecar_path) >= os.path.getmtime(csv_path):
+            return sidecar_path
+    return csv_path
+
+
+def read_nara_cache(nara_csv_path):
+    """Read the NARA Preservation Action Plan spreadsheet from a binary cache, making the cache if needed
+
+    The cache is a pickle file saved next to the NARA spreadsheet, named NARA_CSV_NAME_cache.pkl.
+    It has the MD5 of the NARA spreadsheet it was made from and the dataframe from read_nara_csv(),
+    with the temporary columns used for matching already added.
+    If the cache is missing, or the NARA spreadsheet has changed since it was made, the cache is remade.
+
+    @:parameter
+    nara_csv_path (string): path to the NARA spreadsheet, which is a script argument
+
+    @:returns
+    nara_df (pandas DataFrame): dataframe with the select columns from the NARA spreadsheet and the match columns
+    or raises a KeyError if the select columns are not present
+    """
+
+    # Calculates the MD5 of the NARA spreadsheet, to know if the cache was made from this version of the spreadsheet.
+    md5 = hashlib.md5()
+    with open(nara_csv_path, 'rb') as open_file:
+        for block in iter(lambda: open_file.read(1048576), b''):
+            md5.update(block)
+    nara_md5 = md5.hexdigest()
+
+    # If there is a cache made from this version of the NARA spreadsheet, returns the dataframe from the cache.
+    # A cache that cannot be read is treated the same as a missing cache. This includes a corrupt cache
+    # (UnpicklingError, EOFError) and a cache made with a different version of pandas (AttributeError, ImportError).
+    cache_path = f'{os.path.splitext(nara_csv_path)[0]}_cache.pkl'
+    if os.path.exists(cache_path):
+        try:
+            cache = pd.read_pickle(cache_path)
+            if cache['md5'] == nara_md5:
+                return cache['nara_df']
+        except (OSError, KeyError, TypeError, ValueError, EOFError, AttributeError, ImportError,
+                pickle.UnpicklingError):
+            pass
+
+    # Otherwise, reads the NARA spreadsheet and adds the match columns.
+    nara_df = read_nara_csv(nara_csv_path)
+    nara_match_columns(nara_df)
+
+    # Saves the cache for future runs.
+    # If the cache cannot be saved, for example because of folder permissions, the dataframe is still used.
+    try:
+        pd.to_pickle({'md5': nara_md5, 'nara_df': nara_df}, cache_path)
+    except OSError:
+        print(f'Could not save the NARA cache to {cache_path}')
+
+    return nara_df
+
+
 def read_nara_csv(nara_csv_path):
     """Read select columns from the NARA Preservation Action Plan spreadsheet into a dataframe and rename
 
@@ -294,6 +523,72 @@ def read_nara_csv(nara_csv_path):
     return nara_df
 
 
+def read_risk_columns(risk_csv_path, columns, dtypes=None, chunksize=None):
+    """Read select columns from a risk CSV into a dataframe
+
+    Only the columns in the list are parsed, which is faster and uses less memory than reading every column.
+    Older risk CSVs have the column NARA_Risk Level, which is read and renamed NARA_Risk_Level if that is requested.
+    If there is a Parquet copy of the risk CSV that can be used (see preferred_path()), it is read instead.
+
+    Also used by collection_summary.py and format_list.py.
+
+    @:parameter
+    risk_csv_path (string, file object): path to a risk csv, or a file object with risk csv or Parquet data
+    columns (list): the names of the columns to read
+    dtypes (dictionary, None): data type for any of the columns that should not be read as type object
+    chunksize (integer, None): the number of rows to read at a time, or None to read the whole csv at once
+
+    @:returns
+    df (pandas DataFrame): dataframe with the columns, in the order they are in the risk csv
+    or an iterator of dataframes with chunksize rows each if chunksize is not None
+    """
+    # Includes the older name for the risk level column, so either name is read.
+    legacy_names = {'NARA_Risk Level': 'NARA_Risk_Level'}
+    read_columns = set(columns)
+    for old_name, new_name in legacy_names.items():
+        if new_name in read_columns:
+            read_columns.add(old_name)
+
+    # Every column is type object unless there is a different type in dtypes,
+    # so blank columns are not interpreted as floats, which causes type errors during merges.
+    column_types = dict.fromkeys(read_columns, object)
+    if dtypes:
+        for column, column_type in dtypes.items():
+            column_types[column] = column_type
+            for old_name, new_name in legacy_names.items():
+                if column == new_name:
+                    column_types[old_name] = column_type
+
+    # Reads the Parquet copy of the csv instead, if there is one that can be used,
+    # or Parquet data from a file object, such as one made by format_list.py.
+    # The columns are given the same data types as the csv, so the result does not depend on which is read.
+    if isinstance(risk_csv_path, str):
+        risk_csv_path = preferred_path(risk_csv_path)
+        is_parquet = risk_csv_path.endswith('.parquet')
+    else:
+        is_parquet = risk_csv_path.read(4) == b'PAR1'
+        risk_csv_path.seek(0)
+    if is_parquet:
+        parquet_file = pq.ParquetFile(risk_csv_path)
+        read_list = [column for column in parquet_file.schema_arrow.names if column in read_columns]
+        if chunksize:
+            batches = parquet_file.iter_batches(batch_size=chunksize, columns=read_list)
+            return (parquet_df(batch, column_types).rename(columns=legacy_names) for batch in batches)
+        df = parquet_df(parquet_file.read(columns=read_list), column_types)
+        df = df.rename(columns=legacy_names)
+        return df
+
+    # Returns chunks as they are read if there is a chunksize, so the full csv is never in memory.
+    if chunksize:
+        reader = pd.read_csv(risk_csv_path, usecols=lambda column: column in read_columns, dtype=column_types,
+                             chunksize=chunksize)
+        return (chunk.rename(columns=legacy_names) for chunk in reader)
+
+    df = pd.read_csv(risk_csv_path, usecols=lambda column: column in read_columns, dtype=column_types)
+    df = df.rename(columns=legacy_names)
+    return df
+
+
 def read_risk_csv(risk_csv_path):
     """Read the FITS format identification columns from the risk CSV into a dataframe
 
@@ -303,25 +598,224 @@ def read_risk_csv(risk_csv_path):
     @:returns
     risk_df (pandas Dataframe): dataframe with all FITS formation information columns from the risk CSV
     """
-    # Reads the risk csv into a dataframe.
-    # Specifies dtype=object so blank columns are not interpreted as floats, which causes type errors during merges.
-    df = pd.read_csv(risk_csv_path, dtype=object)
-
-    # Makes a second dataframe without the older NARA information.
-    risk_df = df.loc[:, 'FITS_File_Path':'FITS_Status_Message'].copy()
+    # Reads the FITS columns from the risk csv into a dataframe, without the older NARA information.
+    risk_df = read_risk_columns(risk_csv_path, FITS_COLUMNS, RISK_CSV_CATEGORIES)
 
     # Blanks are fill with NO VALUE to match the formatting expected by match_nara_risk,
     # a function used by other scripts as well.
-    risk_df.fillna('NO VALUE', inplace=True)
+    fill_no_value(risk_df)
+
+    return risk_df
+
+
+def risk_by_file(risk_csv_path, chunk_rows=CHUNK_ROWS):
+    """Read the NARA risk level and match type for each file in a risk spreadsheet
+
+    Files with more than one risk level or match type, from multiple format identifications or NARA matches,
+    have every value combined into one string, sorted and separated by a pipe, e.g. "High Risk|Low Risk".
+    File paths are replaced with a 64-bit hash to use less memory when comparing spreadsheets.
+    The spreadsheet is read chunk_rows rows at a time (see risk_pairs()).
 
+    @:parameter
+    risk_csv_path (string): path to a risk csv
+    chunk_rows (integer): the number of rows from the risk csv to read at a time
+
+    @:returns
+    risk_df (pandas DataFrame): dataframe indexed by the file path hash, with NARA_Risk_Level and NARA_Match_Type
+    """
+    columns = ['FITS_File_Path', 'NARA_Risk_Level', 'NARA_Match_Type']
+    pairs = risk_pairs(read_risk_columns(risk_csv_path, columns, chunksize=chunk_rows))
+    risk_df = pd.concat([risk_values(pairs_df, column) for column, pairs_df in pairs.items()], axis=1)
     return risk_df
 
 
+def risk_changes(previous_csv_path, new_csv_path, new_df=None, chunk_rows=CHUNK_ROWS):
+    """Calculate the number of files with a different NARA risk level or match type in the new risk spreadsheet
+
+    The spreadsheets are read chunk_rows rows at a time, keeping only each different pair of file path hash
+    and value (see risk_pairs()), so the memory used is one chunk plus about 9 bytes for each file and value
+    in the two spreadsheets, instead of both spreadsheets.
+    The pairs are joined on the hash and value, and a file changed if any of its pairs is only in one spreadsheet.
+    A file in only one of the spreadsheets has the risk level and match type "Not in CSV" for the other.
+
+    @:parameter
+    previous_csv_path (string): path to the risk csv used to make the new risk csv
+    new_csv_path (string): path to the new risk csv
+    new_df (pandas DataFrame, None): the new risk csv data, if it is already in memory, so the csv is not read again
+    chunk_rows (integer): the number of rows from each risk csv to read at a time
+
+    @:returns
+    changes_df (pandas DataFrame): dataframe with Previous_Risk_Level, New_Risk_Level, Previous_Match_Type,
+                                   New_Match_Type and File_Count, with one row per combination that changed
+    """
+
+    # Gets each different file and value pair in the previous and new risk spreadsheets.
+    columns = ['FITS_File_Path', 'NARA_Risk_Level', 'NARA_Match_Type']
+    previous_pairs = risk_pairs(read_risk_columns(previous_csv_path, columns, chunksize=chunk_rows))
+    if new_df is None:
+        new_pairs = risk_pairs(read_risk_columns(new_csv_path, columns, chunksize=chunk_rows))
+    else:
+        new_pairs = risk_pairs([new_df])
+
+    # Finds the files with a pair that is only in one of the spreadsheets, for either column.
+    # The values use the same categories in both, so they are joined by category code instead of as text.
+    changed_list = []
+    for column in previous_pairs:
+        categories = previous_pairs[column][column].cat.categories.union(new_pairs[column][column].cat.categories)
+        for pairs in (previous_pairs, new_pairs):
+            pairs[column][column] = pairs[column][column].cat.set_categories(categories)
+        joined = previous_pairs[column].merge(new_pairs[column], how='outer', on=['Path_Hash', column], indicator=True)
+        changed_list.append(joined.loc[joined['_merge'] != 'both', 'Path_Hash'].to_numpy())
+    changed = pd.Index(np.concatenate(changed_list)).unique()
+
+    # Gets the previous and new text of each column for only the changed files, and counts the files
+    # for each combination of previous and new values.
+    df = pd.DataFrame(index=changed)
+    for column, previous_name, new_name in (('NARA_Risk_Level', 'Previous_Risk_Level', 'New_Risk_Level'),
+                                            ('NARA_Match_Type', 'Previous_Match_Type', 'New_Match_Type')):
+        for pairs, name in ((previous_pairs, previous_name), (new_pairs, new_name)):
+            column_pairs = pairs[column][pairs[column]['Path_Hash'].isin(changed)]
+            df[name] = risk_values(column_pairs, column).reindex(changed).fillna('Not in CSV')
+    group_list = ['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type']
+    changes_df = df.groupby(group_list).size().reset_index(name='File_Count')
+    changes_df = changes_df.sort_values(group_list, ignore_index=True)
+
+    return changes_df
+
+
+def risk_pairs(risk_chunks):
+    """Get each different pair of file and NARA risk level, and of file and NARA match type, one chunk at a time
+
+    The file paths are replaced with a 64-bit hash and the values are categories,
+    so each pair uses about 9 bytes, no matter how long the paths are or how many chunks there are.
+    Blank values, and a column that is not in the risk csv, are an empty string.
+
+    @:parameter
+    risk_chunks (iterable): dataframes with FITS_File_Path, NARA_Risk_Level, and (if in the risk csv) NARA_Match_Type,
+                            such as the chunks from read_risk_columns()
+
+    @:returns
+    pairs (dictionary): keys are NARA_Risk_Level and NARA_Match_Type,
+                        and values are a dataframe with Path_Hash and that column, with no duplicate rows
+    """
+    chunk_pairs = {'NARA_Risk_Level': [], 'NARA_Match_Type': []}
+    for chunk in risk_chunks:
+        path_hashes = pd.util.hash_array(chunk['FITS_File_Path'].to_numpy(dtype=object))
+        for column in chunk_pairs:
+            if column in chunk.columns:
+                values = chunk[column].astype(object).where(chunk[column].notna(), '').astype(str)
+            else:
+                values = pd.Series('', index=chunk.index)
+            column_df = pd.DataFrame({'Path_Hash': path_hashes, column: pd.Categorical(values)})
+            chunk_pairs[column].append(column_df.drop_duplicates())
+
+    # Combines the chunks, which may have different categories, and removes pairs repeated in different chunks.
+    pairs = {}
+    for column, df_list in chunk_pairs.items():
+        if df_list:
+            path_hashes = np.concatenate([df['Path_Hash'].to_numpy() for df in df_list])
+            values = pd.api.types.union_categoricals([df[column] for df in df_list])
+        else:
+            path_hashes = np.array([], dtype=np.uint64)
+            values = pd.Categorical([])
+        pairs[column] = pd.DataFrame({'Path_Hash': path_hashes, column: values}).drop_duplicates()
+    return pairs
+
+
+def risk_values(pairs_df, column):
+    """Combine the values for each file from risk_pairs() into one string
+
+    @:parameter
+    pairs_df (pandas DataFrame): dataframe with Path_Hash and column, from risk_pairs()
+    column (string): NARA_Risk_Level or NARA_Match_Type
+
+    @:returns
+    Pandas Series: indexed by the file path hash, with the values for each file sorted and separated by a pipe,
+                   e.g. "High Risk|Low Risk"
+    """
+    values = pairs_df[column].astype(str).groupby(pairs_df['Path_Hash']).agg(lambda text: '|'.join(sorted(text)))
+    return values.rename(column)
+
+
+def save_parquet(df, csv_path):
+    """Save a Parquet copy (sidecar) of a dataframe that was saved to a csv, if pyarrow is installed
+
+    It is saved after the csv, so it is at least as new as the csv and will be used by preferred_path().
+    Columns of strings are saved as strings, even if some values look like numbers, to match reading the csv.
+    It is first saved with a temporary name and only renamed once it is complete.
+
+    Also used by collection_summary.py and format_list.py.
+
+    @:parameter
+    df (pandas DataFrame): the dataframe that was saved to the csv
+    csv_path (string): path to the csv
+
+    @:returns
+    sidecar_path (string, None): path to the Parquet copy, or None if pyarrow is not installed
+    """
+    if pq is None:
+        return None
+    sidecar_path = parquet_path(csv_path)
+    object_columns = df.select_dtypes(include='object').columns
+    df.astype({column: 'string' for column in object_columns}).to_parquet(f'{sidecar_path}.tmp', index=False)
+    os.replace(f'{sidecar_path}.tmp', sidecar_path)
+    return sidecar_path
+
+
+def save_risk_change_summary(report_dir, changes_list):
+    """Combine the risk changes for every accession and save to the risk change summary
+
+    @:parameter
+    report_dir (string): the path to the directory for saving the summary (script argument input_directory)
+    changes_list (list): the dataframes from risk_changes() for every accession
+
+    @:returns
+    None. Makes the summary.
+    """
+    group_list = ['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type']
+    if changes_list:
+        summary_df = pd.concat(changes_list).groupby(group_list, as_index=False)['File_Count'].sum()
+    else:
+        summary_df = pd.DataFrame(columns=group_list + ['File_Count'])
+
+    today = datetime.today().strftime('%Y-%m-%d')
+    summary_df.to_csv(os.path.join(report_dir, f'risk_change_summary_{today}.csv'), index=False)
+
+
+def save_risk_changes(report_dir, accession_path, changes_df):
+    """Add the risk changes for an accession to the risk change report
+
+    If the report doesn't exist yet, it is made with a header row.
+    Nothing is added if no files changed.
+
+    @:parameter
+    report_dir (string): the path to the directory for saving the report (script argument input_directory)
+    accession_path (string): path to the accession folder, which is the folder that contains the risk csv(s)
+    changes_df (pandas DataFrame): the risk changes for the accession, from risk_changes()
+
+    @:returns
+    None. Makes or updates the report.
+    """
+
+    # Adds the collection and accession number, which are the last two folders in the accession path.
+    changes_df = changes_df.copy()
+    changes_df.insert(0, 'Collection', os.path.basename(os.path.dirname(accession_path)))
+    changes_df.insert(1, 'Accession', os.path.basename(accession_path))
+
+    today = datetime.today().strftime('%Y-%m-%d')
+    report_path = os.path.join(report_dir, f'risk_change_report_{today}.csv')
+    if not os.path.exists(report_path):
+        changes_df.to_csv(report_path, index=False)
+    elif len(changes_df.index) > 0:
+        changes_df.to_csv(report_path, mode='a', header=False, index=False)
+
+
 def save_risk_csv(accession_path, risk_df):
     """Make a new risk spreadsheet from the combined most current risk spreadsheet and NARA risk data
 
     The new spreadsheet is named accession_full_risk_data_date.csv,
     and is saved in the same folder as the original risk spreadsheet.
+    It is first saved with a temporary name and only renamed once it is complete.
 
     @:parameter
     accession_path (string): path to the accession folder, which is the folder that contains the risk csv(s).
@@ -336,10 +830,47 @@ def save_risk_csv(accession_path, risk_df):
     risk_df.drop_duplicates(inplace=True)
 
     # Saves the dataframe to a csv in the same folder as the original risk_csv.
-    accession_number = os.path.basename(accession_path)
-    today = datetime.today().strftime('%Y-%m-%d')
-    update_csv_path = os.path.join(accession_path, f'{accession_number}_full_risk_data_{today}.csv')
-    risk_df.to_csv(update_csv_path, index=False)
+    # It is saved to a temporary file and then renamed, so the new risk csv is never partially written
+    # if the script is interrupted, which would make most_recent_risk_csv() select an incomplete csv.
+    update_csv_path, temp_csv_path = new_risk_csv_paths(accession_path)
+    risk_df.to_csv(temp_csv_path, index=False)
+    os.replace(temp_csv_path, update_csv_path)
+
+    # Saves a Parquet copy of the new risk csv, if pyarrow is installed, which is faster to read.
+    save_parquet(risk_df, update_csv_path)
+
+
+def saved_duplicates(csv_path, chunk_bytes, risk_df, chunk_numbers):
+    """Find the rows that are the same as a row already saved to a new risk spreadsheet by update_risk_csv_chunks()
+
+    Only the chunks with a row that has the same hash as a row in risk_df are read again,
+    and the rows are compared as the text saved to the spreadsheet.
+
+    @:parameter
+    csv_path (string): path to the new risk spreadsheet, with the chunks saved so far
+    chunk_bytes (list): the start and end, in bytes, of each chunk saved to the new risk spreadsheet
+    risk_df (Pandas dataframe): the rows with the same hash as a saved row
+    chunk_numbers (numpy array): the numbers of the chunks with a saved row with the same hash as a row in risk_df
+
+    @:returns
+    duplicate (numpy array): True for each row in risk_df that is the same as a saved row and False if not
+    """
+    # Converts the rows to the text that would be saved, the same as the saved rows when they are read.
+    columns = risk_df.columns.tolist()
+    new_rows = pd.read_csv(io.StringIO(risk_df.to_csv(index=False)), dtype=str, keep_default_na=False)
+    new_rows['Row_Number'] = range(len(new_rows.index))
+
+    # Reads each chunk with a matching hash from the spreadsheet and finds the rows with every value the same.
+    duplicate = np.zeros(len(new_rows.index), dtype=bool)
+    with open(csv_path, 'rb') as saved_csv:
+        for chunk_number in chunk_numbers:
+            start, end = chunk_bytes[chunk_number]
+            saved_csv.seek(start)
+            saved_rows = pd.read_csv(io.BytesIO(saved_csv.read(end - start)), header=None, names=columns, dtype=str,
+                                     keep_default_na=False)
+            matches = new_rows.merge(saved_rows.drop_duplicates(), on=columns, how='inner')
+            duplicate[matches['Row_Number'].to_numpy()] = True
+    return duplicate
 
 
 def update_log(accession_path, log_dir, update_result):
@@ -347,6 +878,7 @@ def update_log(accession_path, log_dir, update_result):
 
     The log includes the collection and accession number, which are both part of the accession path,
     and if the risk csv was updated or not.
+    Rows are saved to the log in batches by flush_log().
 
     @:parameter
     accession_path (string): path to the accession folder, which is the folder that contains the risk csv(s)
@@ -354,7 +886,7 @@ def update_log(accession_path, log_dir, update_result):
     update_result (string): Yes (updated risk csv made) or No (no previous risk csv to update)
 
     @:returns
-    None. Makes or updates the log.
+    None. Adds the row to log_rows and makes or updates the log if it is time to save.
     """
 
     # Parses the collection and accession number from the accession path.
@@ -363,16 +895,93 @@ def update_log(accession_path, log_dir, update_result):
     collection = accession_path_list[-2]
     accession = accession_path_list[-1]
 
-    # If the log doesn't exist yet (this is the first CSV to be updated), makes the log with a header row.
-    today = datetime.today().strftime('%Y-%m-%d')
-    log_path = os.path.join(log_dir, f"update_risk_log_{today}.csv")
-    if not os.path.exists(log_path):
-        with open(log_path, 'w') as f:
-            f.write('Collection,Accession,Risk_Updated\n')
+    # Adds the collection and accession to the rows waiting to be saved.
+    # They are saved for the first accession and then if it has been LOG_FLUSH_SECONDS since the last save.
+    # Call flush_log() after the last accession to save any remaining rows.
+    log_rows.append(f'{collection},{accession},{update_result}\n')
+    if log_last_saved is None or time.monotonic() - log_last_saved >= LOG_FLUSH_SECONDS:
+        flush_log(log_dir)
 
-    # Adds the collection and accession to the log.
-    with open(log_path, 'a') as f:
-        f.write(f'{collection},{accession},{update_result}\n')
+
+def update_risk_csv_chunks(accession_path, risk_csv_path, nara_df, chunk_rows=CHUNK_ROWS):
+    """Make a new risk spreadsheet by matching the most current risk spreadsheet to NARA a chunk of rows at a time
+
+    This is used instead of read_risk_csv(), match_nara_risk(), and save_risk_csv() for very large risk csvs,
+    so that only one chunk is in memory at a time. Each chunk is matched and then added to the new spreadsheet.
+    Duplicate rows are removed across the whole spreadsheet by keeping the hash of every row already saved,
+    and comparing every value of rows with the same hash (see saved_duplicates()),
+    so the result has the same rows as save_risk_csv(), although they may be in a different order.
+    No Parquet copy is saved, since the whole spreadsheet is never in memory, so the new csv is read instead.
+
+    @:parameter
+    accession_path (string): path to the accession folder, which is the folder that contains the risk csv(s)
+    risk_csv_path (string): path to the most recent risk csv in the accession folder
+    nara_df (Pandas dataframe): a dataframe with all columns from the NARA Preservation Action Plan spreadsheet
+    chunk_rows (integer): the number of rows from the risk csv to match at a time
+
+    @:returns
+    None
+    """
+
+    # Paths for the new risk spreadsheet, which is named the same as by save_risk_csv().
+    # Chunks are saved to the temporary path, which is renamed once every chunk is saved.
+    update_csv_path, temp_csv_path = new_risk_csv_paths(accession_path)
+
+    # Hash of every row already saved to the new risk spreadsheet, sorted so they can be searched without a loop,
+    # and the number of the chunk each row was saved with, so a row with the same hash can be read again and compared.
+    # The start and end of each chunk in the new spreadsheet, in bytes, are used to read the chunk again.
+    saved_hashes = np.array([], dtype=np.uint64)
+    saved_chunks = np.array([], dtype=np.int64)
+    chunk_bytes = []
+
+    # Matches each chunk of the risk csv to NARA and adds the rows that are not duplicates to the new spreadsheet.
+    # The first chunk adds the header to the spreadsheet.
+    header = True
+    with open(temp_csv_path, 'w', newline='', encoding='utf-8') as temp_csv:
+        for risk_df in read_risk_columns(risk_csv_path, FITS_COLUMNS, RISK_CSV_CATEGORIES, chunksize=chunk_rows):
+            fill_no_value(risk_df)
+            risk_df = match_nara_risk(risk_df, nara_df)
+            if header:
+                risk_df.head(0).to_csv(temp_csv, index=False)
+                header = False
+
+            # Removes rows that are the same as an earlier row in this chunk, comparing every value.
+            risk_df = risk_df[~risk_df.duplicated().to_numpy()]
+
+            # Finds rows with the same hash as a row saved from an earlier chunk.
+            # Rows are hashed as type object, so the same values have the same hash in every chunk
+            # regardless of if a column was a category in that chunk.
+            row_hashes = pd.util.hash_pandas_object(risk_df.astype(object), index=False).to_numpy()
+            first = np.searchsorted(saved_hashes, row_hashes, side='left')
+            last = np.searchsorted(saved_hashes, row_hashes, side='right')
+            matched = last > first
+
+            # Rows with the same hash as a saved row are only duplicates if every value is the same,
+            # so a different row with the same hash (hash collision) is still saved.
+            duplicate = np.zeros(len(risk_df.index), dtype=bool)
+            if matched.any():
+                counts = last[matched] - first[matched]
+                positions = np.repeat(first[matched] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+                temp_csv.flush()
+                duplicate[matched] = saved_duplicates(temp_csv_path, chunk_bytes, risk_df[matched],
+                                                      np.unique(saved_chunks[positions]))
+
+            # Saves the rows that are not duplicates and adds their hashes to the sorted hashes of saved rows.
+            risk_df = risk_df[~duplicate]
+            if len(risk_df.index) > 0:
+                start = temp_csv.tell()
+                risk_df.to_csv(temp_csv, header=False, index=False)
+                chunk_bytes.append((start, temp_csv.tell()))
+                new_hashes = np.sort(row_hashes[~duplicate])
+                insert_at = np.searchsorted(saved_hashes, new_hashes)
+                saved_hashes = np.insert(saved_hashes, insert_at, new_hashes)
+                saved_chunks = np.insert(saved_chunks, insert_at, len(chunk_bytes) - 1)
+
+    os.replace(temp_csv_path, update_csv_path)
+
+    # Deletes a Parquet copy with the same name from an earlier run the same day, which no longer matches the csv.
+    if os.path.exists(parquet_path(update_csv_path)):
+        os.remove(parquet_path(update_csv_path))
 
 
 if __name__ == '__main__':
@@ -385,10 +994,10 @@ if __name__ == '__main__':
             print(error)
         sys.exit(1)
 
-    # Reads the NARA CSV into a dataframe and updates column names.
+    # Reads the NARA CSV into a dataframe and updates column names, using the cache of it from previous runs if present.
     # Exits the script if the NARA CSV does not have the expected column names.
     try:
-        nara_risk_df = read_nara_csv(nara_csv)
+        nara_risk_df = read_nara_cache(nara_csv)
     except KeyError:
         print('\nThe NARA Preservation Action Plan spreadsheet does not have at least one of the expected columns: '
               'Format Name, File Extension(s), PRONOM URL, NARA Risk Level, and NARA Proposed Preservation Plan. '
@@ -398,14 +1007,47 @@ if __name__ == '__main__':
     # Navigates to each accession folder and makes a new version of the risk spreadsheet
     # using the most recent risk spreadsheet in each folder and the current NARA risk CSV.
     # Also logs if it found a risk spreadsheet or not.
-    for root, directories, files in os.walk(input_directory):
-        if accession_test(os.path.basename(root), root):
+    # Any log rows not saved yet are saved at the end, even if the script stops because of an error.
+    # Files with a different risk level or match type are added to a report for each accession and combined at the end.
+    # The accession folders are from the Hub inventory, if there is a recent one (see hub_inventory.py),
+    # instead of navigating every folder in the input_directory, including the bags.
+    accession_folders = folder_files(input_directory, accessions_only=True)
+    if accession_folders is None:
+        accession_folders = ((root, files) for root, directories, files in os.walk(input_directory)
+                             if accession_test(os.path.basename(root), root))
+    all_changes = []
+    catalog_rows = []
+    try:
+        for root, files in accession_folders:
             if any('full_risk_data' in x for x in files):
                 print('Starting on accession', root)
                 file = most_recent_risk_csv(files)
-                new_risk_df = read_risk_csv(os.path.join(root, file))
-                new_risk_df = match_nara_risk(new_risk_df, nara_risk_df)
-                save_risk_csv(root, new_risk_df)
+                # Very large risk csvs are matched in chunks, so they are never in memory all at once.
+                if os.path.getsize(os.path.join(root, file)) > STREAMING_BYTES:
+                    update_risk_csv_chunks(root, os.path.join(root, file), nara_risk_df)
+                    new_risk_df = None
+                else:
+                    new_risk_df = read_risk_csv(os.path.join(root, file))
+                    new_risk_df = match_nara_risk(new_risk_df, nara_risk_df)
+                    save_risk_csv(root, new_risk_df)
                 update_log(root, input_directory, 'Yes')
+                # Adds the new risk csv version to the rows for the catalog, if there is one (see hub_catalog.py),
+                # which are saved CATALOG_BATCH_ROWS at a time.
+                # The previous risk csv is replaced if the script already ran today, so there is nothing to compare.
+                new_csv_path = new_risk_csv_paths(root)[0]
+                csv_stat = os.stat(new_csv_path)
+                catalog_rows.append((root, os.path.basename(new_csv_path), catalog_time(), csv_stat.st_size,
+                                     csv_stat.st_mtime_ns))
+                if len(catalog_rows) >= CATALOG_BATCH_ROWS:
+                    save_catalog_rows('risk_csv', catalog_rows)
+                    catalog_rows = []
+                if os.path.join(root, file) != new_csv_path:
+                    accession_changes = risk_changes(os.path.join(root, file), new_csv_path, new_risk_df)
+                    save_risk_changes(input_directory, root, accession_changes)
+                    all_changes.append(accession_changes)
             else:
                 update_log(root, input_directory, 'No')
+    finally:
+        flush_log(input_directory)
+        save_catalog_rows('risk_csv', catalog_rows)
+    save_risk_change_summary(input_directory, all_changes)
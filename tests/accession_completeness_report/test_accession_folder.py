@@ -0,0 +1,57 @@
+"""
+Tests for the function accession_folder(), which determines if a folder in a collection folder has accession content.
+The folder names are from each collection folder in the test data, like the folders from the Hub inventory.
+"""
+import os
+import unittest
+from accession_completeness_report import accession_folder
+
+
+def accession_names(coll_path):
+    """Make a list of the folders in a collection folder that accession_folder() includes, in alphabetical order"""
+    folder_names = [name for name in os.listdir(coll_path) if os.path.isdir(os.path.join(coll_path, name))]
+    return sorted(name for name in folder_names if accession_folder(name))
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_one_folder(self):
+        """Test for when there is one accession folder in the collection folder and nothing else"""
+        accession_list = accession_names(os.path.join('test_data', 'accession_folder', 'coll_1'))
+        expected = ['acc_1_1']
+        self.assertEqual(expected, accession_list, "Problem with test for one folder")
+
+    def test_multiple_folders(self):
+        """Test for when there are three accession folders in the collection folder and nothing else"""
+        accession_list = accession_names(os.path.join('test_data', 'accession_folder', 'coll_2'))
+        expected = ['acc_2_1', 'acc_2_2', 'acc_2_3']
+        self.assertEqual(expected, accession_list, "Problem with test for multiple folders")
+
+    def test_skip_endswith(self):
+        """Test for when accession_FITS that should not be included is present"""
+        accession_list = accession_names(os.path.join('test_data', 'accession_folder', 'coll_4'))
+        expected = ['acc_4_1', 'acc_4_2']
+        self.assertEqual(expected, accession_list, "Problem with test for skip endswith")
+
+    def test_skip_equal(self):
+        """Test for when each of the folder names that should not be included is present"""
+        accession_list = accession_names(os.path.join('test_data', 'accession_folder', 'coll_5'))
+        expected = ['acc_5_1']
+        self.assertEqual(expected, accession_list, "Problem with test for skip equal")
+
+    def test_skip_startswith(self):
+        """Test for when each of the prefixes for folder names that should not be included is present"""
+        accession_list = accession_names(os.path.join('test_data', 'accession_folder', 'coll_6'))
+        expected = ['acc_6_1']
+        self.assertEqual(expected, accession_list, "Problem with test for skip startswith")
+
+    def test_with_file(self):
+        """Test for when there is a file in the collection folder, which is not a folder so it is not checked,
+        as well as one accession folder"""
+        accession_list = accession_names(os.path.join('test_data', 'accession_folder', 'coll_3'))
+        expected = ['acc_3_1']
+        self.assertEqual(expected, accession_list, "Problem with test for with file")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Tests for the function check_accessions(), which checks the completeness of every accession in the inventory.
+"""
+import os
+import unittest
+from accession_completeness_report import check_accessions
+from hub_inventory import scan_inventory
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_multiple_workers(self):
+        """Test for checking accessions at the same time, which has the same results in the same order as one worker"""
+        inventory_df = scan_inventory(os.path.join('test_data', 'script', 'incomplete'))
+        one_worker = [(folder.Accession, result) for folder, result, _ in check_accessions(inventory_df)]
+        result = [(folder.Accession, result) for folder, result, _ in check_accessions(inventory_df, workers=4)]
+        self.assertEqual(one_worker, result, "Problem with test for multiple workers")
+
+    def test_one_worker(self):
+        """Test for checking accessions one at a time, which are in the order of the inventory"""
+        inventory_df = scan_inventory(os.path.join('test_data', 'script', 'incomplete'))
+        result = [[folder.Accession] + list(result.values()) for folder, result, _ in check_accessions(inventory_df)]
+        self.assertEqual(inventory_df['Accession'].tolist(), [row[0] for row in result],
+                         "Problem with test for one worker, order")
+
+        # Verifies the results, sorted because the order folders are listed may be different for different file systems.
+        expected = [['acc_1_1', False, 'Nonstandard columns', False, False, True],
+                    ['acc_2_1', True, None, True, False, False],
+                    ['acc_2_2', True, None, True, True, True],
+                    ['acc_2_3', False, None, False, True, True],
+                    ['acc_349_1', True, None, False, False, False],
+                    ['acc_3_1', False, 'Extra blank row(s) at end', False, False, False]]
+        self.assertEqual(expected, sorted(result), "Problem with test for one worker, results")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the function check_deep(), which tests if the initial manifest, risk csv, and bag of an accession agree.
+"""
+import bagit
+import os
+import shutil
+import unittest
+from accession_completeness_report import check_deep
+
+
+def add_row(file_path, row):
+    """Add a row to the end of a file"""
+    with open(file_path, 'a') as open_file:
+        open_file.write(row + '\n')
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes an accession with a bag, initial manifest, and risk csv that agree"""
+        os.makedirs(os.path.join('acc-1-er', 'acc-1-er_bag', 'Folder'))
+        for file_name in (os.path.join('Folder', 'Document.txt'), 'Photo.jpg'):
+            with open(os.path.join('acc-1-er', 'acc-1-er_bag', file_name), 'w') as new_file:
+                new_file.write('Test file')
+        bagit.make_bag(os.path.join('acc-1-er', 'acc-1-er_bag'), checksums=['md5'])
+        add_row(os.path.join('acc-1-er', 'initialmanifest_20240101.csv'),
+                'File,SizeKB,DateCreated,DateModified,MD5,Notes')
+        add_row(os.path.join('acc-1-er', 'initialmanifest_20240101.csv'), 'Z:\\acc-1-er\\Folder\\Document.txt,1,,,,')
+        add_row(os.path.join('acc-1-er', 'initialmanifest_20240101.csv'), 'Z:\\acc-1-er\\Photo.jpg,1,,,,')
+        add_row(os.path.join('acc-1-er', 'acc-1-er_full_risk_data.csv'), 'FITS_File_Path,NARA_Risk_Level')
+        add_row(os.path.join('acc-1-er', 'acc-1-er_full_risk_data.csv'),
+                'Z:\\hub\\acc-1-er\\acc-1-er_bag\\data\\Folder\\Document.txt,Low Risk')
+        add_row(os.path.join('acc-1-er', 'acc-1-er_full_risk_data.csv'),
+                'Z:\\hub\\acc-1-er\\acc-1-er_bag\\data\\Photo.jpg,Low Risk')
+
+    def tearDown(self):
+        """Deletes the test accession"""
+        shutil.rmtree('acc-1-er')
+
+    def test_bag_tags(self):
+        """Test for a bag missing bagit.txt and with a row in the manifest that cannot be read"""
+        os.remove(os.path.join('acc-1-er', 'acc-1-er_bag', 'bagit.txt'))
+        add_row(os.path.join('acc-1-er', 'acc-1-er_bag', 'manifest-md5.txt'), 'error')
+        result = check_deep('acc-1-er')
+        expected = {'manifest_count': None, 'risk_coverage': None,
+                    'bag_tags': 'No bagit.txt, manifest-md5.txt has 1 rows that cannot be read, '
+                                'tagmanifest-md5.txt has 1 files not in the bag'}
+        self.assertEqual(expected, result, "Problem with test for bag tags")
+
+    def test_correct(self):
+        """Test for an accession where everything agrees"""
+        result = check_deep('acc-1-er')
+        expected = {'manifest_count': None, 'risk_coverage': None, 'bag_tags': None}
+        self.assertEqual(expected, result, "Problem with test for correct")
+
+    def test_manifest_count(self):
+        """Test for an initial manifest with more files than the bag"""
+        add_row(os.path.join('acc-1-er', 'initialmanifest_20240101.csv'), 'Z:\\acc-1-er\\Deleted.txt,1,,,,')
+        result = check_deep('acc-1-er')
+        expected = {'manifest_count': 'Initial manifest has 3 files and bag has 2', 'risk_coverage': None,
+                    'bag_tags': None}
+        self.assertEqual(expected, result, "Problem with test for manifest count")
+
+    def test_no_bag(self):
+        """Test for an accession without a bag, which is not checked"""
+        shutil.rmtree(os.path.join('acc-1-er', 'acc-1-er_bag'))
+        result = check_deep('acc-1-er')
+        expected = {'manifest_count': None, 'risk_coverage': None, 'bag_tags': None}
+        self.assertEqual(expected, result, "Problem with test for no bag")
+
+    def test_risk_csv_error(self):
+        """Test for a risk csv without the FITS_File_Path column"""
+        with open(os.path.join('acc-1-er', 'acc-1-er_full_risk_data.csv'), 'w') as risk_csv:
+            risk_csv.write('Placeholder\n')
+        result = check_deep('acc-1-er')
+        expected = {'manifest_count': None, 'risk_coverage': 'Cannot read risk csv', 'bag_tags': None}
+        self.assertEqual(expected, result, "Problem with test for risk csv error")
+
+    def test_risk_coverage(self):
+        """Test for a risk csv missing a file in the bag"""
+        with open(os.path.join('acc-1-er', 'acc-1-er_full_risk_data.csv'), 'w') as risk_csv:
+            risk_csv.write('FITS_File_Path,NARA_Risk_Level\n'
+                           'Z:\\hub\\acc-1-er\\acc-1-er_bag\\data\\Photo.jpg,Low Risk\n')
+        result = check_deep('acc-1-er')
+        expected = {'manifest_count': None, 'risk_coverage': '1 of 2 bag files not in risk csv', 'bag_tags': None}
+        self.assertEqual(expected, result, "Problem with test for risk coverage")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""
+Tests for the function payload_file_count(), which gets the number of files in a bag from the Payload-Oxum.
+"""
+import unittest
+from accession_completeness_report import payload_file_count
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_correct(self):
+        """Test for a Payload-Oxum formatted correctly"""
+        result = payload_file_count({'Bagging-Date': '2024-01-01', 'Payload-Oxum': '2500000.12'})
+        self.assertEqual(12, result, "Problem with test for correct")
+
+    def test_error_format(self):
+        """Test for a Payload-Oxum that is not formatted bytes.file_count"""
+        result = payload_file_count({'Payload-Oxum': '2500000'})
+        self.assertEqual(None, result, "Problem with test for error_format")
+
+    def test_error_missing(self):
+        """Test for no Payload-Oxum"""
+        result = payload_file_count({'Bagging-Date': '2024-01-01'})
+        self.assertEqual(None, result, "Problem with test for error_missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Tests for the function risk_csv_hashes(), which reads the file paths in a risk csv as hashes of relative paths.
+"""
+import os
+import unittest
+import numpy as np
+import pandas as pd
+import accession_completeness_report
+from accession_completeness_report import risk_csv_hashes
+
+
+def path_hashes(paths):
+    """Make the expected hashes from a list of relative paths"""
+    return np.unique(pd.util.hash_array(np.array(paths, dtype=object), categorize=False)).tolist()
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the test risk csv and resets the number of rows read at a time"""
+        if os.path.exists('test_full_risk_data.csv'):
+            os.remove('test_full_risk_data.csv')
+        accession_completeness_report.DEEP_CHUNK_ROWS = 100000
+
+    def test_paths(self):
+        """Test for paths in a bag, in the accession folder, in neither, and repeated, read one row at a time"""
+        accession_completeness_report.DEEP_CHUNK_ROWS = 1
+        with open('test_full_risk_data.csv', 'w') as risk_csv:
+            risk_csv.write('FITS_File_Path,NARA_Risk_Level\n'
+                           'Z:\\hub\\acc-1-er\\acc-1-er_bag\\data\\Folder\\Doc.txt,Low Risk\n'
+                           'Z:\\hub\\acc-1-er\\acc-1-er_bag\\data\\Folder\\Doc.txt,High Risk\n'
+                           'Z:\\acc-1-er\\Photo.JPG,Low Risk\n'
+                           'Z:\\other\\File.txt,Low Risk\n')
+        result = risk_csv_hashes('test_full_risk_data.csv', 'acc-1-er').tolist()
+        expected = path_hashes(['folder/doc.txt', 'photo.jpg'])
+        self.assertEqual(expected, result, "Problem with test for paths")
+
+
+if __name__ == '__main__':
+    unittest.main()
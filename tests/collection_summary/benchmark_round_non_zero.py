@@ -0,0 +1,61 @@
+"""
+Benchmark for the function round_non_zero(), which rounds a whole array at once,
+compared to the earlier version that rounded one number at a time, adding one decimal place until it was not 0.
+
+This is not a unit test and is not run with the tests. Run it from this folder:
+    python benchmark_round_non_zero.py [count]
+
+Parameter:
+    count (optional): the number of values to round, which is 5,000,000 if not provided
+
+Returns:
+    Prints the time for each, and if the results are the same
+"""
+import numpy as np
+import sys
+import time
+from collection_summary import round_non_zero
+
+
+def round_non_zero_loop(number):
+    """The earlier version of round_non_zero(), which rounds one number with a while loop
+
+    @:parameter
+    number (float): a number to be rounded
+
+    @:returns
+    round_number (float): the number rounded to the fewest decimal places that don't make it 0
+    """
+    if number == 0:
+        return 0.00
+    places = 2
+    round_number = round(number, 2)
+    while round_number == 0:
+        places += 1
+        round_number = round(number, places)
+    return round_number
+
+
+if __name__ == '__main__':
+
+    value_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000000
+    print(f'Making {value_count:,} values')
+
+    # Sizes in GB from a few bytes to many TB, and some 0.
+    random = np.random.default_rng(0)
+    values = random.exponential(1, value_count) * 10.0 ** random.integers(-9, 5, value_count)
+    values[random.random(value_count) < 0.05] = 0
+
+    # Times the earlier version, one number at a time.
+    start = time.perf_counter()
+    loop_result = np.array([round_non_zero_loop(float(value)) for value in values])
+    loop_seconds = time.perf_counter() - start
+    print(f'One at a time: {loop_seconds:.2f} seconds')
+
+    # Times round_non_zero() on the whole array.
+    start = time.perf_counter()
+    array_result = round_non_zero(values)
+    array_seconds = time.perf_counter() - start
+    print(f'Whole array: {array_seconds:.2f} seconds ({loop_seconds / array_seconds:.1f}x faster)')
+
+    print('Same result:', np.array_equal(loop_result, array_result))
@@ -0,0 +1,44 @@
+"""
+Tests for the function accession_key(), which gets the information used to tell if an accession has changed
+since its data was saved to the cache: the most recent risk csv name, modification time, and size,
+and the bag-info.txt modification time.
+"""
+import os
+import unittest
+from collection_summary import accession_key
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_bag_and_risk(self):
+        """Test for an accession with a bag and more than one risk csv, so the most recent risk csv is used"""
+        acc_path = os.path.join('test_data', 'Russell_Hub', 'born-digital', 'backlogged', 'rbrl002', '2022-04-er')
+        key = accession_key(acc_path)
+
+        risk_stat = os.stat(os.path.join(acc_path, '2022-04-er_full_risk_data_2024-04-01.csv'))
+        bag_stat = os.stat(os.path.join(acc_path, '2022-04-er_bag', 'bag-info.txt'))
+        expected = ('2022-04-er_full_risk_data_2024-04-01.csv', risk_stat.st_mtime_ns, risk_stat.st_size,
+                    bag_stat.st_mtime_ns)
+        self.assertEqual(expected, key, "Problem with test for bag and risk")
+
+    def test_no_bag(self):
+        """Test for an accession that is not in a bag, so the bag-info.txt modification time is -1"""
+        acc_path = os.path.join('test_data', 'Russell_Hub', 'born-digital', 'closed', 'rbrl003', '2019-13-er')
+        key = accession_key(acc_path)
+
+        risk_stat = os.stat(os.path.join(acc_path, '2019-13-er_full_risk_data.csv'))
+        expected = ('2019-13-er_full_risk_data.csv', risk_stat.st_mtime_ns, risk_stat.st_size, -1)
+        self.assertEqual(expected, key, "Problem with test for no bag")
+
+    def test_no_risk(self):
+        """Test for an accession without a risk csv, so the risk csv name is blank and the time and size are -1"""
+        acc_path = os.path.join('test_data', 'Russell_Hub', 'born-digital', 'backlogged', 'rbrl002', '2021-40-er')
+        key = accession_key(acc_path)
+
+        bag_stat = os.stat(os.path.join(acc_path, '2021-40-er_bag', 'bag-info.txt'))
+        expected = ('', -1, -1, bag_stat.st_mtime_ns)
+        self.assertEqual(expected, key, "Problem with test for no risk")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Tests for the function accession_table(), which makes a dataframe with the data for every accession.
+"""
+import unittest
+from collection_summary import accession_table
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_no_rows(self):
+        """Test for when there are no accessions, which still has every column with the expected data type"""
+        acc_df = accession_table([])
+
+        result = [acc_df.columns.tolist(), acc_df.dtypes.astype(str).tolist(), len(acc_df)]
+        expected = [['Accession', 'Collection', 'Status', 'Date', 'GB', 'Files', 'No_Match_Risk', 'High_Risk',
+                     'Moderate_Risk', 'Low_Risk', 'Notes', 'Size_Error'],
+                    ['object', 'object', 'object', 'int64', 'float64', 'int64', 'int64', 'int64', 'int64', 'int64',
+                     'object', 'object'], 0]
+        self.assertEqual(expected, result, "Problem with test for no rows")
+
+    def test_rows(self):
+        """Test for more than one accession, with and without notes and size errors"""
+        rows = [['2015-01-er', 'ms0001', 'backlog', '2015', 0, 0, 11, 15, 45, 40, None,
+                 'Accession bag not found. '],
+                ['2019-01-er', 'ms0001', 'backlog', '2019', 2.02, 200, 0, 0, 0, 0,
+                 'Accession 2019-01-er has no risk csv. ', None]]
+        acc_df = accession_table(rows)
+
+        result = [acc_df.dtypes.astype(str).tolist()] + acc_df.values.tolist()
+        expected = [['object', 'object', 'object', 'int64', 'float64', 'int64', 'int64', 'int64', 'int64', 'int64',
+                     'object', 'object'],
+                    ['2015-01-er', 'ms0001', 'backlog', 2015, 0.0, 0, 11, 15, 45, 40, '', 'Accession bag not found. '],
+                    ['2019-01-er', 'ms0001', 'backlog', 2019, 2.02, 200, 0, 0, 0, 0,
+                     'Accession 2019-01-er has no risk csv. ', '']]
+        self.assertEqual(expected, result, "Problem with test for rows")
+
+
+if __name__ == '__main__':
+    unittest.main()
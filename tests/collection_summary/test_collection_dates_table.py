@@ -0,0 +1,31 @@
+"""
+Tests for the function collection_dates_table(), which makes the date or date range for every collection
+from the earliest and latest dates kept by update_collection_dates() while accessions are scanned.
+"""
+import unittest
+from collection_summary import collection_dates_table
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_empty(self):
+        """Test for no accessions"""
+        date_df = collection_dates_table({})
+
+        # Verifies the dataframe has the expected contents, converting it to a list first for easier comparison.
+        result = [date_df.columns.tolist()] + date_df.values.tolist()
+        expected = [['Collection', 'Date']]
+        self.assertEqual(expected, result, "Problem with test for empty")
+
+    def test_range(self):
+        """Test for collections with a date range and a single date, which are sorted by collection"""
+        date_df = collection_dates_table({'coll_2': [2013, 2013], 'coll_1': [2000, 2012]})
+
+        # Verifies the dataframe has the expected contents, converting it to a list first for easier comparison.
+        result = [date_df.columns.tolist()] + date_df.values.tolist()
+        expected = [['Collection', 'Date'], ['coll_1', '2000-2012'], ['coll_2', '2013']]
+        self.assertEqual(expected, result, "Problem with test for range")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,12 +2,19 @@
 Tests for the function get_risk(), which gets the number of files at each risk level.
 """
 import os
+import pandas as pd
+import shutil
 import unittest
 from collection_summary import get_risk
 
 
 class MyTestCase(unittest.TestCase):
 
+    def tearDown(self):
+        """Deletes the accession folder made by a test, if it is present"""
+        if os.path.exists('2023-01-er'):
+            shutil.rmtree('2023-01-er')
+
     def test_all_risks_once(self):
         """Test for when there is one file for each risk level"""
         acc_path = os.path.join('test_data', 'Russell_Hub', 'born-digital', 'backlogged', 'rbrl002', '2022-01-er')
@@ -22,6 +29,19 @@ class MyTestCase(unittest.TestCase):
         expected = [5, 4, 3, 2, None]
         self.assertEqual(expected, risk, "Problem with test for all risks repeated")
 
+    def test_blank_risk(self):
+        """Test for when some files have a blank risk level (legacy practice), which is counted as No Match"""
+        # Makes an accession folder with a risk csv for the test.
+        os.mkdir('2023-01-er')
+        rows = [['data\\file1.txt', None], ['data\\file2.txt', 'No Match'], ['data\\file3.txt', None],
+                ['data\\file3.txt', None], ['data\\file4.txt', 'Low Risk']]
+        risk_df = pd.DataFrame(rows, columns=['FITS_File_Path', 'NARA_Risk_Level'])
+        risk_df.to_csv(os.path.join('2023-01-er', '2023-01-er_full_risk_data.csv'), index=False)
+
+        risk = get_risk('2023-01-er')
+        expected = [3, 0, 0, 1, None]
+        self.assertEqual(expected, risk, "Problem with test for blank risk")
+
     def test_duplicates(self):
         """Test for when all files are in the risk CSV more than once, with the same risk level"""
         acc_path = os.path.join('test_data', 'Russell_Hub', 'born-digital', 'backlogged', 'rbrl002', '2021-11-er')
@@ -71,6 +91,19 @@ class MyTestCase(unittest.TestCase):
         expected = [0, 2, 3, 0, None]
         self.assertEqual(expected, risk, "Problem with test for two risks repeated")
 
+    def test_unexpected_risk(self):
+        """Test for when some files have a risk level that is not one of the four expected NARA risk levels"""
+        # Makes an accession folder with a risk csv for the test.
+        os.mkdir('2023-01-er')
+        rows = [['data\\file1.txt', 'Low Risk'], ['data\\file2.txt', 'Unknown'], ['data\\file2.txt', 'Unknown'],
+                ['data\\file3.txt', 'Unknown'], ['data\\file4.txt', None], ['data\\file5.txt', 'High Risk']]
+        risk_df = pd.DataFrame(rows, columns=['FITS_File_Path', 'NARA_Risk_Level'])
+        risk_df.to_csv(os.path.join('2023-01-er', '2023-01-er_full_risk_data.csv'), index=False)
+
+        risk = get_risk('2023-01-er')
+        expected = [1, 1, 0, 1, 'Accession 2023-01-er has unexpected risk levels: Unknown (2). ']
+        self.assertEqual(expected, risk, "Problem with test for unexpected risk")
+
     def updated_column_name(self):
         """Test for when the NARA column has the updated name, NARA_Risk_Level instead of NARA_Risk Level"""
         acc_path = os.path.join('test_data', 'Russell_Hub', 'born-digital', 'backlogged', 'rbrl002', '2022-06-er')
@@ -0,0 +1,56 @@
+"""
+Tests for the function read_summary_cache(), which gets the data for an accession from the cache
+if the key from accession_key() is the same as when the data was saved with save_summary_cache().
+"""
+import os
+import unittest
+from collection_summary import read_summary_cache, save_summary_cache, summary_cache
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """An in-memory cache with the data for one accession, and the key for that accession when it was saved"""
+        self.acc_path = os.path.join('Hub', 'backlogged', 'coll_1', 'acc_1')
+        self.key = ('acc_1_full_risk_data.csv', 1700000000000000000, 500, 1600000000000000000)
+        self.connection = summary_cache(':memory:')
+        save_summary_cache(self.connection, self.acc_path, self.key,
+                           ['acc_1', 'coll_1', 'backlogged', '2020-2021', 0.01, 5, 1, 0, 2, 2, None, None])
+
+    def tearDown(self):
+        """Close the in-memory cache"""
+        self.connection.close()
+
+    def test_changed_bag(self):
+        """Test for when bag-info.txt has a different modification time, so the cached data is not used"""
+        key = self.key[:3] + (1600000000000000001,)
+        data = read_summary_cache(self.connection, self.acc_path, key)
+        self.assertEqual(None, data, "Problem with test for changed bag")
+
+    def test_changed_risk(self):
+        """Test for when the risk csv has a different modification time, so the cached data is not used"""
+        key = ('acc_1_full_risk_data.csv', 1700000000000000001, 500, 1600000000000000000)
+        data = read_summary_cache(self.connection, self.acc_path, key)
+        self.assertEqual(None, data, "Problem with test for changed risk")
+
+    def test_new_risk(self):
+        """Test for when there is a newer risk csv with the same time and size, so the cached data is not used"""
+        key = ('acc_1_full_risk_data_2024-01-01.csv',) + self.key[1:]
+        data = read_summary_cache(self.connection, self.acc_path, key)
+        self.assertEqual(None, data, "Problem with test for new risk")
+
+    def test_not_cached(self):
+        """Test for an accession that is not in the cache"""
+        acc_path = os.path.join('Hub', 'backlogged', 'coll_1', 'acc_2')
+        data = read_summary_cache(self.connection, acc_path, self.key)
+        self.assertEqual(None, data, "Problem with test for not cached")
+
+    def test_unchanged(self):
+        """Test for when the key is the same as when the data was cached, so the cached data is used"""
+        data = read_summary_cache(self.connection, self.acc_path, self.key)
+        expected = ['2020-2021', 0.01, 5, 1, 0, 2, 2, None, None]
+        self.assertEqual(expected, data, "Problem with test for unchanged")
+
+
+if __name__ == '__main__':
+    unittest.main()
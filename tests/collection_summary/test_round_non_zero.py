@@ -4,6 +4,7 @@ that don't result in 0.
 """
 import unittest
 from collection_summary import round_non_zero
+from pandas import Series
 
 
 class MyTestCase(unittest.TestCase):
@@ -38,6 +39,17 @@ class MyTestCase(unittest.TestCase):
         size_gb = round_non_zero(0.000123)
         self.assertEqual(0.0001, size_gb, "Problem with test for 7 decimal places, 2 and 3 is zero")
 
+    def test_array(self):
+        """Test for rounding a column of numbers at once, with the same numbers as the other tests"""
+        size_gb = round_non_zero(Series([42, 0.1, 0.99, 3.032, 0.0007, 0.000123, 0]))
+        expected = [42.00, 0.10, 0.99, 3.03, 0.001, 0.0001, 0.00]
+        self.assertEqual(expected, size_gb.tolist(), "Problem with test for array")
+
+    def test_half(self):
+        """Test for numbers that are almost exactly half way between two rounded values"""
+        size_gb = round_non_zero(Series([97.685, 0.125, 0.0045]))
+        self.assertEqual([97.69, 0.12, 0.004], size_gb.tolist(), "Problem with test for half")
+
     def test_zero(self):
         """Test for when the number is zero"""
         size_gb = round_non_zero(0)
@@ -4,7 +4,7 @@ Tests for the function save_accession_report(), which saves accession data to a
 from datetime import datetime
 import os
 import unittest
-from collection_summary import save_accession_report
+from collection_summary import accession_table, save_accession_report
 from test_script_collection_summary import csv_to_list
 
 
@@ -18,11 +18,12 @@ class MyTestCase(unittest.TestCase):
             os.remove(path)
 
     def test_header(self):
-        """Test for making a new report with a header"""
-        save_accession_report('test_data', 'header')
+        """Test for making a report with only a header, when there are no accessions"""
+        report_path = save_accession_report('test_data', accession_table([]))
 
         # Verifies the expected CSV was made with the correct file name.
         csv_path = os.path.join('test_data', f"hub-accession-summary_{datetime.today().strftime('%Y-%m-%d')}.csv")
+        self.assertEqual(csv_path, report_path, "Problem with test for header, path")
         csv_made = os.path.exists(csv_path)
         self.assertEqual(True, csv_made, "Problem with test for header, CSV is made")
 
@@ -34,9 +35,8 @@ class MyTestCase(unittest.TestCase):
 
     def test_one_row(self):
         """Test for making a report with a header and one row of accession data"""
-        save_accession_report('test_data', 'header')
         accession_data = ['2015-01-er', 'ms0001', 'backlog', '2015', 1.00, 111, 11, 15, 45, 40, None, None]
-        save_accession_report('test_data', accession_data)
+        save_accession_report('test_data', accession_table([accession_data]))
 
         # Verifies the expected CSV was made with the correct file name.
         csv_path = os.path.join('test_data', f"hub-accession-summary_{datetime.today().strftime('%Y-%m-%d')}.csv")
@@ -52,13 +52,11 @@ class MyTestCase(unittest.TestCase):
 
     def test_two_rows(self):
         """Test for making a report with a header and two rows of accession data"""
-        save_accession_report('test_data', 'header')
-        accession_data = ['2015-01-er', 'ms0001', 'backlog', '2015', 0, 0, 11, 15, 45, 40, None,
-                          'Could not calculate size for accession 2015-01-er due to path length. ']
-        save_accession_report('test_data', accession_data)
-        accession_data = ['2019-01-er', 'ms0001', 'backlog', '2019', 2.02, 200, 0, 0, 0, 0,
-                          'Accession 2019-01-er has no risk csv. ', None]
-        save_accession_report('test_data', accession_data)
+        accession_rows = [['2015-01-er', 'ms0001', 'backlog', '2015', 0, 0, 11, 15, 45, 40, None,
+                           'Could not calculate size for accession 2015-01-er due to path length. '],
+                          ['2019-01-er', 'ms0001', 'backlog', '2019', 2.02, 200, 0, 0, 0, 0,
+                           'Accession 2019-01-er has no risk csv. ', None]]
+        save_accession_report('test_data', accession_table(accession_rows))
 
         # Verifies the expected CSV was made with the correct file name.
         csv_path = os.path.join('test_data', f"hub-accession-summary_{datetime.today().strftime('%Y-%m-%d')}.csv")
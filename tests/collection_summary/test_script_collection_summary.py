@@ -31,8 +31,8 @@ class MyTestCase(unittest.TestCase):
                    os.path.join('test_data', 'Russell_Hub', 'born-digital', f'hub-accession-summary_{today}.csv'),
                    os.path.join('test_data', 'Russell_Hub', 'born-digital', f'hub-collection-summary_{today}.csv')]
 
-        # Deletes any test output that is present.
-        for output in outputs:
+        # Deletes any test output that is present, including the Parquet copy of a csv if pyarrow is installed.
+        for output in outputs + [f'{os.path.splitext(output)[0]}.parquet' for output in outputs]:
             if os.path.exists(output):
                 remove(output)
 
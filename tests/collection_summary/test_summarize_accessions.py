@@ -0,0 +1,46 @@
+"""
+Tests for the function summarize_accessions(), which finds every accession in the input directory
+and calculates the data for each, in a consistent order.
+"""
+import os
+import unittest
+from collection_summary import summarize_accessions
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_accessions(self):
+        """Test that every accession is summarized and files and folders that are not accessions are skipped"""
+        input_directory = os.path.join('test_data', 'Hargrett_Hub', 'Born-digital')
+        summaries = list(summarize_accessions(input_directory))
+
+        result = sorted(accession_data[:3] for accession_dir, accession_data in summaries)
+        expected = [['2022-15-er', 'ms0001 Person papers', 'backlogged'],
+                    ['ua_01_032_ER', 'ua01-001 Dept records', 'backlogged'],
+                    ['ua_01_033_ER', 'ua01-001 Dept records', 'backlogged']]
+        self.assertEqual(expected, result, "Problem with test for accessions")
+
+    def test_cache(self):
+        """Test that making the cache and then reading every accession from it has the same result, in the same order"""
+        input_directory = os.path.join('test_data', 'Russell_Hub', 'born-digital')
+        cache_path = 'summarize_accessions_cache.sqlite'
+        try:
+            made = list(summarize_accessions(input_directory, cache_path=cache_path))
+            result = list(summarize_accessions(input_directory, cache_path=cache_path))
+        finally:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+        expected = list(summarize_accessions(input_directory))
+        self.assertEqual(expected, made, "Problem with test for cache, made")
+        self.assertEqual(expected, result, "Problem with test for cache, read")
+
+    def test_workers(self):
+        """Test that summarizing accessions at the same time has the same result, in the same order"""
+        input_directory = os.path.join('test_data', 'Russell_Hub', 'born-digital')
+        result = list(summarize_accessions(input_directory, workers=3))
+        expected = list(summarize_accessions(input_directory))
+        self.assertEqual(expected, result, "Problem with test for workers")
+
+
+if __name__ == '__main__':
+    unittest.main()
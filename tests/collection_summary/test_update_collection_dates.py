@@ -0,0 +1,43 @@
+"""
+Tests for the function update_collection_dates(), which keeps the earliest and latest date for each collection
+while accessions are scanned.
+
+For simplicity, the accession data used for testing only has values in the positions used by this function,
+collection (index 1) and date (index 3).
+"""
+import unittest
+from collection_summary import combine_collection_dates, update_collection_dates
+import pandas as pd
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_multiple(self):
+        """Test for multiple accessions per collection, in no particular date order"""
+        dates = {}
+        for row in [['acc_1', 'coll_1', 'open', 2000], ['acc_2', 'coll_2', 'open', 1999],
+                    ['acc_3', 'coll_1', 'open', 2012], ['acc_4', 'coll_2', 'open', 1997],
+                    ['acc_5', 'coll_2', 'open', 1998], ['acc_6', 'coll_1', 'open', 2005]]:
+            update_collection_dates(dates, row)
+
+        expected = {'coll_1': [2000, 2012], 'coll_2': [1997, 1999]}
+        self.assertEqual(expected, dates, "Problem with test for multiple")
+
+    def test_same_as_dataframe(self):
+        """Test that the dates kept while scanning match the dates from combine_collection_dates()"""
+        rows = [['acc_1', 'coll_1', 'open', '2023'], ['acc_2', 'coll_2', 'open', '2014'],
+                ['acc_3', 'coll_2', 'open', '2001']]
+        dates = {}
+        for row in rows:
+            update_collection_dates(dates, row)
+
+        acc_df = pd.DataFrame([[row[1], row[3]] for row in rows], columns=['Collection', 'Date'])
+        expected = {'coll_1': [2023, 2023], 'coll_2': [2001, 2014]}
+        self.assertEqual(expected, dates, "Problem with test for same as dataframe, dictionary")
+        result = combine_collection_dates(acc_df).values.tolist()
+        self.assertEqual([['coll_1', '2023'], ['coll_2', '2001-2014']], result,
+                         "Problem with test for same as dataframe, combine_collection_dates")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Benchmark for the function format_totals(), which calculates the number of files and size for each format
+with one groupby, compared to files_per_format() and size_per_format() merged together,
+which are the earlier versions that were replaced by format_totals() and are only kept here for the comparison.
+
+This is not a unit test and is not run with the tests. Run it from this folder:
+    python benchmark_format_totals.py [rows]
+
+Parameter:
+    rows (optional): the number of files (rows) in the test data, which is 50,000,000 if not provided
+
+Returns:
+    Prints the time for each, and if the results are the same
+"""
+import numpy as np
+import pandas as pd
+import sys
+import time
+from format_list import GROUP_LIST, format_totals
+
+
+def files_per_format(df, group_list=GROUP_LIST):
+    """Calculate the number of files for each format name, version, and NARA risk level combination
+
+    The script uses format_totals() instead, which calculates this and the size with one groupby.
+
+    @:parameter
+    df (pandas DataFrame): dataframe with a subset of cleaned data from the most recent risk csv for every accession,
+                           or the summary of that data from combine_risk_csvs()
+    group_list (list): the columns to group by, which is the format name, version, and NARA risk level,
+                       plus the rollup columns for the summary from combine_format_rollups()
+
+    @:returns
+    files (pandas DataFrame): dataframe with the group_list columns and number of files
+    """
+
+    # Groupby includes NARA risk level so different possible risks for each name/version combination are kept.
+    # Reset index keeps the name, version, and risk level as columns in the dataframe.
+    # Without reset index, it would return a series with those columns as part of the index.
+    # If the dataframe is already a summary with File_Count, from combine_risk_csvs(), the counts are added.
+    # Otherwise, each row is one file.
+    if 'File_Count' in df.columns:
+        files = df.groupby(group_list)['File_Count'].sum().reset_index()
+    else:
+        files = df.groupby(group_list).size().reset_index()
+
+        # Renames the default column name for the count to be more descriptive.
+        files = files.rename({0: 'File_Count'}, axis=1)
+
+    return files
+
+
+def make_test_data(rows):
+    """Make a dataframe with one row per file, with random formats, NARA risk levels, and sizes
+
+    @:parameter
+    rows (integer): the number of rows
+
+    @:returns
+    df (pandas DataFrame): dataframe with format name, version, size in KB, and NARA risk level
+    """
+    random = np.random.default_rng(0)
+    names = np.array([f'Format {number}' for number in range(500)], dtype=object)
+    versions = np.array(['no-version', '1', '1.1', '2', '3.0'], dtype=object)
+    risks = np.array(['Low Risk', 'Moderate Risk', 'High Risk', 'No Match'], dtype=object)
+    df = pd.DataFrame({'FITS_Format_Name': names[random.integers(0, len(names), rows)],
+                       'FITS_Format_Version': versions[random.integers(0, len(versions), rows)],
+                       'FITS_Size_KB': random.exponential(500, rows),
+                       'NARA_Risk_Level': risks[random.integers(0, len(risks), rows)]})
+    return df
+
+
+def size_per_format(df, group_list=GROUP_LIST):
+    """Calculate the size in GB for each format name, version, and NARA risk level combination
+
+    This is the earlier version of format_totals(), which calculates this and the number of files with one groupby.
+
+    @:parameter
+    df (pandas Dataframe): dataframe with a subset of cleaned data from the most recent risk csv for every accession,
+                           or the summary of that data from combine_risk_csvs()
+    group_list (list): the columns to group by, which is the format name, version, and NARA risk level,
+                       plus the rollup columns for the summary from combine_format_rollups()
+
+    @:returns
+    size (pandas Dataframe): dataframe with the group_list columns and size in GB
+    """
+
+    # Groupby includes NARA risk level so different possible risks for the name/version combination are kept.
+    # Reset index keeps the name, version, and risk level as columns in the dataframe.
+    # Without reset index, it would return a series with those columns as part of the index.
+    size = df.groupby(group_list)['FITS_Size_KB'].sum().reset_index()
+
+    # Converts the KB to GB and rounds to 3 decimal places.
+    # Anything less than 1 MB with have a size of 0.
+    size['Size_GB'] = round(size['FITS_Size_KB'] / 1000000, 3)
+
+    # Removes the KB column, which is not needed now that we have GB.
+    size = size.drop(columns='FITS_Size_KB')
+
+    return size
+
+
+if __name__ == '__main__':
+
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000000
+    print(f'Making test data with {row_count:,} rows')
+    df_files = make_test_data(row_count)
+
+    # Times the three operations: files_per_format(), size_per_format(), and merging them.
+    start = time.perf_counter()
+    df_merged = pd.merge(files_per_format(df_files), size_per_format(df_files), how='outer')
+    merged_seconds = time.perf_counter() - start
+    print(f'files_per_format + size_per_format + merge: {merged_seconds:.2f} seconds')
+
+    # Times format_totals().
+    start = time.perf_counter()
+    df_totals = format_totals(df_files)
+    totals_seconds = time.perf_counter() - start
+    print(f'format_totals: {totals_seconds:.2f} seconds ({merged_seconds / totals_seconds:.1f}x faster)')
+
+    print('Same result:', df_merged.equals(df_totals))
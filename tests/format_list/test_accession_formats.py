@@ -0,0 +1,38 @@
+"""
+Test for the function accession_formats(), which summarizes the format data from one accession's risk csv.
+"""
+import unittest
+from format_list import accession_formats
+from test_df_cleanup import df_to_list
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_duplicates(self):
+        """Test for a risk csv where a file has more than one NARA match with the same risk level"""
+        csv_path = join('combine_test_data', 'one-risk-each', 'closed', 'coll_1', 'acc-1a-er',
+                        'acc-1a-er_full_risk_data.csv')
+        df_formats = accession_formats(csv_path)
+
+        result = df_to_list(df_formats)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Microsoft Word Binary File Format', 'no-version', 'Moderate Risk', 1, 290.304]]
+        self.assertEqual(expected, result, "Problem with test for duplicates")
+
+    def test_multiple_formats(self):
+        """Test for a risk csv with more than one format"""
+        csv_path = join('combine_test_data', 'one-risk', 'acc-1-er', 'acc-1-er_full_risk_data.csv')
+        df_formats = accession_formats(csv_path)
+
+        result = df_to_list(df_formats)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Comma-Separated Values (CSV)', 'no-version', 'Low Risk', 1, 11.717],
+                    ['JPEG EXIF', '1.01', 'Low Risk', 1, 234.849],
+                    ['JPEG File Interchange Format', '1.01', 'Low Risk', 1, 345.611],
+                    ['Plain text', 'no-version', 'Low Risk', 1, 0.139]]
+        self.assertEqual(expected, result, "Problem with test for multiple formats")
+
+
+if __name__ == '__main__':
+    unittest.main()
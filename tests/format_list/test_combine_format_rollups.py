@@ -0,0 +1,63 @@
+"""
+Tests for the function combine_format_rollups(), which finds all risk csvs in a directory
+and combines their format data for all accessions and for each status, collection, and accession.
+"""
+import unittest
+from format_list import combine_format_rollups
+from test_df_cleanup import df_to_list
+from os import getcwd
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_no_risk(self):
+        """Test for an input_directory with no risk csvs"""
+        input_directory = join(getcwd(), 'combine_test_data', 'no-risk')
+        df_all = combine_format_rollups(input_directory)
+
+        result = df_to_list(df_all)
+        expected = [['Level', 'Status', 'Collection', 'Accession', 'FITS_Format_Name', 'FITS_Format_Version',
+                     'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB']]
+
+        self.assertEqual(expected, result, "Problem with test for no risk csvs")
+
+    def test_one_risk_each(self):
+        """Test for an input_directory with one risk csv per accession and more than one collection"""
+        input_directory = join(getcwd(), 'combine_test_data', 'one-risk-each', 'closed')
+        df_all = combine_format_rollups(input_directory)
+
+        result = df_to_list(df_all.round({'FITS_Size_KB': 3}))
+        expected = [['Level', 'Status', 'Collection', 'Accession', 'FITS_Format_Name', 'FITS_Format_Version',
+                     'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Hub', '', '', '', 'Microsoft Word Binary File Format', 'no-version', 'Moderate Risk',
+                     3, 870.912],
+                    ['Status', 'closed', '', '', 'Microsoft Word Binary File Format', 'no-version', 'Moderate Risk',
+                     3, 870.912],
+                    ['Collection', 'closed', 'coll_1', '', 'Microsoft Word Binary File Format', 'no-version',
+                     'Moderate Risk', 2, 580.608],
+                    ['Collection', 'closed', 'coll_2', '', 'Microsoft Word Binary File Format', 'no-version',
+                     'Moderate Risk', 1, 290.304],
+                    ['Accession', 'closed', 'coll_1', 'acc-1a-er', 'Microsoft Word Binary File Format', 'no-version',
+                     'Moderate Risk', 1, 290.304],
+                    ['Accession', 'closed', 'coll_1', 'acc-1b-er', 'Microsoft Word Binary File Format', 'no-version',
+                     'Moderate Risk', 1, 290.304],
+                    ['Accession', 'closed', 'coll_2', 'acc-2a-er', 'Microsoft Word Binary File Format', 'no-version',
+                     'Moderate Risk', 1, 290.304]]
+
+        self.assertEqual(expected, result, "Problem with test for one risk csv each accession")
+
+    def test_multiple_workers(self):
+        """Test for summarizing the risk csvs at the same time, which has the same result as one at a time"""
+        input_directory = join(getcwd(), 'combine_test_data', 'one-risk-each', 'closed')
+        df_one = combine_format_rollups(input_directory)
+        df_two = combine_format_rollups(input_directory, workers=2)
+
+        result = df_to_list(df_two.round({'FITS_Size_KB': 3}))
+        expected = df_to_list(df_one.round({'FITS_Size_KB': 3}))
+
+        self.assertEqual(expected, result, "Problem with test for multiple workers")
+
+
+if __name__ == '__main__':
+    unittest.main()
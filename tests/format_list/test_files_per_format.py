@@ -1,15 +1,31 @@
 """
-Tests for the function files_per_format(), which gets the number of files per format name/version/risk combination.
+Tests for the number of files per format name/version/risk combination from format_totals(),
+which replaced the function files_per_format().
 To simplify the test input, tests only have the columns needed for that test.
 """
 import unittest
-from format_list import files_per_format
+from format_list import format_totals
 from test_df_cleanup import df_to_list
 from pandas import DataFrame
 
 
 class MyTestCase(unittest.TestCase):
 
+    def test_file_count(self):
+        """Test for a summary that already has File_Count, from combine_risk_csvs(), so the counts are added"""
+        df_formats = DataFrame([['format1', 'v1', 'Moderate Risk', 2, 223],
+                                ['format1', 'v1', 'Moderate Risk', 3, 10],
+                                ['format1', 'v2', 'Low Risk', 1, 221]],
+                               columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                        'FITS_Size_KB'])
+        df_files = format_totals(df_formats).drop(columns='Size_GB')
+
+        result = df_to_list(df_files)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count'],
+                    ['format1', 'v1', 'Moderate Risk', 5],
+                    ['format1', 'v2', 'Low Risk', 1]]
+        self.assertEqual(expected, result, "Problem with test for file count")
+
     def test_repeats_combined(self):
         """Test for combining repeating name, version, risk combinations (all three match)"""
         df_formats = DataFrame([['path1', 'format1', 'v1', 111, 'Moderate Risk'],
@@ -21,7 +37,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path7', 'format1', 'v2', 333, 'No Match']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_files = files_per_format(df_formats)
+        df_files = format_totals(df_formats).drop(columns='Size_GB')
 
         result = df_to_list(df_files)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count'],
@@ -46,7 +62,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path/version-risk/2', 'format9', 'v9', 6, 'Moderate Risk']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_files = files_per_format(df_formats)
+        df_files = format_totals(df_formats).drop(columns='Size_GB')
 
         result = df_to_list(df_files)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count'],
@@ -72,7 +88,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path4', 'format4', 'v4', 4, 'No Match']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_files = files_per_format(df_formats)
+        df_files = format_totals(df_formats).drop(columns='Size_GB')
 
         result = df_to_list(df_files)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count'],
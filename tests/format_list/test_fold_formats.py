@@ -0,0 +1,47 @@
+"""
+Test for the function fold_formats(), which adds a batch of accession summaries to the running totals for every level.
+"""
+import unittest
+from format_list import fold_formats
+from test_df_cleanup import df_to_list
+from pandas import DataFrame
+
+
+def make_summary(status, collection, accession, rows):
+    """Make the format summary for one accession, with the status, collection, and accession"""
+    df = DataFrame(rows, columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                  'FITS_Size_KB'])
+    return df.assign(Status=status, Collection=collection, Accession=accession)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_empty(self):
+        """Test for a batch with no accessions, which does not change the totals"""
+        totals = fold_formats(dict.fromkeys(['Hub', 'Status', 'Collection', 'Accession']), [])
+        result = list(totals.values())
+        expected = [None, None, None, None]
+        self.assertEqual(expected, result, "Problem with test for empty")
+
+    def test_two_batches(self):
+        """Test for adding two batches, with formats in more than one accession and collection"""
+        totals = dict.fromkeys(['Hub', 'Status', 'Collection', 'Accession'])
+        totals = fold_formats(totals, [make_summary('closed', 'coll_1', 'acc_1', [['f1', 'v1', 'Low Risk', 2, 100.5]]),
+                                       make_summary('closed', 'coll_1', 'acc_2', [['f1', 'v1', 'Low Risk', 1, 10],
+                                                                                  ['f2', 'v1', 'High Risk', 1, 20]])])
+        totals = fold_formats(totals, [make_summary('closed', 'coll_2', 'acc_3', [['f2', 'v1', 'High Risk', 3, 30]])])
+
+        result = [df_to_list(totals['Hub']), df_to_list(totals['Collection'])]
+        expected = [[['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                     ['f1', 'v1', 'Low Risk', 3, 110.5],
+                     ['f2', 'v1', 'High Risk', 4, 50]],
+                    [['Status', 'Collection', 'FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level',
+                      'File_Count', 'FITS_Size_KB'],
+                     ['closed', 'coll_1', 'f1', 'v1', 'Low Risk', 3, 110.5],
+                     ['closed', 'coll_1', 'f2', 'v1', 'High Risk', 1, 20],
+                     ['closed', 'coll_2', 'f2', 'v1', 'High Risk', 3, 30]]]
+        self.assertEqual(expected, result, "Problem with test for two batches")
+
+
+if __name__ == '__main__':
+    unittest.main()
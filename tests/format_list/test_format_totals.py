@@ -0,0 +1,66 @@
+"""
+Tests for the function format_totals(), which gets the number of files and size in GB
+per format name/version/risk combination with one groupby.
+To simplify the test input, tests only have the columns needed for that test.
+"""
+import unittest
+from format_list import format_totals
+from test_df_cleanup import df_to_list
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_file_count(self):
+        """Test for a summary that already has File_Count, from combine_risk_csvs(), so the counts are added"""
+        df_formats = DataFrame([['format1', 'v1', 'Moderate Risk', 2, 223000],
+                                ['format1', 'v1', 'Moderate Risk', 3, 10000],
+                                ['format1', 'v2', 'Low Risk', 1, 221]],
+                               columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                        'FITS_Size_KB'])
+        df_totals = format_totals(df_formats)
+
+        result = df_to_list(df_totals)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'Size_GB'],
+                    ['format1', 'v1', 'Moderate Risk', 5, 0.233],
+                    ['format1', 'v2', 'Low Risk', 1, 0.0]]
+        self.assertEqual(expected, result, "Problem with test for file count")
+
+    def test_files(self):
+        """Test for one row per file, including name, version, and risk combinations that do not repeat"""
+        df_formats = DataFrame([['path1', 'format1', 'v1', 1100000, 'Moderate Risk'],
+                                ['path2', 'format1', 'v1', 1200000, 'Moderate Risk'],
+                                ['path3', 'format1', 'v2', 5500, 'Low Risk'],
+                                ['path4', 'format1', 'v2', 333000, 'No Match'],
+                                ['path5', 'format2', 'v2', 10000000, 'No Match']],
+                               columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
+                                        'NARA_Risk_Level'])
+        df_totals = format_totals(df_formats)
+
+        result = df_to_list(df_totals)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'Size_GB'],
+                    ['format1', 'v1', 'Moderate Risk', 2, 2.3],
+                    ['format1', 'v2', 'Low Risk', 1, 0.006],
+                    ['format1', 'v2', 'No Match', 1, 0.333],
+                    ['format2', 'v2', 'No Match', 1, 10.0]]
+        self.assertEqual(expected, result, "Problem with test for files")
+
+    def test_group_list(self):
+        """Test for grouping by the rollup columns as well, from combine_format_rollups()"""
+        df_formats = DataFrame([['Collection', 'coll_1', 'format1', 'v1', 'Low Risk', 2, 1000000],
+                                ['Collection', 'coll_2', 'format1', 'v1', 'Low Risk', 1, 2000000]],
+                               columns=['Level', 'Collection', 'FITS_Format_Name', 'FITS_Format_Version',
+                                        'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'])
+        df_totals = format_totals(df_formats, ['Level', 'Collection', 'FITS_Format_Name', 'FITS_Format_Version',
+                                               'NARA_Risk_Level'])
+
+        result = df_to_list(df_totals)
+        expected = [['Level', 'Collection', 'FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level',
+                     'File_Count', 'Size_GB'],
+                    ['Collection', 'coll_1', 'format1', 'v1', 'Low Risk', 2, 1.0],
+                    ['Collection', 'coll_2', 'format1', 'v1', 'Low Risk', 1, 2.0]]
+        self.assertEqual(expected, result, "Problem with test for group list")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+Test for the function formats_parallel(), which summarizes many risk csvs at the same time.
+The expected results are from accession_formats(), which summarizes one risk csv at a time.
+"""
+import unittest
+from format_list import accession_formats, formats_parallel
+from test_df_cleanup import df_to_list
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_order(self):
+        """Test the summaries are the same as one at a time and in the same order as the list,
+        with more risk csvs than workers"""
+        csv_list = [join('combine_test_data', 'one-risk', 'acc-1-er', 'acc-1-er_full_risk_data.csv'),
+                    join('combine_test_data', 'multiple-risks', 'backlogged', 'coll_1', 'acc_1a_er',
+                         'acc_1a_er_full_risk_data_2030-05-01.csv'),
+                    join('combine_test_data', 'one-risk-each', 'closed', 'coll_1', 'acc-1a-er',
+                         'acc-1a-er_full_risk_data.csv')] * 3
+        summaries = formats_parallel(csv_list, 2)
+
+        result = [df_to_list(df) for df in summaries]
+        expected = [df_to_list(accession_formats(csv_path)) for csv_path in csv_list]
+        self.assertEqual(expected, result, "Problem with test for order")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+Test for the function hash_paths(), which replaces the file paths with a 64-bit hash of each path.
+"""
+import unittest
+from format_list import hash_paths
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_hash_paths(self):
+        """Test that the same path has the same hash, different paths have different hashes,
+        and the other columns are not changed"""
+        df = DataFrame([['C:\\acc\\file1.txt', 'Plain text'],
+                        ['C:\\acc\\file2.txt', 'Plain text'],
+                        ['C:\\acc\\file1.txt', 'Plain text']],
+                       columns=['FITS_File_Path', 'FITS_Format_Name'])
+        df_hash = hash_paths(df)
+
+        hashes = df_hash['FITS_File_Path']
+        result = [df_hash.columns.tolist(), str(hashes.dtype), hashes.nunique(), hashes[0] == hashes[2],
+                  df_hash['FITS_Format_Name'].tolist()]
+        expected = [['FITS_File_Path', 'FITS_Format_Name'], 'uint64', 2, True,
+                    ['Plain text', 'Plain text', 'Plain text']]
+        self.assertEqual(expected, result, "Problem with test for hash paths")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Tests for the function merge_risk_levels(), which merges rows with the same format name and version
+and different NARA risk levels into one row.
+"""
+import unittest
+from format_list import merge_risk_levels
+from test_df_cleanup import df_to_list
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_merge(self):
+        """Test for each variation of risk levels for a format name and version"""
+        df = DataFrame([['format1', 'v1', 'Low Risk', 1, 10],
+                        ['format2', 'v1', 'Low Risk', 1, 10],
+                        ['format2', 'v1', 'High Risk', 2, 20],
+                        ['format2', 'v1', 'Moderate Risk', 3, 30],
+                        ['format3', 'v1', 'Moderate Risk', 1, 10],
+                        ['format3', 'v1', 'No Match', 1, 10],
+                        ['format4', 'v1', 'No Match', 1, 10],
+                        ['format4', 'v2', 'Low Risk', 1, 10]],
+                       columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                'FITS_Size_KB'])
+        df_merged = merge_risk_levels(df)
+
+        result = df_to_list(df_merged)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['format1', 'v1', 'Low Risk', 1, 10],
+                    ['format2', 'v1', 'Low-High Risk', 6, 60],
+                    ['format3', 'v1', 'Moderate Risk', 2, 20],
+                    ['format4', 'v1', 'No Match', 1, 10],
+                    ['format4', 'v2', 'Low Risk', 1, 10]]
+        self.assertEqual(expected, result, "Problem with test for merge")
+
+    def test_no_ranked(self):
+        """Test for a format name and version with more than one risk level that is not in RISK_ORDER"""
+        df = DataFrame([['format1', 'v1', 'No Match', 1, 10],
+                        ['format1', 'v1', 'NO VALUE', 1, 10]],
+                       columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                'FITS_Size_KB'])
+        df_merged = merge_risk_levels(df)
+
+        result = df_to_list(df_merged)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['format1', 'v1', 'NO VALUE|No Match', 2, 20]]
+        self.assertEqual(expected, result, "Problem with test for no ranked risk levels")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests for the function normalize_formats(), which normalizes format names that are different for each file
+and combines rows that are the same format after normalizing.
+"""
+import unittest
+from format_list import normalize_formats
+from test_df_cleanup import df_to_list
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_default_rules(self):
+        """Test for the default rules, with format names that do and do not need to be normalized"""
+        df = DataFrame([['Cannot open C:\\folder\\file.txt', 'no-version', 'No Match', 1, 10],
+                        ['Cannot open C:\\folder\\other file.txt', 'no-version', 'No Match', 2, 20],
+                        ['Cabinet 12 Files', 'no-version', 'Low Risk', 1, 100],
+                        ['Plain text', 'no-version', 'Low Risk', 3, 30]],
+                       columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                'FITS_Size_KB'])
+        df_normalized = normalize_formats(df)
+
+        result = df_to_list(df_normalized)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Cabinet', 'no-version', 'Low Risk', 1, 100],
+                    ['Cannot open', 'no-version', 'No Match', 3, 30],
+                    ['Plain text', 'no-version', 'Low Risk', 3, 30]]
+        self.assertEqual(expected, result, "Problem with test for default rules")
+
+    def test_no_rules(self):
+        """Test for an empty rule table, where no format names are changed but duplicate rows are still combined"""
+        df = DataFrame([['Cannot open file.txt', 'no-version', 'No Match', 1, 10],
+                        ['Cannot open file.txt', 'no-version', 'No Match', 2, 20],
+                        ['Cabinet 12 Files', 'no-version', 'Low Risk', 1, 100]],
+                       columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                'FITS_Size_KB'])
+        df_normalized = normalize_formats(df, [])
+
+        result = df_to_list(df_normalized)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Cabinet 12 Files', 'no-version', 'Low Risk', 1, 100],
+                    ['Cannot open file.txt', 'no-version', 'No Match', 3, 30]]
+        self.assertEqual(expected, result, "Problem with test for no rules")
+
+    def test_rules(self):
+        """Test for a rule table other than the default, where the first matching rule is used"""
+        df = DataFrame([['Draft 1 Document', '1', 'Low Risk', 1, 10],
+                        ['Draft Image', '1', 'Low Risk', 1, 20],
+                        ['Cannot open file.txt', 'no-version', 'No Match', 1, 30]],
+                       columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                                'FITS_Size_KB'])
+        rules = [(r'Draft \d+ Document', 'Document'), (r'Draft .*', 'Draft')]
+        df_normalized = normalize_formats(df, rules)
+
+        result = df_to_list(df_normalized)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Cannot open file.txt', 'no-version', 'No Match', 1, 30],
+                    ['Document', '1', 'Low Risk', 1, 10],
+                    ['Draft', '1', 'Low Risk', 1, 20]]
+        self.assertEqual(expected, result, "Problem with test for rules")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for the function read_format_cache(), which gets the format summary for a risk csv from the cache
+if the risk csv has the same size and modification time as when it was saved with save_format_cache().
+"""
+import unittest
+from format_list import accession_formats, format_cache, read_format_cache, save_format_cache
+from test_df_cleanup import df_to_list
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """An in-memory cache with the format summary for one risk csv"""
+        self.csv_path = join('combine_test_data', 'one-risk', 'acc-1-er', 'acc-1-er_full_risk_data.csv')
+        self.connection = format_cache(':memory:')
+        save_format_cache(self.connection, self.csv_path, accession_formats(self.csv_path))
+
+    def tearDown(self):
+        """Close the in-memory cache"""
+        self.connection.close()
+
+    def test_changed_mtime(self):
+        """Test for when the risk csv was modified after it was cached, so the cached summary is not used"""
+        self.connection.execute('UPDATE risk_csv SET mtime = mtime - 1000000000')
+        formats = read_format_cache(self.connection, self.csv_path)
+        self.assertEqual(None, formats, "Problem with test for changed mtime")
+
+    def test_changed_size(self):
+        """Test for when the risk csv is a different size than when it was cached, so the cached summary is not used"""
+        self.connection.execute('UPDATE risk_csv SET size = size + 1')
+        formats = read_format_cache(self.connection, self.csv_path)
+        self.assertEqual(None, formats, "Problem with test for changed size")
+
+    def test_not_cached(self):
+        """Test for a risk csv that is not in the cache"""
+        csv_path = join('combine_test_data', 'one-risk-each', 'closed', 'coll_1', 'acc-1a-er',
+                        'acc-1a-er_full_risk_data.csv')
+        formats = read_format_cache(self.connection, csv_path)
+        self.assertEqual(None, formats, "Problem with test for not cached")
+
+    def test_replaced(self):
+        """Test for when the risk csv is cached again, so only the newest summary is used"""
+        formats = accession_formats(self.csv_path)
+        save_format_cache(self.connection, self.csv_path, formats[formats['FITS_Format_Name'] == 'Plain text'])
+        formats = read_format_cache(self.connection, self.csv_path)
+
+        result = df_to_list(formats.round({'FITS_Size_KB': 3}))
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Plain text', 'no-version', 'Low Risk', 1, 0.139]]
+        self.assertEqual(expected, result, "Problem with test for replaced")
+
+    def test_unchanged(self):
+        """Test for when the risk csv has not changed since it was cached, so the cached summary is used"""
+        formats = read_format_cache(self.connection, self.csv_path)
+
+        result = df_to_list(formats.round({'FITS_Size_KB': 3}))
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['Comma-Separated Values (CSV)', 'no-version', 'Low Risk', 1, 11.717],
+                    ['JPEG EXIF', '1.01', 'Low Risk', 1, 234.849],
+                    ['JPEG File Interchange Format', '1.01', 'Low Risk', 1, 345.611],
+                    ['Plain text', 'no-version', 'Low Risk', 1, 0.139]]
+        self.assertEqual(expected, result, "Problem with test for unchanged")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,8 +24,10 @@ class MyTestCase(unittest.TestCase):
     def tearDown(self):
         """Delete the test output if it was created"""
         today = date.today().strftime('%Y-%m-%d')
-        if exists(join('script_test_data', f'combined_format_data_{today}.csv')):
-            remove(join('script_test_data', f'combined_format_data_{today}.csv'))
+        for report_name in ('combined_format_data', 'combined_format_data_rollups', 'combined_format_data_normalized'):
+            for file_name in (f'{report_name}_{today}.csv', f'{report_name}_{today}.parquet'):
+                if exists(join('script_test_data', file_name)):
+                    remove(join('script_test_data', file_name))
 
     def test_correct(self):
         script = join(getcwd(), '..', '..', 'format_list.py')
@@ -45,6 +47,86 @@ class MyTestCase(unittest.TestCase):
                     ['Unknown Binary', 'no-version', 'No Match', 1, 0.0]]
         self.assertEqual(expected, result, 'Problem with test for correct')
 
+    def test_correct_normalized(self):
+        """Test for the format data normalized for combining with other departments"""
+        script = join(getcwd(), '..', '..', 'format_list.py')
+        input_directory = 'script_test_data'
+        run(f'python "{script}" "{input_directory}"', shell=True, stdout=PIPE)
+
+        today = date.today().strftime('%Y-%m-%d')
+        result = csv_to_list(join('script_test_data', f'combined_format_data_normalized_{today}.csv'))
+        expected = [['Source', 'FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'Size_GB'],
+                    ['Hub', 'JPEG File Interchange Format', '1.01', 'Low Risk', 2, 82.858],
+                    ['Hub', 'JPEG File Interchange Format', '1.02', 'Low Risk', 3, 0.183],
+                    ['Hub', 'PDF/A', '1b', 'Low Risk', 1, 45.837],
+                    ['Hub', 'Plain text', 'no-version', 'Moderate Risk', 1, 5.113],
+                    ['Hub', 'Portable Document Format', '1.4', 'Moderate Risk', 2, 0.504],
+                    ['Hub', 'Portable Network Graphics', '1', 'Moderate-High Risk', 2, 463.326],
+                    ['Hub', 'Unknown Binary', 'no-version', 'No Match', 1, 0.0]]
+        self.assertEqual(expected, result, 'Problem with test for correct normalized')
+
+    def test_correct_rollups(self):
+        """Test for the format data for each status, collection, and accession"""
+        script = join(getcwd(), '..', '..', 'format_list.py')
+        input_directory = 'script_test_data'
+        run(f'python "{script}" "{input_directory}"', shell=True, stdout=PIPE)
+
+        today = date.today().strftime('%Y-%m-%d')
+        result = csv_to_list(join('script_test_data', f'combined_format_data_rollups_{today}.csv'))
+        expected = [['Level', 'Status', 'Collection', 'Accession', 'FITS_Format_Name', 'FITS_Format_Version',
+                     'NARA_Risk_Level', 'File_Count', 'Size_GB'],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'JPEG File Interchange Format', '1.01', 'Low Risk',
+                     2, 82.858],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'JPEG File Interchange Format', '1.02', 'Low Risk',
+                     3, 0.183],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'PDF/A', '1b', 'Low Risk', 1, 45.837],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'Plain text', 'no-version', 'Moderate Risk',
+                     1, 5.113],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'Portable Document Format', '1.4', 'Moderate Risk',
+                     2, 0.504],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'Portable Network Graphics', '1', 'High Risk',
+                     1, 205.688],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'Portable Network Graphics', '1', 'Moderate Risk',
+                     1, 257.638],
+                    ['Status', 'script_test_data', 'nan', 'nan', 'Unknown Binary', 'no-version', 'No Match', 1, 0.0],
+                    ['Collection', 'script_test_data', 'coll_1', 'nan', 'JPEG File Interchange Format', '1.01',
+                     'Low Risk', 1, 0.22],
+                    ['Collection', 'script_test_data', 'coll_1', 'nan', 'JPEG File Interchange Format', '1.02',
+                     'Low Risk', 3, 0.183],
+                    ['Collection', 'script_test_data', 'coll_1', 'nan', 'Portable Document Format', '1.4',
+                     'Moderate Risk', 2, 0.504],
+                    ['Collection', 'script_test_data', 'coll_1', 'nan', 'Unknown Binary', 'no-version', 'No Match',
+                     1, 0.0],
+                    ['Collection', 'script_test_data', 'coll_2', 'nan', 'JPEG File Interchange Format', '1.01',
+                     'Low Risk', 1, 82.638],
+                    ['Collection', 'script_test_data', 'coll_2', 'nan', 'PDF/A', '1b', 'Low Risk', 1, 45.837],
+                    ['Collection', 'script_test_data', 'coll_2', 'nan', 'Plain text', 'no-version', 'Moderate Risk',
+                     1, 5.113],
+                    ['Collection', 'script_test_data', 'coll_2', 'nan', 'Portable Network Graphics', '1', 'High Risk',
+                     1, 205.688],
+                    ['Collection', 'script_test_data', 'coll_2', 'nan', 'Portable Network Graphics', '1',
+                     'Moderate Risk', 1, 257.638],
+                    ['Accession', 'script_test_data', 'coll_1', 'acc_1a', 'JPEG File Interchange Format', '1.01',
+                     'Low Risk', 1, 0.22],
+                    ['Accession', 'script_test_data', 'coll_1', 'acc_1a', 'JPEG File Interchange Format', '1.02',
+                     'Low Risk', 1, 0.183],
+                    ['Accession', 'script_test_data', 'coll_1', 'acc_1a', 'Portable Document Format', '1.4',
+                     'Moderate Risk', 2, 0.504],
+                    ['Accession', 'script_test_data', 'coll_1', 'acc_1b', 'JPEG File Interchange Format', '1.02',
+                     'Low Risk', 2, 0.0],
+                    ['Accession', 'script_test_data', 'coll_1', 'acc_1b', 'Unknown Binary', 'no-version', 'No Match',
+                     1, 0.0],
+                    ['Accession', 'script_test_data', 'coll_2', 'acc_2a', 'JPEG File Interchange Format', '1.01',
+                     'Low Risk', 1, 82.638],
+                    ['Accession', 'script_test_data', 'coll_2', 'acc_2a', 'PDF/A', '1b', 'Low Risk', 1, 45.837],
+                    ['Accession', 'script_test_data', 'coll_2', 'acc_2a', 'Plain text', 'no-version', 'Moderate Risk',
+                     1, 5.113],
+                    ['Accession', 'script_test_data', 'coll_2', 'acc_2a', 'Portable Network Graphics', '1',
+                     'High Risk', 1, 205.688],
+                    ['Accession', 'script_test_data', 'coll_2', 'acc_2a', 'Portable Network Graphics', '1',
+                     'Moderate Risk', 1, 257.638]]
+        self.assertEqual(expected, result, 'Problem with test for correct rollups')
+
     def test_error(self):
         """Test for when the script argument is not correct and the script exits"""
         # Makes the variables used for script input.
@@ -1,9 +1,10 @@
 """
-Test for the function size_per_format(), which gets the GB per format name/version/risk combination.
+Test for the GB per format name/version/risk combination from format_totals(),
+which replaced the function size_per_format().
 To simplify the test input, tests only have the columns needed for that test.
 """
 import unittest
-from format_list import size_per_format
+from format_list import format_totals
 from test_df_cleanup import df_to_list
 from pandas import DataFrame
 
@@ -19,7 +20,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path5', 'format2', 'v1', 2, 'Moderate Risk']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_size = size_per_format(df_formats)
+        df_size = format_totals(df_formats).drop(columns='File_Count')
 
         result = df_to_list(df_size)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'Size_GB'],
@@ -37,7 +38,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path5', 'format2', 'v1', 20000, 'Moderate Risk']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_size = size_per_format(df_formats)
+        df_size = format_totals(df_formats).drop(columns='File_Count')
 
         result = df_to_list(df_size)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'Size_GB'],
@@ -55,7 +56,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path5', 'format2', 'v1', 20003003, 'Moderate Risk']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_size = size_per_format(df_formats)
+        df_size = format_totals(df_formats).drop(columns='File_Count')
 
         result = df_to_list(df_size)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'Size_GB'],
@@ -80,7 +81,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path/version-risk/2', 'format9', 'v9', 12000000, 'Moderate Risk']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_size = size_per_format(df_formats)
+        df_size = format_totals(df_formats).drop(columns='File_Count')
 
         result = df_to_list(df_size)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'Size_GB'],
@@ -106,7 +107,7 @@ class MyTestCase(unittest.TestCase):
                                 ['path4', 'format4', 'v4', 4000000, 'No Match']],
                                columns=['FITS_File_Path', 'FITS_Format_Name', 'FITS_Format_Version', 'FITS_Size_KB',
                                         'NARA_Risk_Level'])
-        df_size = size_per_format(df_formats)
+        df_size = format_totals(df_formats).drop(columns='File_Count')
 
         result = df_to_list(df_size)
         expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'Size_GB'],
@@ -0,0 +1,49 @@
+"""
+Test for the function sum_formats(), which adds together the format summaries for the accessions in a group.
+"""
+import unittest
+from format_list import sum_formats
+from test_df_cleanup import df_to_list
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Format summaries for three accessions in two collections"""
+        self.formats = DataFrame([['coll1', 'acc1', 'format1', 'v1', 'Low Risk', 5, 1000],
+                                  ['coll1', 'acc1', 'format1', 'v1', 'No Match', 1, 1],
+                                  ['coll1', 'acc2', 'format1', 'v1', 'Low Risk', 2, 100.5],
+                                  ['coll1', 'acc2', 'format2', 'v1', 'High Risk', 1, 20],
+                                  ['coll2', 'acc3', 'format2', 'v1', 'High Risk', 3, 30]],
+                                 columns=['Collection', 'Accession', 'FITS_Format_Name', 'FITS_Format_Version',
+                                          'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'])
+
+    def test_collection(self):
+        """Test for adding the summaries for each collection"""
+        totals = sum_formats(self.formats, ['Collection', 'FITS_Format_Name', 'FITS_Format_Version',
+                                            'NARA_Risk_Level'])
+
+        result = df_to_list(totals)
+        expected = [['Collection', 'FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count',
+                     'FITS_Size_KB'],
+                    ['coll1', 'format1', 'v1', 'Low Risk', 7, 1100.5],
+                    ['coll1', 'format1', 'v1', 'No Match', 1, 1],
+                    ['coll1', 'format2', 'v1', 'High Risk', 1, 20],
+                    ['coll2', 'format2', 'v1', 'High Risk', 3, 30]]
+        self.assertEqual(expected, result, "Problem with test for collection")
+
+    def test_hub(self):
+        """Test for adding the summaries for every accession, with some formats in more than one"""
+        totals = sum_formats(self.formats)
+
+        result = df_to_list(totals)
+        expected = [['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level', 'File_Count', 'FITS_Size_KB'],
+                    ['format1', 'v1', 'Low Risk', 7, 1100.5],
+                    ['format1', 'v1', 'No Match', 1, 1],
+                    ['format2', 'v1', 'High Risk', 4, 50]]
+        self.assertEqual(expected, result, "Problem with test for hub")
+
+
+if __name__ == '__main__':
+    unittest.main()
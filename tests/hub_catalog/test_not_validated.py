@@ -0,0 +1,36 @@
+"""
+Tests for the function not_validated(), which finds the accessions that have not been validated recently.
+"""
+from datetime import datetime, timedelta
+import os
+import unittest
+from hub_catalog import make_catalog, not_validated, save_catalog_rows
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the test catalog, if it was made"""
+        if os.path.exists('test_catalog.sqlite'):
+            os.remove('test_catalog.sqlite')
+
+    def test_not_validated(self):
+        """Test for accessions validated recently, validated a long time ago, and never validated"""
+        # Makes a catalog with each accession. acc_2 was validated long ago and again recently.
+        make_catalog('test_catalog.sqlite')
+        recent = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d %H:%M:%S')
+        paths = {acc: os.path.join('born-digital', 'closed', 'coll_1', acc) for acc in ('acc_1', 'acc_2', 'acc_3')}
+        save_catalog_rows('fixity_event', [[paths['acc_1'], '2020-01-01 09:00:00', 'Bag', True, 'Valid'],
+                                           [paths['acc_2'], '2020-01-01 10:00:00', 'Bag', True, 'Valid'],
+                                           [paths['acc_2'], recent, 'Bag', True, 'Valid']], 'test_catalog.sqlite')
+        save_catalog_rows('risk_count', [[paths['acc_3'], recent, 0, 0, 0, 1]], 'test_catalog.sqlite')
+
+        # Verifies the accessions not validated in 13 months are returned, oldest first.
+        df = not_validated(13, 'test_catalog.sqlite')
+        result = df.fillna('nan')[['accession', 'last_validated']].values.tolist()
+        expected = [['acc_3', 'nan'], ['acc_1', '2020-01-01 09:00:00']]
+        self.assertEqual(expected, result, "Problem with test for not validated")
+
+
+if __name__ == '__main__':
+    unittest.main()
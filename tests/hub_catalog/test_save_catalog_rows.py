@@ -0,0 +1,51 @@
+"""
+Tests for the function save_catalog_rows(), which saves rows to a table in the catalog, if the catalog exists.
+"""
+import os
+import sqlite3
+import unittest
+from hub_catalog import make_catalog, save_catalog_rows
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the test catalog, if it was made"""
+        if os.path.exists('test_catalog.sqlite'):
+            os.remove('test_catalog.sqlite')
+
+    def test_no_catalog(self):
+        """Test for when there is no catalog, so nothing is saved and the catalog is not made"""
+        saved = save_catalog_rows('risk_count', [[os.path.join('born-digital', 'closed', 'coll_1', 'acc_1'),
+                                                  '2024-01-01 00:00:00', 1, 2, 3, 4]], 'test_catalog.sqlite')
+        self.assertEqual(False, saved, "Problem with test for no catalog, returned value")
+        self.assertEqual(False, os.path.exists('test_catalog.sqlite'), "Problem with test for no catalog, file")
+
+    def test_rows(self):
+        """Test for saving rows, which also adds the accessions, and saving a row again, which replaces it"""
+        make_catalog('test_catalog.sqlite')
+        acc_1 = os.path.join('born-digital', 'closed', 'coll_1', 'acc_1')
+        acc_2 = os.path.join('born-digital', 'backlogged', 'coll_2', 'acc_2')
+        save_catalog_rows('risk_count', [[acc_1, '2024-01-01 00:00:00', 1, 2, 3, 4],
+                                         [acc_2, '2024-01-01 00:00:00', 0, 0, 0, 5]], 'test_catalog.sqlite')
+        saved = save_catalog_rows('risk_count', [[acc_1, '2024-01-01 00:00:00', 1, 1, 1, 1]], 'test_catalog.sqlite')
+        self.assertEqual(True, saved, "Problem with test for rows, returned value")
+
+        # Verifies the table has the expected rows, with full paths.
+        connection = sqlite3.connect('test_catalog.sqlite')
+        result = connection.execute('SELECT * FROM risk_count ORDER BY path').fetchall()
+        expected = sorted([(os.path.abspath(acc_1), '2024-01-01 00:00:00', 1, 1, 1, 1),
+                           (os.path.abspath(acc_2), '2024-01-01 00:00:00', 0, 0, 0, 5)])
+        self.assertEqual(expected, result, "Problem with test for rows, risk_count")
+
+        # Verifies the accession table has the accessions, with the status, collection, and accession from the path.
+        query = 'SELECT path, status, collection, accession FROM accession ORDER BY path'
+        result = connection.execute(query).fetchall()
+        expected = sorted([(os.path.abspath(acc_1), 'closed', 'coll_1', 'acc_1'),
+                           (os.path.abspath(acc_2), 'backlogged', 'coll_2', 'acc_2')])
+        connection.close()
+        self.assertEqual(expected, result, "Problem with test for rows, accession")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the function folder_files(), which lists the files in every folder at the accession level
+using a recent saved inventory, instead of navigating every folder.
+"""
+import os
+import unittest
+from hub_inventory import folder_files, save_inventory, scan_inventory
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the saved inventory, if a test made one"""
+        inventory_path = os.path.join('test_data', 'born-digital', 'hub_inventory.csv')
+        if os.path.exists(inventory_path):
+            os.remove(inventory_path)
+
+    def test_accessions_only(self):
+        """Test for only including folders that are accessions"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        folder_list = folder_files(os.path.join(input_dir, 'backlogged'), accessions_only=True)
+
+        result = [(os.path.basename(path), sorted(files)) for path, files in folder_list]
+        expected = [('2020-01-er', ['2020-01-er_full_risk_data.csv', '2020-01-er_full_risk_data_2024-02-19.csv',
+                                    'initialmanifest_20200101.csv', 'preservation_log.txt'])]
+        self.assertEqual(expected, result, "Problem with test for accessions only")
+
+    def test_all_folders(self):
+        """Test for including every folder at the accession level"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        folder_list = folder_files(input_dir)
+
+        result = sorted((os.path.basename(path), sorted(files)) for path, files in folder_list)
+        expected = [('2020-01-er', ['2020-01-er_full_risk_data.csv', '2020-01-er_full_risk_data_2024-02-19.csv',
+                                    'initialmanifest_20200101.csv', 'preservation_log.txt']),
+                    ('2021-02-er', ['2021-02-er_zip_md5.txt']),
+                    ('2021-03-er', []),
+                    ('appraisal', ['notes.txt'])]
+        self.assertEqual(expected, result, "Problem with test for all folders")
+
+    def test_not_status(self):
+        """Test for a folder that is not within a status folder, so the script navigates the folders itself"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        folder_list = folder_files(os.path.join(input_dir, 'documentation'))
+        self.assertIsNone(folder_list, "Problem with test for not status")
+
+    def test_no_saved(self):
+        """Test for when there is no saved inventory, so the script navigates the folders itself"""
+        folder_list = folder_files(os.path.join('test_data', 'born-digital'))
+        self.assertIsNone(folder_list, "Problem with test for no saved inventory")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for the function load_inventory(), which gets the inventory from a recent saved inventory or makes it again,
+and save_inventory(), which saves the inventory for other scripts to use.
+"""
+import os
+import time
+import unittest
+from hub_inventory import load_inventory, save_inventory, scan_inventory
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the saved inventory, if a test made one"""
+        inventory_path = os.path.join('test_data', 'born-digital', 'hub_inventory.csv')
+        if os.path.exists(inventory_path):
+            os.remove(inventory_path)
+
+    def test_collection(self):
+        """Test for a collection folder, which uses the inventory saved in the folder containing the status folders"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        inventory_df = load_inventory(os.path.join(input_dir, 'closed', 'coll_2'), scan=False)
+
+        result = sorted(inventory_df['Accession'].tolist())
+        expected = ['2021-02-er', '2021-03-er']
+        self.assertEqual(expected, result, "Problem with test for collection")
+
+    def test_changed_accession(self):
+        """Test for when a folder at the accession level changed since the inventory was saved, so it is made again"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        accession_path = os.path.join(input_dir, 'closed', 'coll_2', '2021-03-er')
+        risk_path = os.path.join(accession_path, '2021-03-er_full_risk_data.csv')
+        with open(risk_path, 'w') as risk_csv:
+            risk_csv.write('FITS_File_Path\n')
+        later = time.time() + 10
+        os.utime(accession_path, (later, later))
+        try:
+            inventory_df = load_inventory(input_dir, scan=False)
+        finally:
+            os.remove(risk_path)
+
+        result = sorted(inventory_df[['Accession', 'Risk_CSVs']].values.tolist())[1:]
+        expected = [['2021-02-er', ''], ['2021-03-er', '2021-03-er_full_risk_data.csv'], ['appraisal', '']]
+        self.assertEqual(expected, result, "Problem with test for changed accession")
+
+    def test_changed_bag_info(self):
+        """Test for when bag-info.txt was edited since the inventory was saved, which does not change the folder"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        bag_info_path = os.path.join(input_dir, 'closed', 'coll_2', '2021-03-er', '2021-03-er_zipped_bag',
+                                     'bag-info.txt')
+        with open(bag_info_path) as bag_info:
+            original = bag_info.read()
+        with open(bag_info_path, 'w') as bag_info:
+            bag_info.write('Bagging-Date: 2024-03-01\nPayload-Oxum: 10.2\n')
+        later = time.time() + 10
+        os.utime(bag_info_path, (later, later))
+        try:
+            inventory_df = load_inventory(input_dir, scan=False)
+        finally:
+            with open(bag_info_path, 'w') as bag_info:
+                bag_info.write(original)
+
+        result = inventory_df.loc[inventory_df['Accession'] == '2021-03-er', 'Payload_Oxum'].tolist()
+        expected = ['10.2']
+        self.assertEqual(expected, result, "Problem with test for changed bag-info.txt")
+
+    def test_new_accession(self):
+        """Test for when a folder was added to a collection since the inventory was saved, so it is not used"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        collection_path = os.path.join(input_dir, 'backlogged', 'coll_1')
+        os.mkdir(os.path.join(collection_path, '2024-05-er'))
+        later = time.time() + 10
+        os.utime(collection_path, (later, later))
+        try:
+            self.assertIsNone(load_inventory(input_dir, scan=False), "Problem with test for new accession, input_dir")
+            self.assertIsNone(load_inventory(collection_path, scan=False),
+                              "Problem with test for new accession, collection")
+            self.assertIsNotNone(load_inventory(os.path.join(input_dir, 'closed'), scan=False),
+                                 "Problem with test for new accession, other status")
+        finally:
+            os.rmdir(os.path.join(collection_path, '2024-05-er'))
+
+    def test_no_saved(self):
+        """Test for when there is no saved inventory"""
+        input_dir = os.path.join('test_data', 'born-digital')
+
+        # Without scanning, nothing is returned.
+        self.assertIsNone(load_inventory(input_dir, scan=False), "Problem with test for no saved, scan is False")
+
+        # With scanning, the inventory is made again.
+        result = load_inventory(input_dir).drop(columns=['Created']).values.tolist()
+        expected = scan_inventory(input_dir).drop(columns=['Created']).values.tolist()
+        self.assertEqual(expected, result, "Problem with test for no saved, scan is True")
+
+    def test_not_status(self):
+        """Test for a folder that is not within a status folder, so it is not part of the saved inventory"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        save_inventory(input_dir, scan_inventory(input_dir))
+        inventory_df = load_inventory(os.path.join(input_dir, 'documentation'), scan=False)
+        self.assertIsNone(inventory_df, "Problem with test for not status")
+
+    def test_old(self):
+        """Test for when the saved inventory is older than the maximum age, so it is not used"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        inventory_path = save_inventory(input_dir, scan_inventory(input_dir))
+        two_days_ago = time.time() - 2 * 24 * 60 * 60
+        os.utime(inventory_path, (two_days_ago, two_days_ago))
+        self.assertIsNone(load_inventory(input_dir, scan=False), "Problem with test for old")
+
+    def test_saved(self):
+        """Test for when there is a recent saved inventory, which has the same data types and full paths"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        scan_df = scan_inventory(input_dir)
+        save_inventory(input_dir, scan_df)
+        inventory_df = load_inventory(input_dir, scan=False)
+
+        # Verifies the data types and the data are the same, other than the paths being full paths.
+        self.assertEqual(scan_df.dtypes.tolist(), inventory_df.dtypes.tolist(), "Problem with test for saved, types")
+        scan_df['Path'] = scan_df['Path'].map(os.path.abspath)
+        self.assertEqual(scan_df.drop(columns=['Created']).values.tolist(),
+                         inventory_df.drop(columns=['Created']).values.tolist(), "Problem with test for saved")
+
+
+    def test_scan_time(self):
+        """Test for saving the inventory with the time the scan started, so changes during the scan are found"""
+        input_dir = os.path.join('test_data', 'born-digital')
+        started = int(time.time()) - 5
+        inventory_path = save_inventory(input_dir, scan_inventory(input_dir), started)
+        self.assertEqual(started, os.path.getmtime(inventory_path), "Problem with test for scan time")
+
+
+if __name__ == '__main__':
+    unittest.main()
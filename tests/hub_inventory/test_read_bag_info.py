@@ -0,0 +1,28 @@
+"""
+Tests for the function read_bag_info(), which reads the fields in a bag's bag-info.txt file.
+"""
+import os
+import unittest
+from hub_inventory import read_bag_info
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_fields(self):
+        """Test for a bag-info.txt with a field that continues on a second row"""
+        bag_path = os.path.join('test_data', 'born-digital', 'backlogged', 'coll_1', '2020-01-er', '2020-01-er_bag')
+        bag_info = read_bag_info(bag_path)
+        expected = {'Bag-Software-Agent': 'bagit.py v1.8.1 <https://github.com/LibraryOfCongress/bagit-python>',
+                    'Bagging-Date': '2024-02-19', 'Payload-Oxum': '2500000000.12',
+                    'Source-Organization': 'University of Georgia Libraries'}
+        self.assertEqual(expected, bag_info, "Problem with test for fields")
+
+    def test_no_bag_info(self):
+        """Test for a folder without a bag-info.txt file"""
+        bag_path = os.path.join('test_data', 'born-digital', 'closed', 'coll_2', '2021-02-er')
+        bag_info = read_bag_info(bag_path)
+        self.assertEqual({}, bag_info, "Problem with test for no bag-info.txt")
+
+
+if __name__ == '__main__':
+    unittest.main()
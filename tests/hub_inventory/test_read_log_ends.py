@@ -0,0 +1,71 @@
+"""
+Tests for the function read_log_ends(), which reads the first and last row of a preservation log.
+"""
+import os
+import unittest
+import hub_inventory
+from hub_inventory import read_log_ends
+
+HEADER = 'Collection\tAccession\tDate\tMedia Identifier\tAction\tStaff\n'
+
+
+def make_log(text):
+    """Save the text to a test preservation log, without converting line returns"""
+    with open('test_preservation_log.txt', 'w', newline='') as log:
+        log.write(text)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the test log and resets the amount read from the end"""
+        if os.path.exists('test_preservation_log.txt'):
+            os.remove('test_preservation_log.txt')
+        hub_inventory.LOG_TAIL_BYTES = 4096
+
+    def test_blank_row(self):
+        """Test for a log with an extra blank row at the end"""
+        make_log(HEADER + 'coll\tacc\t2024-01-01\t\tAction\tStaff\n\n')
+        result = read_log_ends('test_preservation_log.txt')
+        expected = (HEADER, '\n')
+        self.assertEqual(expected, result, "Problem with test for blank row")
+
+    def test_empty(self):
+        """Test for a log with no text"""
+        make_log('')
+        result = read_log_ends('test_preservation_log.txt')
+        expected = ('', '')
+        self.assertEqual(expected, result, "Problem with test for empty")
+
+    def test_long_row(self):
+        """Test for a last row longer than the amount read from the end at a time"""
+        hub_inventory.LOG_TAIL_BYTES = 5
+        make_log(HEADER + 'coll\tacc\t2024-01-01\t\tAction\tStaff\n' + 'coll\tacc\t2024-02-01\t\tLong action\tStaff\n')
+        result = read_log_ends('test_preservation_log.txt')
+        expected = (HEADER, 'coll\tacc\t2024-02-01\t\tLong action\tStaff\n')
+        self.assertEqual(expected, result, "Problem with test for long row")
+
+    def test_no_end_return(self):
+        """Test for a log without a line return at the end"""
+        make_log(HEADER + 'coll\tacc\t2024-01-01\t\tAction\tStaff')
+        result = read_log_ends('test_preservation_log.txt')
+        expected = (HEADER, 'coll\tacc\t2024-01-01\t\tAction\tStaff')
+        self.assertEqual(expected, result, "Problem with test for no end return")
+
+    def test_one_row(self):
+        """Test for a log with only the header row"""
+        make_log(HEADER)
+        result = read_log_ends('test_preservation_log.txt')
+        expected = (HEADER, HEADER)
+        self.assertEqual(expected, result, "Problem with test for one row")
+
+    def test_windows(self):
+        """Test for a log with Windows line returns, which are read as the same as other line returns"""
+        make_log(HEADER.replace('\n', '\r\n') + 'coll\tacc\t2024-01-01\t\tAction\tStaff\r\n')
+        result = read_log_ends('test_preservation_log.txt')
+        expected = (HEADER, 'coll\tacc\t2024-01-01\t\tAction\tStaff\n')
+        self.assertEqual(expected, result, "Problem with test for windows")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Tests for the function scan_inventory(), which makes the inventory of every folder at the accession level.
+"""
+import os
+import unittest
+from hub_inventory import scan_inventory
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_inventory(self):
+        """Test for every type of fixity, a non-accession folder, and files and folders that are skipped"""
+        inventory_df = scan_inventory(os.path.join('test_data', 'born-digital'))
+
+        # Verifies the Created column has a timestamp for every folder, and then removes it since it varies.
+        self.assertTrue((inventory_df['Created'] > 0).all(), "Problem with test for inventory, Created")
+
+        # Verifies the dataframe has the expected contents, converting it to a list first for easier comparison.
+        # It is sorted because the order folders are listed may be different for different file systems.
+        inventory_df = inventory_df.drop(columns=['Created']).sort_values('Path')
+        result = [inventory_df.columns.tolist()] + inventory_df.values.tolist()
+        coll_1 = os.path.join('test_data', 'born-digital', 'backlogged', 'coll_1')
+        coll_2 = os.path.join('test_data', 'born-digital', 'closed', 'coll_2')
+        expected = [['Status', 'Collection', 'Accession', 'Path', 'Is_Accession', 'Bag_Type', 'Bagging_Date',
+                     'Payload_Oxum', 'Risk_CSVs', 'Preservation_Log', 'Initial_Manifest'],
+                    ['backlogged', 'coll_1', '2020-01-er', os.path.join(coll_1, '2020-01-er'), True, 'Bag',
+                     '2024-02-19', '2500000000.12',
+                     '|'.join(sorted(['2020-01-er_full_risk_data.csv', '2020-01-er_full_risk_data_2024-02-19.csv'])),
+                     True, True],
+                    ['backlogged', 'coll_1', 'appraisal', os.path.join(coll_1, 'appraisal'), False, '', '', '', '',
+                     False, False],
+                    ['closed', 'coll_2', '2021-02-er', os.path.join(coll_2, '2021-02-er'), True, 'Zip', '', '', '',
+                     False, False],
+                    ['closed', 'coll_2', '2021-03-er', os.path.join(coll_2, '2021-03-er'), True, 'Zipped_Bag',
+                     '2024-03-01', '5.1', '', False, False]]
+        # The risk csvs are also sorted, since they are in the order they are listed.
+        result[1][8] = '|'.join(sorted(result[1][8].split('|')))
+        self.assertEqual(expected, result, "Problem with test for inventory")
+
+    def test_multiple_workers(self):
+        """Test for listing folders at the same time, which has the same result in the same order as one at a time"""
+        one_worker = scan_inventory(os.path.join('test_data', 'born-digital')).drop(columns=['Created'])
+        result = scan_inventory(os.path.join('test_data', 'born-digital'), workers=4).drop(columns=['Created'])
+        self.assertEqual(one_worker.values.tolist(), result.values.tolist(), "Problem with test for multiple workers")
+
+    def test_types(self):
+        """Test that the columns have the expected data types"""
+        inventory_df = scan_inventory(os.path.join('test_data', 'born-digital'))
+        result = inventory_df.dtypes.astype(str).tolist()
+        expected = ['object', 'object', 'object', 'object', 'bool', 'float64', 'object', 'object', 'object', 'object',
+                    'bool', 'bool']
+        self.assertEqual(expected, result, "Problem with test for types")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the script hub_inventory.py, which makes an inventory of every folder at the accession level.
+"""
+import os
+import pandas as pd
+import subprocess
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the test output if it was created"""
+        inventory_path = os.path.join('test_data', 'born-digital', 'hub_inventory.csv')
+        if os.path.exists(inventory_path):
+            os.remove(inventory_path)
+
+    def test_correct(self):
+        """Test for running the script on the test data"""
+        # Makes the variable used for script input and runs the script.
+        script = os.path.join(os.getcwd(), '..', '..', 'hub_inventory.py')
+        input_directory = os.path.join('test_data', 'born-digital')
+        script_message = subprocess.run(f'python {script} {input_directory}', shell=True, stdout=subprocess.PIPE)
+
+        # Tests the correct message is printed. Line endings are removed, since they depend on the operating system.
+        inventory_path = os.path.join(input_directory, 'hub_inventory.csv')
+        result = script_message.stdout.decode('utf-8').strip()
+        expected = f'Inventoried 4 folders at the accession level. See {inventory_path}.'
+        self.assertEqual(expected, result, "Problem with test for correct, printed message")
+
+        # Tests the inventory has the expected folders, with full paths.
+        df = pd.read_csv(inventory_path)
+        result = sorted(zip(df['Accession'], df['Path']))
+        expected = sorted((folder, os.path.abspath(os.path.join(input_directory, status, collection, folder)))
+                          for status, collection, folder in [('backlogged', 'coll_1', '2020-01-er'),
+                                                             ('backlogged', 'coll_1', 'appraisal'),
+                                                             ('closed', 'coll_2', '2021-02-er'),
+                                                             ('closed', 'coll_2', '2021-03-er')])
+        self.assertEqual(expected, result, "Problem with test for correct, inventory")
+
+    def test_error(self):
+        """Test for running the script without the required argument"""
+        script = os.path.join(os.getcwd(), '..', '..', 'hub_inventory.py')
+        script_message = subprocess.run(f'python {script}', shell=True, stdout=subprocess.PIPE)
+
+        result = script_message.stdout.decode('utf-8').strip()
+        expected = 'Provide one argument, input_directory, which is the folder containing the status folders'
+        self.assertEqual(expected, result, "Problem with test for error")
+
+
+if __name__ == '__main__':
+    unittest.main()
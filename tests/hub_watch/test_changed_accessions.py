@@ -0,0 +1,27 @@
+"""
+Tests for the function changed_accessions(), which finds the accessions that are new or changed since the last check.
+"""
+import unittest
+from hub_watch import changed_accessions
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_changed(self):
+        """Test for accessions that are new, changed, unchanged, and removed"""
+        previous = {'acc_1': (('a.txt', 1, 100),), 'acc_2': (('b.txt', 2, 200),), 'acc_3': (('c.txt', 3, 300),)}
+        current = {'acc_1': (('a.txt', 1, 100),), 'acc_2': (('b.txt', 5, 500),), 'acc_4': (('d.txt', 4, 400),)}
+        result = changed_accessions(previous, current)
+        expected = ['acc_2', 'acc_4']
+        self.assertEqual(expected, result, "Problem with test for changed")
+
+    def test_unchanged(self):
+        """Test for no accessions changed"""
+        previous = {'acc_1': (('a.txt', 1, 100),), 'acc_2': None}
+        result = changed_accessions(previous, dict(previous))
+        expected = []
+        self.assertEqual(expected, result, "Problem with test for unchanged")
+
+
+if __name__ == '__main__':
+    unittest.main()
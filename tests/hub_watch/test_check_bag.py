@@ -0,0 +1,59 @@
+"""
+Tests for the function check_bag(), which compares a bag's Payload-Oxum to its files without calculating checksums.
+"""
+import bagit
+import os
+import shutil
+import unittest
+from hub_watch import check_bag
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes an accession with a bag"""
+        os.makedirs(os.path.join('acc_1-er', 'acc_1-er_bag'))
+        for file_name in ('file_1.txt', 'file_2.txt'):
+            with open(os.path.join('acc_1-er', 'acc_1-er_bag', file_name), 'w') as new_file:
+                new_file.write('Test file')
+        bagit.make_bag(os.path.join('acc_1-er', 'acc_1-er_bag'), checksums=['md5'])
+
+    def tearDown(self):
+        """Deletes the test accession"""
+        shutil.rmtree('acc_1-er')
+
+    def test_bag_added_file(self):
+        """Test for a bag with a file added after it was made"""
+        with open(os.path.join('acc_1-er', 'acc_1-er_bag', 'data', 'file_3.txt'), 'w') as new_file:
+            new_file.write('Added file')
+        result = check_bag('acc_1-er', 'Bag')
+        expected = 'Payload-Oxum validation failed. Expected 2 files and 18 bytes but found 3 files and 28 bytes'
+        self.assertEqual(expected, result, "Problem with test for bag, added file")
+
+    def test_bag_matches(self):
+        """Test for a bag that matches its Payload-Oxum"""
+        result = check_bag('acc_1-er', 'Bag')
+        expected = 'Payload-Oxum matches'
+        self.assertEqual(expected, result, "Problem with test for bag, matches")
+
+    def test_multiple_bags(self):
+        """Test for an accession with multiple bags, which are not checked"""
+        result = check_bag('acc_1-er', 'Multiple_Bags')
+        expected = 'Validate separately'
+        self.assertEqual(expected, result, "Problem with test for multiple bags")
+
+    def test_no_fixity(self):
+        """Test for an accession with no fixity information"""
+        result = check_bag('acc_1-er', '')
+        expected = 'No fixity information'
+        self.assertEqual(expected, result, "Problem with test for no fixity")
+
+    def test_zip(self):
+        """Test for an accession with a zip, which is not checked"""
+        result = check_bag('acc_1-er', 'Zip')
+        expected = 'Zip, not checked'
+        self.assertEqual(expected, result, "Problem with test for zip")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the function folder_state(), which gets the information used to tell if an accession folder has changed.
+"""
+import os
+import shutil
+import unittest
+from hub_watch import folder_state
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes an accession with a preservation log and a bag"""
+        os.makedirs(os.path.join('acc_1-er', 'acc_1-er_bag'))
+        for file_path in (os.path.join('acc_1-er', 'preservation_log.txt'),
+                          os.path.join('acc_1-er', 'acc_1-er_bag', 'bag-info.txt')):
+            with open(file_path, 'w') as new_file:
+                new_file.write('Test file')
+
+    def tearDown(self):
+        """Deletes the test accession"""
+        shutil.rmtree('acc_1-er')
+
+    def test_bag_changed(self):
+        """Test for a change to bag-info.txt, which is in a folder within the accession"""
+        before = folder_state('acc_1-er')
+        stat = os.stat(os.path.join('acc_1-er', 'acc_1-er_bag', 'bag-info.txt'))
+        os.utime(os.path.join('acc_1-er', 'acc_1-er_bag', 'bag-info.txt'),
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        after = folder_state('acc_1-er')
+        self.assertNotEqual(before, after, "Problem with test for bag changed")
+
+    def test_file_added(self):
+        """Test for a file added to the accession folder"""
+        before = folder_state('acc_1-er')
+        with open(os.path.join('acc_1-er', 'acc_1-er_full_risk_data.csv'), 'w') as new_file:
+            new_file.write('Test file')
+        after = folder_state('acc_1-er')
+        self.assertNotEqual(before, after, "Problem with test for file added")
+
+    def test_missing(self):
+        """Test for an accession folder that does not exist"""
+        result = folder_state('acc_2-er')
+        self.assertEqual(None, result, "Problem with test for missing")
+
+    def test_unchanged(self):
+        """Test for an accession folder with no changes"""
+        self.assertEqual(folder_state('acc_1-er'), folder_state('acc_1-er'), "Problem with test for unchanged")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for the function report_changes(), which finds the accessions that are new, changed, or deleted
+since they were added to an existing watch report.
+"""
+import os
+import shutil
+import time
+import unittest
+from hub_watch import folder_state, report_changes
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes three accessions and a watch report with two of them and an accession that was deleted"""
+        for accession in ('acc_1-er', 'acc_2-er', 'acc_3-er'):
+            os.makedirs(os.path.join('coll_1', accession))
+            with open(os.path.join('coll_1', accession, 'preservation_log.txt'), 'w') as log:
+                log.write('Test file')
+        with open('test_watch_report.csv', 'w') as report:
+            report.write('Path,Checked\n')
+            report.write(f"{os.path.join('coll_1', 'acc_1-er')},{time.strftime('%Y-%m-%d %H:%M')}\n")
+            report.write(f"{os.path.join('coll_1', 'acc_2-er')},{time.strftime('%Y-%m-%d %H:%M')}\n")
+            report.write(f"{os.path.join('coll_1', 'acc_9-er')},2024-01-01 09:00\n")
+
+        # Makes acc_1-er older than when it was checked, so it has not changed.
+        an_hour_ago = time.time() - 60 * 60
+        for path in (os.path.join('coll_1', 'acc_1-er', 'preservation_log.txt'), os.path.join('coll_1', 'acc_1-er')):
+            os.utime(path, (an_hour_ago, an_hour_ago))
+
+    def tearDown(self):
+        """Deletes the test accessions and report"""
+        shutil.rmtree('coll_1')
+        os.remove('test_watch_report.csv')
+
+    def test_report_changes(self):
+        """Test for a new accession, a changed accession, an accession that did not change, and a deleted accession"""
+        states = {os.path.join('coll_1', accession): folder_state(os.path.join('coll_1', accession))
+                  for accession in ('acc_1-er', 'acc_2-er', 'acc_3-er')}
+        changed_list, removed_list = report_changes('test_watch_report.csv', states)
+
+        result = [[os.path.basename(path) for path in changed_list], [os.path.basename(path) for path in removed_list]]
+        expected = [['acc_2-er', 'acc_3-er'], ['acc_9-er']]
+        self.assertEqual(expected, result, "Problem with test for report changes")
+
+
+if __name__ == '__main__':
+    unittest.main()
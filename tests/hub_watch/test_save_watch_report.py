@@ -0,0 +1,62 @@
+"""
+Tests for the function save_watch_report(), which adds rows for changed accessions to the watch report.
+"""
+import os
+import unittest
+from hub_watch import WATCH_COLUMNS, save_watch_report
+
+
+def make_row(collection, accession, gb):
+    """Make a row for the watch report, with the same values except the collection, accession, and size"""
+    return (['closed', collection, accession, os.path.join('closed', collection, accession), '2024-01-01 09:00',
+             True, 'Preservation_Log_Format', True, True, True, 'Payload-Oxum matches', '2020', gb, 1, 0, 0, 0, 1,
+             '', ''])
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the test report, if it was made"""
+        if os.path.exists('test_watch_report.csv'):
+            os.remove('test_watch_report.csv')
+
+    def test_new_report(self):
+        """Test for saving rows when there is no report yet"""
+        df = save_watch_report('test_watch_report.csv', [make_row('coll_2', 'acc_2', 2),
+                                                         make_row('coll_1', 'acc_1', 1)])
+        result = [df.columns.tolist(), df['Accession'].tolist(), df['GB'].tolist()]
+        expected = [WATCH_COLUMNS, ['acc_1', 'acc_2'], [1, 2]]
+        self.assertEqual(expected, result, "Problem with test for new report")
+
+    def test_update_report(self):
+        """Test for replacing the row for a changed accession and adding a new accession to an existing report"""
+        save_watch_report('test_watch_report.csv', [make_row('coll_1', 'acc_1', 1), make_row('coll_2', 'acc_2', 2)])
+        df = save_watch_report('test_watch_report.csv', [make_row('coll_2', 'acc_2', 5),
+                                                         make_row('coll_1', 'acc_3', 3)])
+        result = df[['Collection', 'Accession', 'GB']].values.tolist()
+        expected = [['coll_1', 'acc_1', '1'], ['coll_1', 'acc_3', '3'], ['coll_2', 'acc_2', '5']]
+        self.assertEqual(expected, result, "Problem with test for update report")
+
+    def test_update_report_blanks(self):
+        """Test for updating an existing report with rows that have None, which are saved as blanks"""
+        row_1 = make_row('coll_1', 'acc_1', 1)
+        row_1[-2:] = [None, None]
+        save_watch_report('test_watch_report.csv', [row_1])
+        row_2 = make_row('coll_2', 'acc_2', 2)
+        row_2[-2:] = ['Note', None]
+        df = save_watch_report('test_watch_report.csv', [row_2])
+        result = df[['Accession', 'Notes', 'Size_Error']].values.tolist()
+        expected = [['acc_1', '', ''], ['acc_2', 'Note', '']]
+        self.assertEqual(expected, result, "Problem with test for update report blanks")
+
+    def test_update_report_removed(self):
+        """Test for removing an accession that no longer exists from an existing report"""
+        save_watch_report('test_watch_report.csv', [make_row('coll_1', 'acc_1', 1), make_row('coll_2', 'acc_2', 2)])
+        df = save_watch_report('test_watch_report.csv', [], [os.path.join('closed', 'coll_1', 'acc_1')])
+        result = df[['Collection', 'Accession', 'GB']].values.tolist()
+        expected = [['coll_2', 'acc_2', '2']]
+        self.assertEqual(expected, result, "Problem with test for update report removed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests for the function update_changed(), which updates the watch report for the accessions that changed.
+"""
+import os
+import shutil
+import unittest
+from hub_inventory import scan_inventory
+from hub_watch import update_changed
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes a department folder with one accession and one accession with a bag that is still being copied"""
+        os.makedirs(os.path.join('born-digital', 'closed', 'coll_1', '2024-01-er'))
+        os.makedirs(os.path.join('born-digital', 'closed', 'coll_1', '2024-02-er', '2024-02-er_bag'))
+
+    @staticmethod
+    def make_bag_no_oxum():
+        """Makes an accession with a bag that has a bag-info.txt without Payload-Oxum"""
+        bag_path = os.path.join('born-digital', 'closed', 'coll_1', '2024-03-er', '2024-03-er_bag')
+        os.makedirs(os.path.join(bag_path, 'data'))
+        with open(os.path.join(bag_path, 'bagit.txt'), 'w') as bagit_txt:
+            bagit_txt.write('BagIt-Version: 0.97\nTag-File-Character-Encoding: UTF-8\n')
+        with open(os.path.join(bag_path, 'bag-info.txt'), 'w') as bag_info:
+            bag_info.write('Bagging-Date: 2024-03-01\n')
+        with open(os.path.join(bag_path, 'manifest-md5.txt'), 'w') as manifest:
+            manifest.write('')
+
+    def tearDown(self):
+        """Deletes the test department folder"""
+        shutil.rmtree('born-digital')
+
+    def test_error(self):
+        """Test for an accession that cannot be updated, which is returned and not added to the report"""
+        inventory_df = scan_inventory('born-digital')
+        error_list = update_changed('born-digital', inventory_df, inventory_df['Path'].tolist())
+
+        result = [[os.path.basename(path) for path in error_list]]
+        with open(os.path.join('born-digital', 'hub_watch_report.csv')) as report:
+            result.append([line.split(',')[2] for line in report.readlines()])
+        expected = [['2024-02-er'], ['Accession', '2024-01-er']]
+        self.assertEqual(expected, result, "Problem with test for error")
+
+    def test_no_payload_oxum(self):
+        """Test for an accession with a bag that has no Payload-Oxum, which is returned and not added to the report"""
+        self.make_bag_no_oxum()
+        inventory_df = scan_inventory('born-digital')
+        inventory_df = inventory_df[inventory_df['Accession'] != '2024-02-er']
+        error_list = update_changed('born-digital', inventory_df, inventory_df['Path'].tolist())
+
+        result = [[os.path.basename(path) for path in error_list]]
+        with open(os.path.join('born-digital', 'hub_watch_report.csv')) as report:
+            result.append([line.split(',')[2] for line in report.readlines()])
+        expected = [['2024-03-er'], ['Accession', '2024-01-er']]
+        self.assertEqual(expected, result, "Problem with test for no Payload-Oxum")
+
+
+if __name__ == '__main__':
+    unittest.main()
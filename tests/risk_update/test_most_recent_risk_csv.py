@@ -35,6 +35,14 @@ class MyTestCase(unittest.TestCase):
         expected = '2000-01-er_full_risk_data_2003-02-15.csv'
         self.assertEqual(file, expected, 'Problem with test for two files, both with dates')
 
+    def test_parquet(self):
+        """Test for when there is a Parquet copy of the preservation spreadsheets, which is not selected"""
+        files = ['2000-01-er_full_risk_data.csv', '2000-01-er_full_risk_data_2003-02-15.csv',
+                 '2000-01-er_full_risk_data_2003-02-15.parquet', 'log.txt']
+        file = most_recent_risk_csv(files)
+        expected = '2000-01-er_full_risk_data_2003-02-15.csv'
+        self.assertEqual(file, expected, 'Problem with test for Parquet copy')
+
     def test_3(self):
         """Test for when there are three preservation spreadsheets, two with dates."""
         files = ['2000-01-er_full_risk_data_2003-02-16.csv', '2000-01-er_full_risk_data_2003-02-15.csv',
@@ -0,0 +1,48 @@
+"""
+Tests for the function preferred_path(), which gets the path to read for a csv,
+which is the Parquet copy if there is one that can be used.
+"""
+import unittest
+from risk_update import pq, preferred_path, save_parquet
+from os import remove, utime
+from os.path import exists, getmtime, join
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Variables used by every test"""
+        self.csv_path = join('test_data', 'Russell_Hub', 'rbrl004', '2021-40-er', '2021-40-er_full_risk_data.csv')
+        self.parquet_path = join('test_data', 'Russell_Hub', 'rbrl004', '2021-40-er',
+                                 '2021-40-er_full_risk_data.parquet')
+
+    def tearDown(self):
+        """Deletes the test Parquet copy if it was created"""
+        if exists(self.parquet_path):
+            remove(self.parquet_path)
+
+    def test_no_parquet(self):
+        """Test for a csv with no Parquet copy"""
+        result = preferred_path(self.csv_path)
+        self.assertEqual(self.csv_path, result, 'Problem with test for no Parquet copy')
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_parquet(self):
+        """Test for a csv with a Parquet copy that is newer than the csv"""
+        save_parquet(DataFrame({'FITS_File_Path': ['file.txt']}), self.csv_path)
+        result = preferred_path(self.csv_path)
+        self.assertEqual(self.parquet_path, result, 'Problem with test for Parquet copy')
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_parquet_outdated(self):
+        """Test for a csv with a Parquet copy that is older than the csv, for example if the csv was edited"""
+        save_parquet(DataFrame({'FITS_File_Path': ['file.txt']}), self.csv_path)
+        csv_time = getmtime(self.csv_path)
+        utime(self.parquet_path, (csv_time - 60, csv_time - 60))
+        result = preferred_path(self.csv_path)
+        self.assertEqual(self.csv_path, result, 'Problem with test for outdated Parquet copy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the function read_nara_cache(), which reads the NARA CSV from a binary cache, making the cache if needed.
+"""
+import os
+import pandas as pd
+import shutil
+import unittest
+from risk_update import read_nara_cache, read_nara_csv
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Delete the test outputs if they were created"""
+        outputs = [join('test_data', 'NARA_PreservationActionPlan_cache.pkl'),
+                   join('test_data', 'NARA_Copy.csv'),
+                   join('test_data', 'NARA_Copy_cache.pkl')]
+        for output in outputs:
+            if os.path.exists(output):
+                os.remove(output)
+
+    def test_changed_nara(self):
+        """Test for when the NARA CSV changed after the cache was made, so the cache is remade"""
+        # Makes a cache from a copy of the NARA CSV and then replaces the copy with different content.
+        nara_csv = join('test_data', 'NARA_Copy.csv')
+        shutil.copyfile(join('test_data', 'NARA_PreservationActionPlan.csv'), nara_csv)
+        read_nara_cache(nara_csv)
+        nara_df = pd.read_csv(nara_csv).head(2)
+        nara_df.to_csv(nara_csv, index=False)
+
+        # Runs the function again and tests it has the changed content.
+        nara_risk_df = read_nara_cache(nara_csv)
+        result = nara_risk_df['NARA_Format_Name'].tolist()
+        expected = ['Hypertext Markup Language 5.2', 'Hypertext Markup Language unspecified version']
+        self.assertEqual(expected, result, "Problem with test for changed NARA")
+
+    def test_corrupt_cache(self):
+        """Test for when the cache cannot be read, so it is remade from the NARA CSV"""
+        # Makes a cache file that is not a pickle.
+        nara_csv = join('test_data', 'NARA_PreservationActionPlan.csv')
+        cache_path = join('test_data', 'NARA_PreservationActionPlan_cache.pkl')
+        with open(cache_path, 'wb') as cache:
+            cache.write(b'Not a pickle')
+
+        # Runs the function and tests it has the NARA content and the cache was remade.
+        nara_risk_df = read_nara_cache(nara_csv)
+        self.assertEqual(len(read_nara_csv(nara_csv).index), len(nara_risk_df.index),
+                         "Problem with test for corrupt cache, dataframe")
+        self.assertTrue(pd.read_pickle(cache_path)['nara_df'].equals(nara_risk_df),
+                        "Problem with test for corrupt cache, cache")
+
+    def test_new_cache(self):
+        """Test for when there is no cache yet, so it is made"""
+        # Creates input variable (in production, this is a script argument) and runs the function.
+        nara_csv = join('test_data', 'NARA_PreservationActionPlan.csv')
+        nara_risk_df = read_nara_cache(nara_csv)
+
+        # Tests the cache was made.
+        cache_path = join('test_data', 'NARA_PreservationActionPlan_cache.pkl')
+        self.assertTrue(os.path.exists(cache_path), "Problem with test for new cache, cache")
+
+        # Tests the dataframe has the NARA columns and the match columns.
+        result = nara_risk_df.columns.tolist()
+        expected = ['NARA_Format_Name', 'NARA_File_Extensions', 'NARA_PRONOM_URL', 'NARA_Risk_Level',
+                    'NARA_Proposed_Preservation_Plan', 'nara_format_lower', 'nara_version']
+        self.assertEqual(expected, result, "Problem with test for new cache, columns")
+
+    def test_existing_cache(self):
+        """Test for when the cache was already made from the same NARA CSV, so it is read from the cache"""
+        # Makes the cache and then runs the function again.
+        nara_csv = join('test_data', 'NARA_PreservationActionPlan.csv')
+        read_nara_cache(nara_csv)
+        nara_risk_df = read_nara_cache(nara_csv)
+
+        # Tests the dataframe from the cache is the same as from reading the NARA CSV.
+        expected_df = read_nara_csv(nara_csv)
+        expected_df['nara_format_lower'] = expected_df['NARA_Format_Name'].str.lower()
+        expected_df['nara_version'] = expected_df['NARA_Format_Name'].str.split(' ').str[-1]
+        self.assertTrue(expected_df.equals(nara_risk_df), "Problem with test for existing cache")
+
+    def test_incorrect_nara(self):
+        """Test for when the column names in the NARA CSV for the 5 columns used are not correct"""
+        nara_csv = join('test_data', 'NARA_PreservationActionPlan_Outdated.csv')
+        with self.assertRaises(KeyError):
+            read_nara_cache(nara_csv)
+
+
+if __name__ == '__main__':
+    unittest.main()
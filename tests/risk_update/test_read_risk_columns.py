@@ -0,0 +1,40 @@
+"""
+Tests for the function read_risk_columns(), which reads select columns from a risk CSV into a dataframe.
+"""
+import unittest
+from risk_update import read_risk_columns
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_columns(self):
+        """Test for reading a subset of columns, including the risk level with its older column name"""
+        # Creates input variables and runs the function.
+        risk_csv = join('test_data', 'Russell_Hub', 'rbrl004', '2005-20-er', '2005-20-er_full_risk_data_2012-07-01.csv')
+        risk_df = read_risk_columns(risk_csv, ['FITS_File_Path', 'FITS_Size_KB', 'NARA_Risk_Level'])
+
+        # Tests the contents of risk_df are correct.
+        result = [risk_df.columns.tolist()] + risk_df.values.tolist()
+        expected = [['FITS_File_Path', 'FITS_Size_KB', 'NARA_Risk_Level'],
+                    ['Z:\\Russell_Hub\\backlog\\rbrl004\\2005-20-er\\2005-20-er_bag\\data\\Folder\\Document.pdf',
+                     '29', 'Moderate Risk'],
+                    ['Z:\\Russell_Hub\\backlog\\rbrl004\\2005-20-er\\2005-20-er_bag\\data\\Folder\\Document.pdf',
+                     '29', 'Moderate Risk']]
+        self.assertEqual(expected, result, "Problem with test for columns")
+
+    def test_dtypes(self):
+        """Test for reading columns with a data type other than object"""
+        # Creates input variables and runs the function.
+        risk_csv = join('test_data', 'Russell_Hub', 'rbrl004', '2005-20-er', '2005-20-er_full_risk_data_2012-07-01.csv')
+        risk_df = read_risk_columns(risk_csv, ['FITS_Format_Name', 'FITS_Size_KB', 'NARA_Risk_Level'],
+                                    {'FITS_Size_KB': int, 'NARA_Risk_Level': 'category'})
+
+        # Tests the data types of risk_df are correct.
+        result = risk_df.dtypes.astype(str).tolist()
+        expected = ['object', 'int64', 'category']
+        self.assertEqual(expected, result, "Problem with test for dtypes")
+
+
+if __name__ == '__main__':
+    unittest.main()
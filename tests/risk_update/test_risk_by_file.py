@@ -0,0 +1,31 @@
+"""
+Tests for the function risk_by_file(), which reads the NARA risk level and match type for each file in a risk CSV.
+"""
+import unittest
+from risk_update import risk_by_file
+from os.path import join
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_multiple_rows(self):
+        """Test for when a file is in more than one row, with different match types"""
+        risk_csv = join('test_data', 'Russell_Hub', 'rbrl004', '2005-20-er', '2005-20-er_full_risk_data_2012-07-01.csv')
+        risk_df = risk_by_file(risk_csv)
+        result = risk_df.values.tolist()
+        expected = [['Moderate Risk', 'PRONOM|PRONOM and Name']]
+        self.assertEqual(expected, result, "Problem with test for multiple rows")
+
+    def test_one_row(self):
+        """Test for when every file is in one row"""
+        risk_csv = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er', '2006-30-er_full_risk_data_2009-04-01.csv')
+        risk_df = risk_by_file(risk_csv)
+        result = sorted(risk_df.values.tolist())
+        expected = [['Low Risk', 'PRONOM and Version'],
+                    ['No Match', 'No NARA Match'],
+                    ['No Match', 'No NARA Match']]
+        self.assertEqual(expected, result, "Problem with test for one row")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for the function risk_changes(), which counts files with a different risk level or match type in a new risk CSV.
+"""
+import unittest
+from risk_update import read_risk_columns, risk_changes
+from os.path import join
+from pandas import concat, DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_changed(self):
+        """Test for when a file has a different risk level and match type"""
+        root = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er')
+        changes_df = risk_changes(join(root, '2006-30-er_full_risk_data_2006-07-01.csv'),
+                                  join(root, '2006-30-er_full_risk_data_2009-04-01.csv'))
+        result = [changes_df.columns.tolist()] + changes_df.values.tolist()
+        expected = [['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type', 'File_Count'],
+                    ['No Match', 'Low Risk', 'No NARA Match', 'PRONOM and Version', 1]]
+        self.assertEqual(expected, result, "Problem with test for changed")
+
+    def test_chunks(self):
+        """Test for when the risk csvs are read one row at a time"""
+        root = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er')
+        changes_df = risk_changes(join(root, '2006-30-er_full_risk_data_2006-07-01.csv'),
+                                  join(root, '2006-30-er_full_risk_data_2009-04-01.csv'), chunk_rows=1)
+        result = changes_df.values.tolist()
+        expected = [['No Match', 'Low Risk', 'No NARA Match', 'PRONOM and Version', 1]]
+        self.assertEqual(expected, result, "Problem with test for chunks")
+
+    def test_file_not_in_new(self):
+        """Test for when a file in the previous risk csv is not in the new risk csv"""
+        root = join('test_data', 'Russell_Hub', 'rbrl004', '2005-20-er')
+        changes_df = risk_changes(join(root, '2005-20-er_full_risk_data.csv'),
+                                  join(root, '2005-20-er_full_risk_data_2012-07-01.csv'))
+        result = changes_df.values.tolist()
+        expected = [['No Match', 'Not in CSV', 'No NARA Match', 'Not in CSV', 1]]
+        self.assertEqual(expected, result, "Problem with test for file not in new")
+
+    def test_many_values(self):
+        """Test for a new file with more than 64 different risk levels, which are all combined"""
+        root = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er')
+        previous_csv = join(root, '2006-30-er_full_risk_data_2006-07-01.csv')
+        columns = ['FITS_File_Path', 'NARA_Risk_Level', 'NARA_Match_Type']
+        levels = [f'Level {number}' for number in range(70)]
+        new_df = concat([read_risk_columns(previous_csv, columns),
+                         DataFrame({'FITS_File_Path': 'new.txt', 'NARA_Risk_Level': levels,
+                                    'NARA_Match_Type': 'PRONOM'})], ignore_index=True)
+        changes_df = risk_changes(previous_csv, None, new_df)
+        result = changes_df.values.tolist()
+        expected = [['Not in CSV', '|'.join(sorted(levels)), 'Not in CSV', 'PRONOM', 1]]
+        self.assertEqual(expected, result, "Problem with test for many values")
+
+    def test_new_df(self):
+        """Test for when the new risk csv data is already in memory"""
+        root = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er')
+        new_df = read_risk_columns(join(root, '2006-30-er_full_risk_data_2009-04-01.csv'),
+                                   ['FITS_File_Path', 'NARA_Risk_Level', 'NARA_Match_Type'])
+        changes_df = risk_changes(join(root, '2006-30-er_full_risk_data_2006-07-01.csv'), None, new_df)
+        result = changes_df.values.tolist()
+        expected = [['No Match', 'Low Risk', 'No NARA Match', 'PRONOM and Version', 1]]
+        self.assertEqual(expected, result, "Problem with test for new df")
+
+    def test_no_change(self):
+        """Test for when no files have a different risk level or match type"""
+        risk_csv = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er', '2006-30-er_full_risk_data_2009-04-01.csv')
+        changes_df = risk_changes(risk_csv, risk_csv)
+        result = [changes_df.columns.tolist()] + changes_df.values.tolist()
+        expected = [['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type', 'File_Count']]
+        self.assertEqual(expected, result, "Problem with test for no change")
+
+
+if __name__ == '__main__':
+    unittest.main()
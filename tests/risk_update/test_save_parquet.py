@@ -0,0 +1,61 @@
+"""
+Tests for the function save_parquet(), which saves a Parquet copy of a dataframe that was saved to a csv,
+if pyarrow is installed.
+"""
+import unittest
+from risk_update import pq, read_risk_columns, save_parquet
+from io import BytesIO
+from os import remove
+from os.path import exists, join
+from pandas import read_csv
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Variables used by every test"""
+        self.csv_path = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er',
+                             '2006-30-er_full_risk_data_2009-04-01.csv')
+        self.parquet_path = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er',
+                                 '2006-30-er_full_risk_data_2009-04-01.parquet')
+
+    def tearDown(self):
+        """Deletes the test Parquet copy if it was created"""
+        if exists(self.parquet_path):
+            remove(self.parquet_path)
+
+    @unittest.skipUnless(pq is None, 'pyarrow is installed')
+    def test_no_pyarrow(self):
+        """Test for when pyarrow is not installed, so no Parquet copy is saved"""
+        result = save_parquet(read_csv(self.csv_path, dtype=object), self.csv_path)
+        self.assertEqual((None, False), (result, exists(self.parquet_path)), 'Problem with test for no pyarrow')
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_read(self):
+        """Test that reading the Parquet copy has the same result as reading the csv"""
+        columns = ['FITS_File_Path', 'FITS_Format_Name', 'FITS_Size_KB', 'NARA_Risk_Level']
+        dtypes = {'FITS_Size_KB': float, 'NARA_Risk_Level': 'category'}
+        csv_df = read_risk_columns(self.csv_path, columns, dtypes)
+        save_parquet(read_csv(self.csv_path, dtype=object), self.csv_path)
+        parquet_df = read_risk_columns(self.csv_path, columns, dtypes)
+
+        result = [parquet_df.columns.tolist(), parquet_df.dtypes.astype(str).tolist()] + parquet_df.values.tolist()
+        expected = [csv_df.columns.tolist(), csv_df.dtypes.astype(str).tolist()] + csv_df.values.tolist()
+        self.assertEqual(expected, result, 'Problem with test for read')
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_read_bytes(self):
+        """Test that reading the Parquet copy from a file object has the same result as reading the csv"""
+        columns = ['FITS_File_Path', 'FITS_Format_Name']
+        csv_df = read_risk_columns(self.csv_path, columns)
+        save_parquet(read_csv(self.csv_path, dtype=object), self.csv_path)
+        with open(self.parquet_path, 'rb') as parquet_file:
+            parquet_df = read_risk_columns(BytesIO(parquet_file.read()), columns)
+
+        result = [parquet_df.columns.tolist()] + parquet_df.values.tolist()
+        expected = [csv_df.columns.tolist()] + csv_df.values.tolist()
+        self.assertEqual(expected, result, 'Problem with test for read bytes')
+
+
+if __name__ == '__main__':
+    unittest.main()
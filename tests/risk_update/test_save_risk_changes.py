@@ -0,0 +1,57 @@
+"""
+Tests for the functions save_risk_changes() and save_risk_change_summary(),
+which save the risk changes for each accession and for all accessions combined.
+"""
+import unittest
+from risk_update import save_risk_change_summary, save_risk_changes
+from test_script_risk_update import csv_to_list
+from datetime import datetime
+from os import getcwd, remove
+from os.path import exists, join
+from pandas import DataFrame
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Dataframes with risk changes for two accessions"""
+        columns = ['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type', 'File_Count']
+        self.changes_1 = DataFrame([['No Match', 'Low Risk', 'No NARA Match', 'PRONOM', 2]], columns=columns)
+        self.changes_2 = DataFrame([['No Match', 'Low Risk', 'No NARA Match', 'PRONOM', 3],
+                                    ['Low Risk', 'High Risk', 'PRONOM', 'PRONOM', 1]], columns=columns)
+
+    def tearDown(self):
+        """Delete the test outputs if they were created"""
+        today = datetime.today().strftime('%Y-%m-%d')
+        for output in (f'risk_change_report_{today}.csv', f'risk_change_summary_{today}.csv'):
+            if exists(output):
+                remove(output)
+
+    def test_report(self):
+        """Test for adding the changes for two accessions to the report"""
+        save_risk_changes(getcwd(), join(getcwd(), 'coll-001', 'acc-001'), self.changes_1)
+        save_risk_changes(getcwd(), join(getcwd(), 'coll-001', 'acc-002'), self.changes_2)
+
+        today = datetime.today().strftime('%Y-%m-%d')
+        result = csv_to_list(f'risk_change_report_{today}.csv')
+        expected = [['Collection', 'Accession', 'Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type',
+                     'New_Match_Type', 'File_Count'],
+                    ['coll-001', 'acc-001', 'No Match', 'Low Risk', 'No NARA Match', 'PRONOM', 2],
+                    ['coll-001', 'acc-002', 'No Match', 'Low Risk', 'No NARA Match', 'PRONOM', 3],
+                    ['coll-001', 'acc-002', 'Low Risk', 'High Risk', 'PRONOM', 'PRONOM', 1]]
+        self.assertEqual(expected, result, "Problem with test for report")
+
+    def test_summary(self):
+        """Test for combining the changes for two accessions in the summary"""
+        save_risk_change_summary(getcwd(), [self.changes_1, self.changes_2])
+
+        today = datetime.today().strftime('%Y-%m-%d')
+        result = csv_to_list(f'risk_change_summary_{today}.csv')
+        expected = [['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type', 'File_Count'],
+                    ['Low Risk', 'High Risk', 'PRONOM', 'PRONOM', 1],
+                    ['No Match', 'Low Risk', 'No NARA Match', 'PRONOM', 5]]
+        self.assertEqual(expected, result, "Problem with test for summary")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,8 +17,11 @@ class MyTestCase(unittest.TestCase):
     def tearDown(self):
         """Deletes the test output if it was created"""
         today = datetime.today().strftime('%Y-%m-%d')
-        if exists(join('test_data', 'Russell_Hub', 'rbrl004', '2005-10-er', f'2005-10-er_full_risk_data_{today}.csv')):
-            remove(join('test_data', 'Russell_Hub', 'rbrl004', '2005-10-er', f'2005-10-er_full_risk_data_{today}.csv'))
+        for extension in ('csv', 'parquet'):
+            output = join('test_data', 'Russell_Hub', 'rbrl004', '2005-10-er',
+                          f'2005-10-er_full_risk_data_{today}.{extension}')
+            if exists(output):
+                remove(output)
 
     def test_duplicates(self):
         """Test for when the risk information includes duplicate rows"""
@@ -63,6 +66,20 @@ class MyTestCase(unittest.TestCase):
                     ['HYPERTEXT MARKUP LANGUAGE', 'NO VALUE', 'Low Risk']]
         self.assertEqual(result, expected, 'Problem with test for duplicates')
 
+    def test_temporary_file(self):
+        """Test that the temporary file the risk information is saved to first is not left in the folder"""
+        # Creates input variables and runs the function.
+        root = join('test_data', 'Russell_Hub', 'rbrl004', '2005-10-er')
+        new_risk_df = DataFrame([['Word', 'NO VALUE', 'No Match']],
+                                columns=['FITS_Format_Name', 'FITS_Format_Version', 'NARA_Risk_Level'])
+        save_risk_csv(root, new_risk_df)
+
+        # Tests the new risk csv was made and the temporary file was not left behind.
+        today = datetime.today().strftime('%Y-%m-%d')
+        result = [exists(join(root, f'2005-10-er_full_risk_data_{today}.csv')),
+                  exists(join(root, '2005-10-er_risk_update_in_progress.tmp'))]
+        self.assertEqual(result, [True, False], 'Problem with test for temporary file')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,7 @@ import subprocess
 import unittest
 from datetime import datetime
 from os import getcwd, remove
-from os.path import exists, join
+from os.path import exists, join, splitext
 from pandas import read_csv
 
 
@@ -30,10 +30,13 @@ class MyTestCase(unittest.TestCase):
                    join(coll_folder, '2005-20-er', f'2005-20-er_full_risk_data_{today}.csv'),
                    join(coll_folder, '2006-30-er', f'2006-30-er_full_risk_data_{today}.csv'),
                    join(coll_folder, '2021-40-er', f'2021-40-er_full_risk_data_{today}.csv'),
-                   join(coll_folder, f'update_risk_log_{today}.csv'))
+                   join(coll_folder, f'update_risk_log_{today}.csv'),
+                   join(coll_folder, f'risk_change_report_{today}.csv'),
+                   join(coll_folder, f'risk_change_summary_{today}.csv'),
+                   join('test_data', 'NARA_PreservationActionPlan_cache.pkl'))
 
-        # Deletes any test output that is present.
-        for output in outputs:
+        # Deletes any test output that is present, including the Parquet copy of a csv if pyarrow is installed.
+        for output in outputs + tuple(f'{splitext(output)[0]}.parquet' for output in outputs):
             if exists(output):
                 remove(output)
 
@@ -170,6 +173,13 @@ class MyTestCase(unittest.TestCase):
                      'No NARA Match']]
         self.assertEqual(result, expected, 'Problem with test for risk CSV contents, 2005-20-er')
 
+        # Tests the contents of the risk change summary are correct.
+        result = csv_to_list(join('test_data', 'Russell_Hub', 'rbrl004', f'risk_change_summary_{today}.csv'))
+        expected = [['Previous_Risk_Level', 'New_Risk_Level', 'Previous_Match_Type', 'New_Match_Type', 'File_Count'],
+                    ['Low Risk', 'Low Risk', 'Name and Version', 'Format Name', 2],
+                    ['Low Risk', 'Moderate Risk', 'PRONOM and Version', 'PRONOM and Version', 2]]
+        self.assertEqual(result, expected, 'Problem with test for risk change summary contents')
+
     def test_argument_error(self):
         """Test for when the script arguments are not correct and the script exits"""
         # Makes the variables used for script input.
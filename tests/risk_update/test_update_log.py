@@ -1,8 +1,10 @@
 """
 Tests for the function update_log(), which make a log of all accessions updated by the script.
+
+Rows may wait to be saved, so flush_log() is run after update_log() to save them before testing the log.
 """
 import unittest
-from risk_update import update_log
+from risk_update import flush_log, update_log
 from test_script_risk_update import csv_to_list
 from datetime import datetime
 from os import getcwd, remove
@@ -28,6 +30,7 @@ class MyTestCase(unittest.TestCase):
         root = join(getcwd(), 'dept', 'coll-001', 'acc-002')
         input_directory = getcwd()
         update_log(root, input_directory, 'Yes')
+        flush_log(input_directory)
 
         # Tests that the log was made.
         today = datetime.today().strftime('%Y-%m-%d')
@@ -48,6 +51,7 @@ class MyTestCase(unittest.TestCase):
         root = join(getcwd(), 'coll-001', 'acc-001')
         input_directory = getcwd()
         update_log(root, input_directory, 'No')
+        flush_log(input_directory)
 
         # Tests that the log was made.
         today = datetime.today().strftime('%Y-%m-%d')
@@ -0,0 +1,84 @@
+"""
+Tests for the function update_risk_csv_chunks(), which matches a risk CSV to NARA in chunks and saves the result.
+
+The expected results are made with read_risk_csv(), match_nara_risk(), and save_risk_csv(),
+which is how risk CSVs that are not very large are updated, and sorted since the row order may be different.
+"""
+import unittest
+from unittest.mock import patch
+from risk_update import match_nara_risk, read_nara_csv, read_risk_csv, save_risk_csv, update_risk_csv_chunks
+from test_script_risk_update import csv_to_list
+from datetime import datetime
+from os import remove
+from os.path import exists, join
+from pandas import Series, concat, read_csv
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Path to the test output and dataframe with the NARA data"""
+        today = datetime.today().strftime('%Y-%m-%d')
+        self.root = join('test_data', 'Russell_Hub', 'rbrl004', '2006-30-er')
+        self.output = join(self.root, f'2006-30-er_full_risk_data_{today}.csv')
+        self.duplicates_csv = join(self.root, 'duplicates_test.csv')
+        self.nara_risk_df = read_nara_csv(join('test_data', 'NARA_PreservationActionPlan.csv'))
+
+    def tearDown(self):
+        """Deletes the test output if it was created, including the Parquet copy if pyarrow is installed"""
+        for output in (self.output, self.output.replace('.csv', '.parquet'), self.duplicates_csv):
+            if exists(output):
+                remove(output)
+
+    def expected_rows(self, risk_csv_path):
+        """Update the risk csv all at once and return the rows, sorted"""
+        new_risk_df = match_nara_risk(read_risk_csv(risk_csv_path), self.nara_risk_df)
+        save_risk_csv(self.root, new_risk_df)
+        expected = csv_to_list(self.output)
+        remove(self.output)
+        return [expected[0]] + sorted(expected[1:])
+
+    def test_one_chunk(self):
+        """Test for when the risk csv is smaller than the chunk size"""
+        risk_csv_path = join(self.root, '2006-30-er_full_risk_data_2009-04-01.csv')
+        expected = self.expected_rows(risk_csv_path)
+        update_risk_csv_chunks(self.root, risk_csv_path, self.nara_risk_df)
+        result = csv_to_list(self.output)
+        self.assertEqual(expected, [result[0]] + sorted(result[1:]), "Problem with test for one chunk")
+
+    def test_duplicates_across_chunks(self):
+        """Test for when the risk csv has duplicate rows in different chunks, which are only saved once"""
+        # Makes a risk csv with every row twice, in different chunks, from an existing risk csv.
+        risk_df = read_csv(join(self.root, '2006-30-er_full_risk_data_2009-04-01.csv'), dtype=object)
+        concat([risk_df, risk_df]).to_csv(self.duplicates_csv, index=False)
+
+        expected = self.expected_rows(self.duplicates_csv)
+        update_risk_csv_chunks(self.root, self.duplicates_csv, self.nara_risk_df, chunk_rows=2)
+        result = csv_to_list(self.output)
+        self.assertEqual(expected, [result[0]] + sorted(result[1:]), "Problem with test for duplicates across chunks")
+
+    def test_hash_collision(self):
+        """Test for when different rows have the same hash, which are all saved, and duplicates are still removed"""
+        # Makes a risk csv with every row twice, in different chunks, from an existing risk csv.
+        risk_df = read_csv(join(self.root, '2006-30-er_full_risk_data_2009-04-01.csv'), dtype=object)
+        concat([risk_df, risk_df]).to_csv(self.duplicates_csv, index=False)
+
+        # Runs the function with every row given the same hash.
+        expected = self.expected_rows(self.duplicates_csv)
+        with patch('risk_update.pd.util.hash_pandas_object', lambda df, index: Series([1] * len(df.index),
+                                                                                        dtype='uint64')):
+            update_risk_csv_chunks(self.root, self.duplicates_csv, self.nara_risk_df, chunk_rows=2)
+        result = csv_to_list(self.output)
+        self.assertEqual(expected, [result[0]] + sorted(result[1:]), "Problem with test for hash collision")
+
+    def test_multiple_chunks(self):
+        """Test for when the risk csv is larger than the chunk size"""
+        risk_csv_path = join(self.root, '2006-30-er_full_risk_data_2009-04-01.csv')
+        expected = self.expected_rows(risk_csv_path)
+        update_risk_csv_chunks(self.root, risk_csv_path, self.nara_risk_df, chunk_rows=1)
+        result = csv_to_list(self.output)
+        self.assertEqual(expected, [result[0]] + sorted(result[1:]), "Problem with test for multiple chunks")
+
+
+if __name__ == '__main__':
+    unittest.main()
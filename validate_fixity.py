@@ -17,6 +17,7 @@ Parameter:
 Returns:
     Updates the preservation log of each accession with the validation result
     Creates a summary report of the validation errors (fixity validation log)
+    If there is a catalog (see hub_catalog.py), every validation is added to it
 """
 import bagit
 import csv
@@ -25,6 +26,8 @@ import hashlib
 import os
 import pandas as pd
 import sys
+from hub_catalog import CATALOG_BATCH_ROWS, catalog_time, save_catalog_rows
+from hub_inventory import load_inventory, read_log_ends
 
 
 def accession_test(folder_name):
@@ -32,6 +35,7 @@ def accession_test(folder_name):
 
     This is similar to the function accession_test in collection_summary.py,
     but does not need to evaluate if it is a file.
+    Keep in sync with the copy of this function in hub_inventory.py.
 
     @:parameter
     folder_name (string): the name of a folder to be checked for accession number formatting
@@ -134,57 +138,41 @@ def fixity_validation_log(acc_dir):
         log_writer = csv.writer(open_log)
         log_writer.writerow(header)
 
-        # Navigates the input_directory to get information about each folder at the accession level and adds to the log.
-        for status in os.listdir(acc_dir):
-            # There may be other folders at the status level that don't need to be checked
-            # or files which cause an error from os.listdir(status).
-            if status == 'backlogged' or status == 'closed' and os.path.isdir(os.path.join(acc_dir, status)):
-                # Every folder at the collection level is included.
-                for collection in os.listdir(os.path.join(acc_dir, status)):
-                    # Every folder (not file) at the accession level is included but has text in Result
-                    # if it is not identified as an accession, so it is skipped during validation.
-                    if os.path.isdir(os.path.join(acc_dir, status, collection)):
-                        # Folder is the accession number for those that are accessions.
-                        for folder in os.listdir(os.path.join(acc_dir, status, collection)):
-                            folder_path = os.path.join(acc_dir, status, collection, folder)
-                            if os.path.isdir(folder_path):
-                                is_accession = accession_test(folder)
-                                # Gets information for log besides the iterators (status, collection, folder/accession).
-                                if is_accession:
-                                    if os.path.exists(os.path.join(folder_path, f'{folder}_bag')):
-                                        fixity_type = 'Bag'
-                                        bag_size = get_bag_size(os.path.join(folder_path, f'{folder}_bag'))
-                                        is_valid = None
-                                        result = None
-                                    elif os.path.exists(os.path.join(folder_path, f'{folder}_bags')):
-                                        fixity_type = 'Multiple_Bags'
-                                        bag_size = None
-                                        is_valid = 'TBD'
-                                        result = 'Validate separately'
-                                    elif os.path.exists(os.path.join(folder_path, f'{folder}_zipped_bag')):
-                                        fixity_type = 'Zipped_Bag'
-                                        bag_size = get_bag_size(os.path.join(folder_path, f'{folder}_zipped_bag'))
-                                        is_valid = None
-                                        result = None
-                                    elif os.path.exists(os.path.join(folder_path, f'{folder}_zip_md5.txt')):
-                                        fixity_type = 'Zip'
-                                        bag_size = None
-                                        is_valid = None
-                                        result = None
-                                    else:
-                                        fixity_type = None
-                                        bag_size = None
-                                        is_valid = 'False'
-                                        result = 'No fixity information'
-                                else:
-                                    fixity_type = None
-                                    bag_size = None
-                                    is_valid = 'Skipped'
-                                    result = 'Not an accession'
-                                # Adds information for folder, regardless of if it is an accession, to the log.
-                                row = [status, collection, folder, folder_path, bag_size, fixity_type, None,
-                                       is_valid, None, result]
-                                log_writer.writerow(row)
+        # Gets information about each folder at the accession level from the Hub inventory (see hub_inventory.py),
+        # which is made again if there is not a recent one saved in the input_directory, and adds it to the log.
+        # Every folder (not file) at the accession level is included but has text in Result
+        # if it is not identified as an accession, so it is skipped during validation.
+        inventory_df = load_inventory(acc_dir)
+        for folder in inventory_df.itertuples():
+            # Gets information for log besides the status, collection, and folder/accession.
+            # The fixity type is the bag type from the inventory, and the bag size is from the Payload-Oxum
+            # read by the inventory, or from the bag if the inventory did not have it.
+            if folder.Is_Accession:
+                fixity_type = folder.Bag_Type if folder.Bag_Type else None
+                bag_size = None
+                is_valid = None
+                result = None
+                if fixity_type in ('Bag', 'Zipped_Bag'):
+                    bag_name = f'{folder.Accession}_bag' if fixity_type == 'Bag' else f'{folder.Accession}_zipped_bag'
+                    if folder.Payload_Oxum:
+                        bag_size = round(float(folder.Payload_Oxum.split('.')[0]) / 1000000000, 1)
+                    else:
+                        bag_size = get_bag_size(os.path.join(folder.Path, bag_name))
+                elif fixity_type == 'Multiple_Bags':
+                    is_valid = 'TBD'
+                    result = 'Validate separately'
+                elif fixity_type is None:
+                    is_valid = 'False'
+                    result = 'No fixity information'
+            else:
+                fixity_type = None
+                bag_size = None
+                is_valid = 'Skipped'
+                result = 'Not an accession'
+            # Adds information for folder, regardless of if it is an accession, to the log.
+            row = [folder.Status, folder.Collection, folder.Accession, folder.Path, bag_size, fixity_type, None,
+                   is_valid, None, result]
+            log_writer.writerow(row)
 
 
 def get_bag_size(bag_path):
@@ -273,17 +261,16 @@ def update_preservation_log(acc_dir, validation_result, fixity_type):
     # If yes, gets the ids from the first two columns of the last row, so the id formatting in the log is consistent.
     # If not, or the last row is blank (IndexError), returns the status for the fixity validation log
     # and does not do the rest of the function. The preservation log will be updated manually.
-    with open(log_path, 'r') as open_log:
-        log_lines = open_log.readlines()
-        first_row = log_lines[0]
-        if not first_row == 'Collection\tAccession\tDate\tMedia Identifier\tAction\tStaff\n':
-            return 'Nonstandard columns'
-        try:
-            last_row_list = log_lines[-1].split('\t')
-            collection_id = last_row_list[0]
-            accession_id = last_row_list[1]
-        except IndexError:
-            return 'Extra blank row'
+    # Only the first and last row are read, so this is fast even for very long logs.
+    first_row, last_row = read_log_ends(log_path)
+    if not first_row == 'Collection\tAccession\tDate\tMedia Identifier\tAction\tStaff\n':
+        return 'Nonstandard columns'
+    try:
+        last_row_list = last_row.split('\t')
+        collection_id = last_row_list[0]
+        accession_id = last_row_list[1]
+    except IndexError:
+        return 'Extra blank row'
 
     # Calculates the action to include in the log entry for the validation.
     # It includes the type of validation, if it was valid, and any additional error message.
@@ -302,7 +289,7 @@ def update_preservation_log(acc_dir, validation_result, fixity_type):
     validation_date = date.today().strftime('%Y-%m-%d')
     log_row = [collection_id, accession_id, validation_date, None, action, 'validate_fixity.py']
     with open(log_path, 'a', newline='') as open_log:
-        if not log_lines[-1].endswith('\n'):
+        if not last_row.endswith('\n'):
             open_log.write('\n')
         log_writer = csv.writer(open_log, delimiter='\t')
         log_writer.writerow(log_row)
@@ -466,38 +453,53 @@ if __name__ == '__main__':
     log_df = pd.read_csv(fixity_validation_log_path)
     total_acc = len(log_df[log_df['Result'].isnull()].index)
     current_acc = 0
-    for acc in log_df[log_df['Result'].isnull()].itertuples():
-
-        # Prints the script progress.
-        current_acc += 1
-        print(f'Starting on accession {acc.Path} ({current_acc} of {total_acc})')
-
-        # Calculates the row index in the fixity validation log dataframe for the accession for updating the log.
-        # The collection is tested because accession numbers may be duplicated in different collections,
-        # either from no-acc-num or errors when assigning the numbers.
-        df_row_index = log_df.index[(log_df['Collection'] == acc.Collection) & (log_df['Accession'] == acc.Accession)][0]
-
-        # Validates the accession, including updating the preservation log and fixity validation log.
-        # Different validation functions are used depending on if it is in a bag or is zipped.
-        if acc.Fixity_Type == 'Bag':
-            valid = validate_bag(acc.Path, input_directory, f'{acc.Accession}_bag')
-            # Path Error happens on the server (faster) and means that accession needs to be re-run over the network,
-            # so no permanent record of the error in the preservation log is needed.
-            if valid == 'Path Error':
-                update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, 'skipped', valid)
-            else:
-                log_status = update_preservation_log(acc.Path, valid, acc.Fixity_Type)
-                update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, log_status, valid)
-        elif acc.Fixity_Type == 'Zipped_Bag':
-            valid = validate_bag(acc.Path, input_directory, f'{acc.Accession}_zipped_bag')
-            # Path Error happens on the server (faster) and means that accession needs to be re-run over the network,
-            # so no permanent record of the error in the preservation log is needed.
-            if valid == 'Path Error':
-                update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, 'skipped', valid)
+
+    # Each validation is also saved to the catalog, if there is one (see hub_catalog.py), CATALOG_BATCH_ROWS at a time.
+    # Any validations not saved yet are saved at the end, even if the script stops because of an error.
+    catalog_rows = []
+    try:
+        for acc in log_df[log_df['Result'].isnull()].itertuples():
+
+            # Prints the script progress.
+            current_acc += 1
+            print(f'Starting on accession {acc.Path} ({current_acc} of {total_acc})')
+
+            # Calculates the row index in the fixity validation log dataframe for the accession for updating the log.
+            # The collection is tested because accession numbers may be duplicated in different collections,
+            # either from no-acc-num or errors when assigning the numbers.
+            df_row_index = log_df.index[(log_df['Collection'] == acc.Collection) &
+                                        (log_df['Accession'] == acc.Accession)][0]
+
+            # Validates the accession, including updating the preservation log and fixity validation log.
+            # Different validation functions are used depending on if it is in a bag or is zipped.
+            if acc.Fixity_Type == 'Bag':
+                valid = validate_bag(acc.Path, input_directory, f'{acc.Accession}_bag')
+                # Path Error happens on the server (faster) and means that accession needs to be re-run
+                # over the network, so no permanent record of the error in the preservation log is needed.
+                if valid == 'Path Error':
+                    update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, 'skipped', valid)
+                else:
+                    log_status = update_preservation_log(acc.Path, valid, acc.Fixity_Type)
+                    update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, log_status, valid)
+            elif acc.Fixity_Type == 'Zipped_Bag':
+                valid = validate_bag(acc.Path, input_directory, f'{acc.Accession}_zipped_bag')
+                # Path Error happens on the server (faster) and means that accession needs to be re-run
+                # over the network, so no permanent record of the error in the preservation log is needed.
+                if valid == 'Path Error':
+                    update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, 'skipped', valid)
+                else:
+                    log_status = update_preservation_log(acc.Path, valid, acc.Fixity_Type)
+                    update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, log_status, valid)
             else:
+                valid = validate_zip(acc.Path)
                 log_status = update_preservation_log(acc.Path, valid, acc.Fixity_Type)
                 update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, log_status, valid)
-        else:
-            valid = validate_zip(acc.Path)
-            log_status = update_preservation_log(acc.Path, valid, acc.Fixity_Type)
-            update_fixity_validation_log(fixity_validation_log_path, log_df, df_row_index, log_status, valid)
+
+            # Adds the validation to the rows for the catalog, unless it needs to be run again because of a path error.
+            if valid != 'Path Error':
+                catalog_rows.append((acc.Path, catalog_time(), acc.Fixity_Type, valid.startswith('Valid'), valid))
+            if len(catalog_rows) >= CATALOG_BATCH_ROWS:
+                save_catalog_rows('fixity_event', catalog_rows)
+                catalog_rows = []
+    finally:
+        save_catalog_rows('fixity_event', catalog_rows)